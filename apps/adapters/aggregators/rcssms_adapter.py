@@ -88,6 +88,7 @@ class RcsSmsAdapter(AggregatorPort):
         send_url: str = "https://web.rcssms.in/rcsapi/jsonapi.jsp?apitype=1",
         token_url: str = "https://web.rcssms.in/api/rcs/accesstoken",
         template_url: str = "https://web.rcssms.in/rcsapi/rcscreatetemplate.jsp",
+        max_connections: int = 100,
     ):
         """
         Initialize rcssms.in adapter
@@ -102,6 +103,7 @@ class RcsSmsAdapter(AggregatorPort):
             send_url:      RCS message sending endpoint URL
             token_url:     Bearer token endpoint URL
             template_url:  Template creation endpoint URL
+            max_connections: Connection pool size (keep-alive connections reused)
         """
         self.username = username
         self.password = password
@@ -117,7 +119,16 @@ class RcsSmsAdapter(AggregatorPort):
         self._bearer_token: Optional[str] = None
         self._token_expires_at: Optional[datetime] = None
 
-        self.client = httpx.AsyncClient(timeout=timeout)
+        # One pooled client per adapter: keep-alive connections are reused
+        # across sends, so TLS is negotiated once per connection, not per message.
+        self.client = httpx.AsyncClient(
+            timeout=timeout,
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_connections,
+                keepalive_expiry=60,
+            ),
+        )
 
         # Redis-backed circuit breaker — shared state across all worker processes.
         # Redis URL resolved lazily from settings so tests can override with a mock.
@@ -163,6 +174,8 @@ class RcsSmsAdapter(AggregatorPort):
             async with self._breaker():
                 payload = await self._build_rcs_payload(request)
                 headers = await self._get_headers()
+                if request.idempotency_key:
+                    headers["Idempotency-Key"] = request.idempotency_key
 
                 logger.info(
                     "sending_rcs_message",
@@ -107,6 +107,7 @@ class SmsIdeaAdapter(AggregatorPort):
         timeout: int = 30,
         send_url: str = "https://smsidea.co.in/smsstatuswithid.aspx",
         balance_url: str = "https://smsidea.co.in/sms/api/getbalance.aspx",
+        max_connections: int = 20,
     ) -> None:
         """
         Initialise the smsidea.co.in adapter.
@@ -120,6 +121,7 @@ class SmsIdeaAdapter(AggregatorPort):
             timeout:     HTTP request timeout in seconds
             send_url:    SMS sending endpoint URL
             balance_url: Balance check endpoint URL
+            max_connections: Connection pool size (keep-alive connections reused)
         """
         self.username = username
         self.password = password
@@ -128,7 +130,17 @@ class SmsIdeaAdapter(AggregatorPort):
         self.send_url = send_url
         self.balance_url = balance_url
         self.timeout = timeout
-        self.client = httpx.AsyncClient(timeout=timeout)
+        # One pooled client per adapter, shared by all concurrent sends:
+        # keep-alive connections are reused, so TLS is negotiated once per
+        # connection rather than per message.
+        self.client = httpx.AsyncClient(
+            timeout=timeout,
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_connections,
+                keepalive_expiry=60,
+            ),
+        )
 
     # ------------------------------------------------------------------
     # AggregatorPort — only send_sms_message is implemented here
@@ -189,7 +201,13 @@ class SmsIdeaAdapter(AggregatorPort):
         )
 
         try:
-            response = await self.client.get(self.send_url, params=params)
+            headers = (
+                {"Idempotency-Key": request.idempotency_key}
+                if request.idempotency_key else None
+            )
+            response = await self.client.get(
+                self.send_url, params=params, headers=headers
+            )
             response.raise_for_status()
             return self._parse_response(response.text, str(request.message_id))
 
@@ -0,0 +1,150 @@
+"""
+Job Idempotency Guard (Redis SET NX)
+
+RabbitMQ delivers at-least-once: a crash, ack timeout or broker requeue
+hands the same job to a worker again. For jobs whose side effects are
+external (an SMS send, a campaign's worth of message rows) the worker
+claims the job's idempotency key first:
+
+    SET {prefix}:{key} "pending" NX EX lease  -> claimed, do the work
+                                              -> taken, ack and return
+
+  complete(key, value)  records the outcome (e.g. the external_id) under
+                        the same key, now with the full ttl, so the
+                        deduplicated path can log it
+  renew(key)            pushes a still-pending claim's lease out again
+                        (long jobs call it as they make progress)
+  release(key)          deletes a claim that is still "pending" (the work
+                        failed in a way the broker retry should repeat);
+                        a recorded outcome is kept
+
+A "pending" claim only lives for the short lease: if the worker dies
+between claim and complete/release, which is exactly when the broker
+redelivers, the redelivered job can claim the key again once the lease
+lapses instead of being acked as a duplicate for the whole ttl.
+
+Like the other Redis helpers this is an accelerator, not a lock service:
+if Redis is unreachable claim() fails open (returns True) and the job's
+own status checks in Postgres remain the correctness backstop.
+"""
+
+import asyncio
+import logging
+from typing import Optional
+
+import redis.asyncio as aioredis
+
+
+logger = logging.getLogger(__name__)
+
+
+class IdempotencyGuard:
+    """
+    Redis-backed claim/complete markers for queue jobs.
+
+    Args:
+        redis_url:    Redis connection URL
+        prefix:         Key namespace, e.g. "fallback:idem"
+        ttl_seconds:    How long a completed key suppresses redeliveries
+        lease_seconds:  How long a pending claim lives without renew()
+    """
+
+    PENDING = "pending"
+
+    def __init__(
+        self,
+        redis_url: str,
+        prefix: str,
+        ttl_seconds: int = 24 * 3600,
+        lease_seconds: int = 300,
+    ):
+        self._redis_url = redis_url
+        self.prefix = prefix
+        self.ttl_seconds = ttl_seconds
+        self.lease_seconds = lease_seconds
+        self._redis: Optional[aioredis.Redis] = None
+        self._lock = asyncio.Lock()
+
+    def _key(self, key: str) -> str:
+        return f"{self.prefix}:{key}"
+
+    async def _redis_conn(self) -> aioredis.Redis:
+        """Return (or lazily create) the Redis connection."""
+        if self._redis is None:
+            async with self._lock:
+                if self._redis is None:
+                    self._redis = await aioredis.from_url(
+                        self._redis_url,
+                        decode_responses=True,
+                        socket_connect_timeout=2,
+                        socket_timeout=2,
+                    )
+        return self._redis
+
+    async def close(self) -> None:
+        """Close the Redis connection."""
+        if self._redis:
+            await self._redis.aclose()
+            self._redis = None
+
+    async def claim(self, key: str) -> bool:
+        """
+        Claim a job key (SET NX EX, for the lease only).
+
+        Returns:
+            True if this worker should run the job (also when Redis is
+            unavailable), False if the key was already claimed.
+        """
+        try:
+            r = await self._redis_conn()
+            return bool(
+                await r.set(self._key(key), self.PENDING, nx=True, ex=self.lease_seconds)
+            )
+        except Exception as e:
+            logger.warning(f"Idempotency claim failed for {key}, proceeding: {e}")
+            return True
+
+    async def get(self, key: str) -> Optional[str]:
+        """Value stored for a key ("pending" or the recorded outcome)."""
+        try:
+            r = await self._redis_conn()
+            return await r.get(self._key(key))
+        except Exception as e:
+            logger.warning(f"Idempotency read failed for {key}: {e}")
+            return None
+
+    async def renew(self, key: str) -> None:
+        """
+        Extend a pending claim by another lease.
+
+        Not atomic with the check, which is fine: only the claiming job
+        renews, and a recorded outcome is never shortened.
+        """
+        try:
+            r = await self._redis_conn()
+            if await r.get(self._key(key)) == self.PENDING:
+                await r.expire(self._key(key), self.lease_seconds)
+        except Exception as e:
+            logger.warning(f"Idempotency renew failed for {key}: {e}")
+
+    async def complete(self, key: str, value: str) -> None:
+        """Record the job's outcome for the full ttl."""
+        try:
+            r = await self._redis_conn()
+            await r.set(self._key(key), value, xx=True, ex=self.ttl_seconds)
+        except Exception as e:
+            logger.warning(f"Idempotency complete failed for {key}: {e}")
+
+    async def release(self, key: str) -> None:
+        """
+        Drop a pending claim so a redelivery of the job can run again.
+
+        Keys with a recorded outcome are left alone. The check-then-delete
+        is not atomic, which is fine: only the claiming job releases.
+        """
+        try:
+            r = await self._redis_conn()
+            if await r.get(self._key(key)) == self.PENDING:
+                await r.delete(self._key(key))
+        except Exception as e:
+            logger.warning(f"Idempotency release failed for {key}: {e}")
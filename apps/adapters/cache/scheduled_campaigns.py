@@ -0,0 +1,177 @@
+"""
+Scheduled Campaign Index (Redis sorted set)
+
+Mirrors SCHEDULED campaigns into a Redis ZSET so the scheduler's periodic
+poll is an in-memory range read instead of a Postgres range scan:
+
+  Key:    "campaigns:scheduled"
+  Member: campaign_id (str)
+  Score:  scheduled_for as a Unix timestamp (naive datetimes are UTC)
+
+    ZADD           on schedule_campaign
+    ZREM           on activate / cancel / complete
+    ZRANGEBYSCORE  0..now from the scheduler tick — O(log N + k)
+
+Postgres remains the source of truth. The index is a lossy accelerator:
+every Redis error is swallowed (logged) and the scheduler falls back to
+get_scheduled_campaigns(); rebuild() repopulates it from the DB on
+scheduler startup, and the scheduler re-adds every SCHEDULED campaign
+periodically (add_many) so a missed ZADD delays activation by at most
+one sync interval.
+"""
+
+import asyncio
+import logging
+from datetime import datetime, timezone
+from typing import Iterable, List, Optional
+from uuid import UUID
+
+import redis.asyncio as aioredis
+
+from apps.core.config import get_settings
+from apps.core.domain.campaign import Campaign
+
+
+logger = logging.getLogger(__name__)
+
+
+def _score(when: datetime) -> float:
+    """Unix timestamp of `when`, reading naive datetimes as UTC."""
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return when.timestamp()
+
+
+class ScheduledCampaignIndex:
+    """
+    Redis sorted-set index of scheduled campaigns, keyed by due time.
+
+    Args:
+        redis_url: Redis connection URL
+        key:       Sorted-set key
+    """
+
+    KEY = "campaigns:scheduled"
+
+    def __init__(self, redis_url: str, key: str = KEY):
+        self._redis_url = redis_url
+        self.key = key
+        self._redis: Optional[aioredis.Redis] = None
+        self._lock = asyncio.Lock()
+
+    async def _redis_conn(self) -> aioredis.Redis:
+        """Return (or lazily create) the Redis connection."""
+        if self._redis is None:
+            async with self._lock:
+                if self._redis is None:
+                    self._redis = await aioredis.from_url(
+                        self._redis_url,
+                        decode_responses=True,
+                        socket_connect_timeout=2,
+                        socket_timeout=2,
+                    )
+        return self._redis
+
+    async def close(self) -> None:
+        """Close the Redis connection."""
+        if self._redis:
+            await self._redis.aclose()
+            self._redis = None
+
+    async def add(self, campaign_id: UUID, scheduled_for: datetime) -> None:
+        """Index a campaign under its due time (ZADD)."""
+        try:
+            r = await self._redis_conn()
+            await r.zadd(self.key, {str(campaign_id): _score(scheduled_for)})
+        except Exception as e:
+            logger.warning(f"Scheduled index add failed for {campaign_id}: {e}")
+
+    async def remove(self, campaign_id: UUID) -> None:
+        """Drop a campaign from the index (ZREM)."""
+        try:
+            r = await self._redis_conn()
+            await r.zrem(self.key, str(campaign_id))
+        except Exception as e:
+            logger.warning(f"Scheduled index remove failed for {campaign_id}: {e}")
+
+    async def due(self, now: datetime, limit: int = 100) -> Optional[List[UUID]]:
+        """
+        Campaign IDs due at or before `now`, earliest first.
+
+        Returns:
+            List of campaign IDs, or None if Redis is unavailable
+            (caller should fall back to the database query).
+        """
+        try:
+            r = await self._redis_conn()
+            members = await r.zrangebyscore(
+                self.key, 0, _score(now), start=0, num=limit
+            )
+        except Exception as e:
+            logger.warning(f"Scheduled index read failed: {e}")
+            return None
+        return [UUID(m) for m in members]
+
+    async def add_many(self, campaigns: Iterable[Campaign]) -> int:
+        """
+        Index (or re-index) scheduled campaigns in one ZADD, leaving other
+        members alone — safe to run alongside concurrent add()/remove().
+
+        Returns:
+            Number of campaigns indexed (0 if Redis is unavailable)
+        """
+        mapping = {
+            str(c.id): _score(c.scheduled_for)
+            for c in campaigns
+            if c.scheduled_for
+        }
+        if not mapping:
+            return 0
+        try:
+            r = await self._redis_conn()
+            await r.zadd(self.key, mapping)
+        except Exception as e:
+            logger.warning(f"Scheduled index sync failed: {e}")
+            return 0
+        return len(mapping)
+
+    async def rebuild(self, campaigns: Iterable[Campaign]) -> int:
+        """
+        Replace the index contents with the given scheduled campaigns.
+
+        Returns:
+            Number of campaigns indexed (0 if Redis is unavailable)
+        """
+        mapping = {
+            str(c.id): _score(c.scheduled_for)
+            for c in campaigns
+            if c.scheduled_for
+        }
+        try:
+            r = await self._redis_conn()
+            async with r.pipeline(transaction=True) as pipe:
+                pipe.delete(self.key)
+                if mapping:
+                    pipe.zadd(self.key, mapping)
+                await pipe.execute()
+        except Exception as e:
+            logger.warning(f"Scheduled index rebuild failed: {e}")
+            return 0
+        return len(mapping)
+
+
+# Global index instance
+_index_instance: Optional[ScheduledCampaignIndex] = None
+
+
+def get_scheduled_index() -> ScheduledCampaignIndex:
+    """
+    Get global scheduled campaign index
+
+    Returns:
+        ScheduledCampaignIndex instance
+    """
+    global _index_instance
+    if _index_instance is None:
+        _index_instance = ScheduledCampaignIndex(get_settings().redis.url)
+    return _index_instance
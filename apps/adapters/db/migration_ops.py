@@ -0,0 +1,158 @@
+"""
+Online Index DDL for Alembic Migrations
+
+A plain CREATE INDEX holds a SHARE lock on the table for the whole build:
+reads continue, but every INSERT/UPDATE/DELETE on a populated table (the
+dispatcher, webhooks, the orchestrator) waits until it finishes. CREATE
+INDEX CONCURRENTLY builds without blocking writes, at the cost of two
+table scans, with two restrictions handled here:
+
+  - it cannot run inside a transaction block, so each statement runs in
+    Alembic's autocommit_block()
+  - it is not supported on a partitioned table (messages), so the parent
+    index is created ON ONLY the parent (metadata only, starts invalid),
+    each partition is indexed concurrently, and the partition indexes are
+    attached — the parent index becomes valid once all are attached.
+    Partition index names embed the full partition name (hashed down to
+    PostgreSQL's 63-character limit), so events_2025_03 and
+    events_2026_03 never share one
+
+Usage (in a migration for an existing, populated table):
+    from apps.adapters.db.migration_ops import (
+        create_index_concurrently, drop_index_concurrently,
+    )
+
+    def upgrade():
+        create_index_concurrently("ix_x", "messages", "tenant_id, created_at")
+
+A failed concurrent build leaves an INVALID index behind; drop it before
+re-running the migration (IF NOT EXISTS would otherwise skip it).
+
+Tables created in the same migration need none of this: an empty,
+not-yet-visible table has no writers to block.
+"""
+
+import hashlib
+from typing import List, Optional
+
+import sqlalchemy as sa
+from alembic import op
+
+
+def _partitions(table: str) -> List[str]:
+    """Names of the partitions of `table` (empty if it is not partitioned)."""
+    rows = op.get_bind().execute(
+        sa.text(
+            """
+            SELECT child.relname
+            FROM pg_inherits
+            JOIN pg_class child  ON child.oid  = pg_inherits.inhrelid
+            JOIN pg_class parent ON parent.oid = pg_inherits.inhparent
+            WHERE parent.relname = :table
+            ORDER BY child.relname
+            """
+        ),
+        {"table": table},
+    )
+    return [row[0] for row in rows]
+
+
+# PostgreSQL truncates identifiers longer than this (NAMEDATALEN - 1)
+_MAX_IDENTIFIER = 63
+
+
+def _partition_index_name(name: str, partition: str) -> str:
+    """
+    Name of `name`'s index on one partition: "<name>_<partition>", or,
+    if that exceeds 63 characters, a prefix of it plus a hash of the
+    whole, so distinct partitions never map to the same name.
+    """
+    child = f"{name}_{partition}"
+    if len(child) <= _MAX_IDENTIFIER:
+        return child
+    digest = hashlib.sha1(child.encode()).hexdigest()[:8]
+    return f"{child[:_MAX_IDENTIFIER - 9]}_{digest}"
+
+
+def _index_table(index: str) -> Optional[str]:
+    """Table an existing index is on (None if there is no such index)."""
+    return op.get_bind().execute(
+        sa.text(
+            """
+            SELECT tbl.relname
+            FROM pg_index
+            JOIN pg_class idx ON idx.oid = pg_index.indexrelid
+            JOIN pg_class tbl ON tbl.oid = pg_index.indrelid
+            WHERE idx.relname = :index
+            """
+        ),
+        {"index": index},
+    ).scalar()
+
+
+def create_index_concurrently(
+    name: str,
+    table: str,
+    columns: str,
+    using: Optional[str] = None,
+    where: Optional[str] = None,
+    with_: Optional[str] = None,
+) -> None:
+    """
+    Build an index without blocking writes.
+
+    Args:
+        name:     Index name
+        table:    Table (partitioned tables are handled per partition)
+        columns:  Column list / expressions, e.g. "tenant_id, created_at"
+        using:    Index method, e.g. "brin" or "gin"
+        where:    Partial-index predicate
+        with_:    Storage parameters, e.g. "fillfactor = 90"
+    """
+    method = f" USING {using}" if using else ""
+    storage = f" WITH ({with_})" if with_ else ""
+    predicate = f" WHERE {where}" if where else ""
+    partitions = _partitions(table)
+
+    with op.get_context().autocommit_block():
+        if not partitions:
+            op.execute(
+                f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {name} "
+                f"ON {table}{method} ({columns}){storage}{predicate}"
+            )
+            return
+
+        op.execute(
+            f"CREATE INDEX IF NOT EXISTS {name} "
+            f"ON ONLY {table}{method} ({columns}){storage}{predicate}"
+        )
+        for partition in partitions:
+            child = _partition_index_name(name, partition)
+            # IF NOT EXISTS would silently skip a same-named index on
+            # another table and ATTACH would then leave this partition
+            # unindexed; only a re-run on the same partition may skip
+            existing = _index_table(child)
+            if existing is not None and existing != partition:
+                raise RuntimeError(
+                    f"Index {child} for partition {partition} already "
+                    f"exists on {existing}"
+                )
+            op.execute(
+                f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {child} "
+                f"ON {partition}{method} ({columns}){storage}{predicate}"
+            )
+            op.execute(f"ALTER INDEX {name} ATTACH PARTITION {child}")
+
+
+def drop_index_concurrently(name: str, table: str) -> None:
+    """
+    Drop an index without blocking writes.
+
+    A partitioned index cannot be dropped concurrently; dropping the parent
+    index removes the partition indexes with it (a short lock per partition).
+    """
+    with op.get_context().autocommit_block():
+        if _partitions(table):
+            op.execute(f"DROP INDEX IF EXISTS {name}")
+        else:
+            op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {name}")
@@ -11,7 +11,7 @@ Key change vs original:
 """
 
 from typing import Optional, List
-from uuid import UUID, uuid4
+from uuid import UUID
 from datetime import datetime
 
 from sqlalchemy import (
@@ -20,17 +20,17 @@ from sqlalchemy import (
     Boolean,
     DateTime,
     Text,
-    JSON,
     ForeignKey,
     Index,
     UniqueConstraint,
-    Enum as SQLEnum,
+    text,
 )
-from sqlalchemy.dialects.postgresql import UUID as PGUUID, JSONB
+from sqlalchemy.dialects.postgresql import ENUM, UUID as PGUUID, JSONB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from apps.adapters.db.postgres import Base
 from apps.core.domain.campaign import CampaignStatus, CampaignType, Priority
+from apps.core.domain.ids import uuid7
 from apps.core.domain.message import MessageStatus, MessageChannel
 from apps.core.domain.opt_in import ConsentStatus
 
@@ -40,26 +40,27 @@ class CampaignModel(Base):
 
     __tablename__ = "campaigns"
 
-    id: Mapped[UUID] = mapped_column(PGUUID(as_uuid=True), primary_key=True, default=uuid4)
-    tenant_id: Mapped[UUID] = mapped_column(PGUUID(as_uuid=True), nullable=False, index=True)
+    id: Mapped[UUID] = mapped_column(PGUUID(as_uuid=True), primary_key=True, default=uuid7)
+    tenant_id: Mapped[UUID] = mapped_column(PGUUID(as_uuid=True), nullable=False)
     template_id: Mapped[UUID] = mapped_column(PGUUID(as_uuid=True), nullable=False)
 
     name: Mapped[str] = mapped_column(String(255), nullable=False)
     status: Mapped[str] = mapped_column(
-        SQLEnum(CampaignStatus, native_enum=False),
+        ENUM(CampaignStatus, name="campaign_status", create_type=False),
         nullable=False,
         default=CampaignStatus.DRAFT,
-        index=True,
     )
     campaign_type: Mapped[str] = mapped_column(
-        SQLEnum(CampaignType, native_enum=False), nullable=False
+        ENUM(CampaignType, name="campaign_type", create_type=False), nullable=False
     )
     priority: Mapped[str] = mapped_column(
-        SQLEnum(Priority, native_enum=False), nullable=False, default=Priority.MEDIUM
+        ENUM(Priority, name="priority_level", create_type=False),
+        nullable=False,
+        default=Priority.MEDIUM,
     )
 
     scheduled_for: Mapped[Optional[datetime]] = mapped_column(
-        DateTime(timezone=True), nullable=True, index=True
+        DateTime(timezone=True), nullable=True
     )
 
     enable_fallback: Mapped[bool] = mapped_column(Boolean, default=True)
@@ -75,8 +76,8 @@ class CampaignModel(Base):
     opt_outs: Mapped[int] = mapped_column(Integer, default=0)
 
     # metadata_ stores audience_ids, description, tags, etc.
-    metadata_: Mapped[dict] = mapped_column(JSON, nullable=False, default=dict)
-    tags: Mapped[list] = mapped_column(JSON, nullable=False, default=list)
+    metadata_: Mapped[dict] = mapped_column(JSONB, nullable=False, default=dict)
+    tags: Mapped[list] = mapped_column(JSONB, nullable=False, default=list)
 
     messages: Mapped[List["MessageModel"]] = relationship(
         back_populates="campaign",
@@ -85,25 +86,46 @@ class CampaignModel(Base):
 
     __table_args__ = (
         Index("ix_campaigns_tenant_status", "tenant_id", "status"),
-        Index("ix_campaigns_scheduled", "scheduled_for"),
+        Index("ix_campaigns_tenant_created", "tenant_id", text("created_at DESC")),
+        Index(
+            "ix_campaigns_tags_gin", "tags",
+            postgresql_using="gin", postgresql_ops={"tags": "jsonb_path_ops"},
+        ),
+        Index(
+            "ix_campaigns_scheduled_due", "scheduled_for",
+            postgresql_where=text("status = 'SCHEDULED'"),
+        ),
+        Index(
+            "ix_campaigns_active", "tenant_id",
+            postgresql_where=text("status = 'ACTIVE'"),
+        ),
     )
 
 
 class MessageModel(Base):
-    """Message table (high volume — consider partitioning by created_at)"""
+    """
+    Message table (high volume).
+
+    Hash-partitioned by campaign_id into 32 partitions (migration 008), so
+    the primary key is (id, campaign_id) and parent_message_id carries no FK
+    — PostgreSQL can't reference a partitioned table without the partition key.
+    Partitions use fillfactor 80 (migration 018) to leave room for HOT updates.
+    """
 
     __tablename__ = "messages"
 
-    id: Mapped[UUID] = mapped_column(PGUUID(as_uuid=True), primary_key=True, default=uuid4)
+    id: Mapped[UUID] = mapped_column(PGUUID(as_uuid=True), primary_key=True, default=uuid7)
     campaign_id: Mapped[UUID] = mapped_column(
-        PGUUID(as_uuid=True), ForeignKey("campaigns.id"), nullable=False, index=True
+        PGUUID(as_uuid=True),
+        ForeignKey("campaigns.id"),
+        primary_key=True,
+        nullable=False,
     )
-    tenant_id: Mapped[UUID] = mapped_column(PGUUID(as_uuid=True), nullable=False, index=True)
+    tenant_id: Mapped[UUID] = mapped_column(PGUUID(as_uuid=True), nullable=False)
     
-    # Parent-child linkage for fallback tracking
+    # Parent-child linkage for fallback tracking (application-maintained, see above)
     parent_message_id: Mapped[Optional[UUID]] = mapped_column(
         PGUUID(as_uuid=True),
-        ForeignKey("messages.id", ondelete="SET NULL"),
         nullable=True,
         index=True
     )
@@ -111,20 +133,19 @@ class MessageModel(Base):
     recipient_phone: Mapped[str] = mapped_column(String(20), nullable=False)
 
     status: Mapped[str] = mapped_column(
-        SQLEnum(MessageStatus, native_enum=False),
+        ENUM(MessageStatus, name="message_status", create_type=False),
         nullable=False,
         default=MessageStatus.PENDING,
-        index=True,
     )
     channel: Mapped[str] = mapped_column(
-        SQLEnum(MessageChannel, native_enum=False),
+        ENUM(MessageChannel, name="message_channel", create_type=False),
         nullable=False,
         default=MessageChannel.RCS,
     )
     priority: Mapped[str] = mapped_column(String(20), default="medium")
 
-    # Content stored as JSON — includes text, template_id, variables, rich_card, suggestions
-    content: Mapped[dict] = mapped_column(JSON, nullable=False)
+    # Content stored as JSONB — includes text, template_id, variables, rich_card, suggestions
+    content: Mapped[dict] = mapped_column(JSONB, nullable=False)
 
     queued_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), nullable=True)
     sent_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), nullable=True)
@@ -138,25 +159,37 @@ class MessageModel(Base):
     fallback_enabled: Mapped[bool] = mapped_column(Boolean, default=True)
     fallback_triggered: Mapped[bool] = mapped_column(Boolean, default=False)
 
+    # Cached RCS capability of the recipient (skips the check on retries)
+    rcs_capable: Mapped[Optional[bool]] = mapped_column(Boolean, nullable=True)
+    rcs_checked_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), nullable=True)
+
     aggregator: Mapped[Optional[str]] = mapped_column(String(50), nullable=True)
     external_id: Mapped[Optional[str]] = mapped_column(String(255), nullable=True, index=True)
     failure_reason: Mapped[Optional[str]] = mapped_column(String(50), nullable=True)
 
-    metadata_: Mapped[dict] = mapped_column(JSON, nullable=False, default=dict)
+    metadata_: Mapped[dict] = mapped_column(JSONB, nullable=False, default=dict)
 
     campaign: Mapped["CampaignModel"] = relationship(back_populates="messages")
     
     # Relationship for parent-child message linkage
     parent_message: Mapped[Optional["MessageModel"]] = relationship(
         "MessageModel",
-        remote_side=[id],
-        foreign_keys=[parent_message_id],
-        backref="child_messages"
+        primaryjoin="foreign(MessageModel.parent_message_id) == remote(MessageModel.id)",
+        backref="child_messages",
+        viewonly=True,
     )
 
     __table_args__ = (
-        Index("ix_messages_status_created", "status", "created_at"),
+        Index(
+            "ix_messages_failed", "campaign_id", text("failed_at DESC"),
+            postgresql_where=text("status = 'FAILED'"),
+        ),
         Index("ix_messages_tenant_status", "tenant_id", "status"),
+        Index(
+            "ix_messages_campaign_status_parent",
+            "campaign_id", "status", "parent_message_id",
+        ),
+        {"postgresql_partition_by": "HASH (campaign_id)"},
     )
 
 
@@ -173,8 +206,8 @@ class TemplateModel(Base):
 
     __tablename__ = "templates"
 
-    id: Mapped[UUID] = mapped_column(PGUUID(as_uuid=True), primary_key=True, default=uuid4)
-    tenant_id: Mapped[UUID] = mapped_column(PGUUID(as_uuid=True), nullable=False, index=True)
+    id: Mapped[UUID] = mapped_column(PGUUID(as_uuid=True), primary_key=True, default=uuid7)
+    tenant_id: Mapped[UUID] = mapped_column(PGUUID(as_uuid=True), nullable=False)
 
     name: Mapped[str] = mapped_column(String(255), nullable=False)
     status: Mapped[str] = mapped_column(String(50), nullable=False, default="draft")
@@ -183,19 +216,19 @@ class TemplateModel(Base):
     # rcssms.in external template ID — populated after operator approval
     # e.g. "7U5QvSVi5e" returned by /rcscreatetemplate.jsp
     external_template_id: Mapped[Optional[str]] = mapped_column(
-        String(100), nullable=True, index=True
+        String(100), nullable=True
     )
 
     # Template type for rcssms.in: BASIC, RICH, RICHCASOUREL
     rcs_type: Mapped[str] = mapped_column(String(20), nullable=False, default="BASIC")
 
-    variables: Mapped[list] = mapped_column(JSON, nullable=False, default=list)
-    rich_card_template: Mapped[Optional[dict]] = mapped_column(JSON, nullable=True)
-    suggestions_template: Mapped[list] = mapped_column(JSON, nullable=False, default=list)
+    variables: Mapped[list] = mapped_column(JSONB, nullable=False, default=list)
+    rich_card_template: Mapped[Optional[dict]] = mapped_column(JSONB, nullable=True)
+    suggestions_template: Mapped[list] = mapped_column(JSONB, nullable=False, default=list)
 
     description: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
     category: Mapped[Optional[str]] = mapped_column(String(100), nullable=True)
-    tags: Mapped[list] = mapped_column(JSON, nullable=False, default=list)
+    tags: Mapped[list] = mapped_column(JSONB, nullable=False, default=list)
     language: Mapped[str] = mapped_column(String(10), default="en")
 
     usage_count: Mapped[int] = mapped_column(Integer, default=0)
@@ -210,6 +243,7 @@ class TemplateModel(Base):
 
     __table_args__ = (
         Index("ix_templates_tenant_status", "tenant_id", "status"),
+        Index("ix_templates_tenant_created", "tenant_id", text("created_at DESC")),
         Index("ix_templates_external_id", "external_template_id"),
     )
 
@@ -219,22 +253,22 @@ class OptInModel(Base):
 
     __tablename__ = "opt_ins"
 
-    id: Mapped[UUID] = mapped_column(PGUUID(as_uuid=True), primary_key=True, default=uuid4)
-    tenant_id: Mapped[UUID] = mapped_column(PGUUID(as_uuid=True), nullable=False, index=True)
+    id: Mapped[UUID] = mapped_column(PGUUID(as_uuid=True), primary_key=True, default=uuid7)
+    tenant_id: Mapped[UUID] = mapped_column(PGUUID(as_uuid=True), nullable=False)
     phone_number: Mapped[str] = mapped_column(String(20), nullable=False)
 
     promotional_status: Mapped[str] = mapped_column(
-        SQLEnum(ConsentStatus, native_enum=False),
+        ENUM(ConsentStatus, name="consent_status", create_type=False),
         nullable=False,
         default=ConsentStatus.OPTED_OUT,
     )
     transactional_status: Mapped[str] = mapped_column(
-        SQLEnum(ConsentStatus, native_enum=False),
+        ENUM(ConsentStatus, name="consent_status", create_type=False),
         nullable=False,
         default=ConsentStatus.OPTED_IN,
     )
     informational_status: Mapped[str] = mapped_column(
-        SQLEnum(ConsentStatus, native_enum=False),
+        ENUM(ConsentStatus, name="consent_status", create_type=False),
         nullable=False,
         default=ConsentStatus.OPTED_OUT,
     )
@@ -251,9 +285,9 @@ class OptInModel(Base):
         DateTime(timezone=True), nullable=True
     )
 
-    consent_history: Mapped[list] = mapped_column(JSON, nullable=False, default=list)
-    preferences: Mapped[dict] = mapped_column(JSON, nullable=False, default=dict)
-    metadata_: Mapped[dict] = mapped_column(JSON, nullable=False, default=dict)
+    consent_history: Mapped[list] = mapped_column(JSONB, nullable=False, default=list)
+    preferences: Mapped[dict] = mapped_column(JSONB, nullable=False, default=dict)
+    metadata_: Mapped[dict] = mapped_column(JSONB, nullable=False, default=dict)
 
     __table_args__ = (
         Index("ix_opt_ins_tenant_phone", "tenant_id", "phone_number", unique=True),
@@ -261,23 +295,32 @@ class OptInModel(Base):
 
 
 class EventModel(Base):
-    """Event store table (for event sourcing)"""
+    """
+    Event store table (for event sourcing).
+
+    Range-partitioned by created_at, one partition per month (migration
+    013); the database primary key is (id, created_at).
+    """
 
     __tablename__ = "events"
 
-    id: Mapped[UUID] = mapped_column(PGUUID(as_uuid=True), primary_key=True, default=uuid4)
+    id: Mapped[UUID] = mapped_column(PGUUID(as_uuid=True), primary_key=True, default=uuid7)
 
-    event_type: Mapped[str] = mapped_column(String(100), nullable=False, index=True)
-    aggregate_id: Mapped[UUID] = mapped_column(PGUUID(as_uuid=True), nullable=False, index=True)
+    event_type: Mapped[str] = mapped_column(String(100), nullable=False)
+    aggregate_id: Mapped[UUID] = mapped_column(PGUUID(as_uuid=True), nullable=False)
     aggregate_type: Mapped[str] = mapped_column(String(50), nullable=False)
     version: Mapped[int] = mapped_column(Integer, nullable=False, default=1)
 
-    data: Mapped[dict] = mapped_column(JSON, nullable=False)
-    metadata_: Mapped[dict] = mapped_column(JSON, nullable=False, default=dict)
+    data: Mapped[dict] = mapped_column(JSONB, nullable=False)
+    metadata_: Mapped[dict] = mapped_column(JSONB, nullable=False, default=dict)
 
     __table_args__ = (
         Index("ix_events_aggregate", "aggregate_id", "version"),
         Index("ix_events_type_created", "event_type", "created_at"),
+        Index(
+            "ix_events_created_brin", "created_at",
+            postgresql_using="brin", postgresql_with={"pages_per_range": 32},
+        ),
     )
 
 
@@ -302,7 +345,7 @@ class AudienceContactModel(Base):
     id: Mapped[UUID] = mapped_column(
         PGUUID(as_uuid=True),
         primary_key=True,
-        default=uuid4,
+        default=uuid7,
     )
     audience_id: Mapped[UUID] = mapped_column(
         PGUUID(as_uuid=True),
@@ -329,7 +372,6 @@ class AudienceContactModel(Base):
 
     __table_args__ = (
         # Primary access pattern: all contacts for a given audience, keyset-paginated by id
-        Index("ix_audience_contacts_audience_id", "audience_id"),
         Index("ix_audience_contacts_audience_id_id", "audience_id", "id"),
         # Deduplication: one row per (audience, phone)
         UniqueConstraint("audience_id", "phone_number", name="uq_audience_contact"),
@@ -347,16 +389,16 @@ class AudienceModel(Base):
 
     __tablename__ = "audiences"
 
-    id: Mapped[UUID] = mapped_column(PGUUID(as_uuid=True), primary_key=True, default=uuid4)
-    tenant_id: Mapped[UUID] = mapped_column(PGUUID(as_uuid=True), nullable=False, index=True)
+    id: Mapped[UUID] = mapped_column(PGUUID(as_uuid=True), primary_key=True, default=uuid7)
+    tenant_id: Mapped[UUID] = mapped_column(PGUUID(as_uuid=True), nullable=False)
 
     name: Mapped[str] = mapped_column(String(200), nullable=False)
     audience_type: Mapped[str] = mapped_column(String(50), nullable=False, default="static")
     status: Mapped[str] = mapped_column(String(50), nullable=False, default="draft")
     description: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
 
-    tags: Mapped[Optional[list]] = mapped_column(JSON, nullable=True)
-    query: Mapped[Optional[dict]] = mapped_column(JSON, nullable=True)
+    tags: Mapped[Optional[list]] = mapped_column(JSONB, nullable=True)
+    query: Mapped[Optional[dict]] = mapped_column(JSONB, nullable=True)
 
     # contacts column REMOVED — data lives in audience_contacts table
 
@@ -383,4 +425,5 @@ class AudienceModel(Base):
     __table_args__ = (
         Index("idx_audiences_tenant_status", "tenant_id", "status"),
         Index("idx_audiences_tenant_type", "tenant_id", "audience_type"),
+        Index("ix_audiences_tenant_created", "tenant_id", text("created_at DESC")),
     )
@@ -16,7 +16,7 @@ Key API change:
 Features:
     - CRUD operations for audiences (metadata only — no contacts in the row)
     - stream_contacts() for memory-safe high-volume dispatch
-    - bulk_add_contacts() for efficient CSV import
+    - bulk_add_contacts() for efficient CSV import (COPY for large uploads)
     - Contact deduplication via database UNIQUE constraint
     - get_phone_numbers() retained for small-audience API use (collects stream)
 """
@@ -25,7 +25,7 @@ from typing import AsyncGenerator, List, Optional
 from uuid import UUID
 import logging
 
-from sqlalchemy import select, func, delete
+from sqlalchemy import select, func, delete, text
 from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -38,6 +38,9 @@ logger = logging.getLogger(__name__)
 # Contacts fetched per keyset page during streaming
 _STREAM_BATCH_SIZE = 1_000
 
+# Above this many contacts, bulk_add_contacts() loads them with COPY
+_COPY_THRESHOLD = 1_000
+
 
 class AudienceRepository:
     """
@@ -116,13 +119,16 @@ class AudienceRepository:
         Bulk-insert contacts into audience_contacts.
 
         Uses PostgreSQL INSERT … ON CONFLICT DO NOTHING so re-uploading
-        an audience or re-running a migration is always safe.
+        an audience or re-running a migration is always safe. Uploads
+        larger than _COPY_THRESHOLD go through _copy_contacts().
 
         Returns:
             Number of rows actually inserted (conflicts excluded).
         """
         if not contacts:
             return 0
+        if len(contacts) > _COPY_THRESHOLD:
+            return await self._copy_contacts(audience_id, contacts)
 
         rows = [
             {
@@ -145,6 +151,68 @@ class AudienceRepository:
         result = await self.session.execute(stmt)
         return result.rowcount
 
+    async def _copy_contacts(
+        self,
+        audience_id: UUID,
+        contacts: List[Contact],
+    ) -> int:
+        """
+        Bulk-load contacts with COPY ... FROM STDIN (asyncpg binary).
+
+        COPY cannot skip duplicates, so rows are copied into a
+        transaction-local staging table and moved with one
+        INSERT … SELECT … ON CONFLICT DO NOTHING. JSON columns go through
+        the column types' bind processors, exactly as the ORM writes
+        them. Runs in the session's current transaction; the caller commits.
+
+        Returns:
+            Number of rows actually inserted (conflicts excluded).
+        """
+        await self.session.execute(text(
+            "CREATE TEMP TABLE IF NOT EXISTS audience_contacts_stage ("
+            " phone_number varchar(20), variables jsonb, metadata_ jsonb"
+            ") ON COMMIT DELETE ROWS"
+        ))
+        await self.session.execute(text("TRUNCATE audience_contacts_stage"))
+
+        conn = await self.session.connection()
+        dialect = conn.dialect
+        columns = AudienceContactModel.__table__.c
+        encode_variables, encode_metadata = (
+            col.type.dialect_impl(dialect).bind_processor(dialect) or (lambda v: v)
+            for col in (columns.variables, columns.metadata_)
+        )
+
+        records = [
+            (
+                c.phone_number,
+                encode_variables(getattr(c, "variables", None) or None),
+                encode_metadata(c.metadata if c.metadata else {}),
+            )
+            for c in contacts
+        ]
+
+        raw = await conn.get_raw_connection()
+        await raw.driver_connection.copy_records_to_table(
+            "audience_contacts_stage",
+            records=records,
+            columns=["phone_number", "variables", "metadata_"],
+        )
+
+        result = await self.session.execute(
+            text(
+                "INSERT INTO audience_contacts (audience_id, phone_number, variables, metadata_) "
+                "SELECT CAST(:audience_id AS uuid), phone_number, variables, metadata_ "
+                "FROM audience_contacts_stage "
+                "ON CONFLICT (audience_id, phone_number) DO NOTHING"
+            ),
+            {"audience_id": audience_id},
+        )
+        logger.info(
+            "Bulk copied %d contacts into audience %s", result.rowcount, audience_id
+        )
+        return result.rowcount
+
     async def remove_contacts(self, audience_id: UUID) -> int:
         """Delete all contacts for an audience (needed before full re-upload)."""
         stmt = delete(AudienceContactModel).where(
@@ -236,6 +304,7 @@ class AudienceRepository:
         self,
         audience_id: UUID,
         batch_size: int = _STREAM_BATCH_SIZE,
+        after_id: Optional[UUID] = None,
     ) -> AsyncGenerator[List[AudienceContactModel], None]:
         """
         Stream contacts for an audience in batches using keyset pagination.
@@ -257,11 +326,12 @@ class AudienceRepository:
         Args:
             audience_id: The audience to stream contacts for
             batch_size:  Rows per page (default 1 000)
+            after_id:    Resume after this contact id (keyset cursor)
 
         Yields:
             List[AudienceContactModel] — one batch per iteration
         """
-        last_id: Optional[UUID] = None
+        last_id: Optional[UUID] = after_id
         total_streamed = 0
 
         while True:
@@ -20,15 +20,17 @@ import logging
 from sqlalchemy import select, update, and_
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from apps.core.domain.campaign import Campaign, CampaignStatus, CampaignType, Priority
-from apps.core.ports.repository import CampaignRepository, EntityNotFoundException
+from apps.core.domain.campaign import (
+    Campaign, CampaignStatus, CampaignType, Priority, StatsDelta
+)
+from apps.core.ports.repository import EntityNotFoundException
 from apps.adapters.db.models import CampaignModel
 
 
 logger = logging.getLogger(__name__)
 
 
-class SQLAlchemyCampaignRepository(CampaignRepository):
+class SQLAlchemyCampaignRepository:
     """
     SQLAlchemy implementation of Campaign Repository
     
@@ -194,6 +196,28 @@ class SQLAlchemyCampaignRepository(CampaignRepository):
         
         return [self._to_domain(model) for model in models]
     
+    async def get_many(
+        self,
+        ids: List[UUID],
+    ) -> List[Campaign]:
+        """
+        Get several campaigns in one query (WHERE id = ANY(...))
+        
+        Args:
+            ids: Campaign identifiers
+            
+        Returns:
+            Campaigns found, in the order of `ids` (missing IDs are skipped)
+        """
+        if not ids:
+            return []
+        
+        stmt = select(CampaignModel).where(CampaignModel.id.in_(ids))
+        result = await self.session.execute(stmt)
+        by_id = {model.id: model for model in result.scalars().all()}
+        
+        return [self._to_domain(by_id[i]) for i in ids if i in by_id]
+    
     async def get_active_campaigns(
         self,
         tenant_id: Optional[UUID] = None,
@@ -222,37 +246,65 @@ class SQLAlchemyCampaignRepository(CampaignRepository):
     async def update_stats(
         self,
         campaign_id: UUID,
-        stats_update: Dict[str, int],
+        delta: StatsDelta,
     ) -> None:
         """
         Update campaign statistics atomically
         
+        Always emits the same UPDATE (every counter column += its delta) so
+        the statement is prepared once and reused; zero fields are no-ops.
+        The UPDATE row-locks the campaign itself, so concurrent workers
+        serialise on it without a separate SELECT ... FOR UPDATE roundtrip.
+        
         Args:
             campaign_id: Campaign ID
-            stats_update: Stats to increment (e.g., {"messages_sent": 1})
+            delta: Counters to increment (e.g., StatsDelta(messages_sent=1))
         """
-        # Lock campaign row to prevent concurrent updates (deadlock prevention)
-        lock_stmt = select(CampaignModel).where(
-            CampaignModel.id == campaign_id
-        ).with_for_update()
-        await self.session.execute(lock_stmt)
-        
-        # Build update statement with increments
-        values = {}
-        for key, increment in stats_update.items():
-            if hasattr(CampaignModel, key):
-                values[key] = getattr(CampaignModel, key) + increment
-        
-        if values:
-            stmt = (
-                update(CampaignModel)
-                .where(CampaignModel.id == campaign_id)
-                .values(**values)
+        if isinstance(delta, dict):
+            # Backward compatibility with {"messages_sent": 1}-style callers
+            delta = StatsDelta.from_dict(delta)
+        
+        if delta.is_empty():
+            return
+        
+        stmt = (
+            update(CampaignModel)
+            .where(CampaignModel.id == campaign_id)
+            .values(
+                messages_sent=CampaignModel.messages_sent + delta.messages_sent,
+                messages_delivered=CampaignModel.messages_delivered + delta.messages_delivered,
+                messages_failed=CampaignModel.messages_failed + delta.messages_failed,
+                messages_read=CampaignModel.messages_read + delta.messages_read,
+                fallback_triggered=CampaignModel.fallback_triggered + delta.fallback_triggered,
+                opt_outs=CampaignModel.opt_outs + delta.opt_outs,
             )
-            await self.session.execute(stmt)
-            await self.session.flush()
+        )
+        await self.session.execute(stmt)
+        await self.session.flush()
+        
+        logger.debug(f"Updated stats for campaign {campaign_id}: {delta}")
+    
+    async def increment_stat(
+        self,
+        campaign_id: UUID,
+        field: str,
+        delta: int = 1,
+    ) -> None:
+        """
+        Increment a single campaign counter atomically
+        
+        Args:
+            campaign_id: Campaign ID
+            field: Counter column, e.g. "messages_sent"
+            delta: Amount to add
             
-            logger.debug(f"Updated stats for campaign {campaign_id}: {stats_update}")
+        Raises:
+            ValueError: If field is not a campaign counter
+        """
+        if field not in StatsDelta.__slots__:
+            raise ValueError(f"Unknown campaign counter: {field}")
+        
+        await self.update_stats(campaign_id, StatsDelta(**{field: delta}))
     
     async def recalculate_stats(
         self,
@@ -466,8 +518,8 @@ class SQLAlchemyCampaignRepository(CampaignRepository):
         campaign = self._to_domain(campaign_model)
         completed = campaign.update_stats_from_db(stats_data)
         
-        # Update model from domain
-        await self._update_from_domain(campaign_model, campaign)
+        # Update model from domain (row is locked: counters written back too)
+        await self._update_from_domain(campaign_model, campaign, with_stats=True)
         await self.session.flush()
         
         if completed:
@@ -616,13 +668,20 @@ class SQLAlchemyCampaignRepository(CampaignRepository):
         self,
         model: CampaignModel,
         campaign: Campaign,
+        with_stats: bool = False,
     ) -> None:
         """
         Update ORM model from domain entity
         
+        Counters are skipped by default: the domain copy may predate
+        increments other workers applied through update_stats(), and
+        writing it back would lose them.
+        
         Args:
             model: Existing ORM model
             campaign: Updated domain entity
+            with_stats: Also write the stats counters (caller holds the
+                row lock and computed them from the messages table)
         """
         model.name = campaign.name
         model.status = campaign.status.value
@@ -633,12 +692,13 @@ class SQLAlchemyCampaignRepository(CampaignRepository):
         model.fallback_channel = campaign.fallback_channel
         model.rate_limit = campaign.rate_limit
         model.recipient_count = campaign.recipient_count
-        model.messages_sent = campaign.stats.messages_sent
-        model.messages_delivered = campaign.stats.messages_delivered
-        model.messages_failed = campaign.stats.messages_failed
-        model.messages_read = campaign.stats.messages_read
-        model.fallback_triggered = campaign.stats.fallback_triggered
-        model.opt_outs = campaign.stats.opt_outs
+        if with_stats:
+            model.messages_sent = campaign.stats.messages_sent
+            model.messages_delivered = campaign.stats.messages_delivered
+            model.messages_failed = campaign.stats.messages_failed
+            model.messages_read = campaign.stats.messages_read
+            model.fallback_triggered = campaign.stats.fallback_triggered
+            model.opt_outs = campaign.stats.opt_outs
         model.metadata_ = campaign.metadata
         model.tags = campaign.tags
         model.updated_at = datetime.utcnow()
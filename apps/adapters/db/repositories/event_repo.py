@@ -12,21 +12,21 @@ Features:
 """
 
 from typing import List, Dict, Any, Optional
-from uuid import UUID, uuid4
+from uuid import UUID
 from datetime import datetime
 import logging
 
 from sqlalchemy import select, and_
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from apps.core.ports.repository import EventRepository
 from apps.adapters.db.models import EventModel
+from apps.core.domain.ids import uuid7
 
 
 logger = logging.getLogger(__name__)
 
 
-class SQLAlchemyEventRepository(EventRepository):
+class SQLAlchemyEventRepository:
     """
     SQLAlchemy implementation of Event Repository
     
@@ -84,7 +84,7 @@ class SQLAlchemyEventRepository(EventRepository):
         
         # Create event
         event = EventModel(
-            id=uuid4(),
+            id=uuid7(),
             event_type=event_type,
             aggregate_id=aggregate_id,
             aggregate_type=aggregate_type,
@@ -6,29 +6,39 @@ FIX: _to_model() now serialises template_id + variables into the content JSON bl
      save_batch() uses bulk INSERT (not individual saves) for performance.
 """
 
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Sequence, Tuple
 from uuid import UUID
 from datetime import datetime
 import logging
 
-from sqlalchemy import select, update, and_
+from sqlalchemy import (
+    String, any_, bindparam, case, cast, func, insert, literal, select, update, and_,
+)
+from sqlalchemy.dialects.postgresql import ARRAY, JSONB, UUID as PGUUID
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased
 
 from apps.core.domain.message import (
-    Message, MessageStatus, MessageChannel, MessageContent, FailureReason
+    Message, MessageStatus, MessageChannel, MessageContent, FailureReason,
+    RichCard, SuggestedAction,
 )
-from apps.core.ports.repository import MessageRepository, EntityNotFoundException
-from apps.adapters.db.models import MessageModel
+from apps.core.ports.repository import EntityNotFoundException
+from apps.adapters.db.models import AudienceContactModel, MessageModel
 
 
 logger = logging.getLogger(__name__)
 
 
-class SQLAlchemyMessageRepository(MessageRepository):
+class SQLAlchemyMessageRepository:
     """SQLAlchemy implementation of MessageRepository."""
 
+    # Rows per batched multi-row INSERT (~30 columns each, under 32767 parameters)
+    _INSERT_CHUNK = 1000
+
     def __init__(self, session: AsyncSession):
         self.session = session
+        # Messages loaded for mutation; written once by flush_tracked()
+        self._tracked: Dict[UUID, Message] = {}
 
     # ------------------------------------------------------------------
     # Write operations
@@ -36,31 +46,222 @@ class SQLAlchemyMessageRepository(MessageRepository):
 
     async def save(self, message: Message) -> Message:
         """Save message (insert or update)."""
-        stmt = select(MessageModel).where(MessageModel.id == message.id)
-        result = await self.session.execute(stmt)
-        existing = result.scalar_one_or_none()
+        await self._stage(message)
+        await self.session.flush()
+        return message
+
+    def track(self, message: Message) -> Message:
+        """
+        Register a message whose later mutations should be persisted when
+        the unit of work commits. No SQL is issued here.
+        """
+        self._tracked[message.id] = message
+        return message
+
+    async def flush_tracked(self) -> None:
+        """Stage every tracked message and write them in one flush."""
+        if not self._tracked:
+            return
+        tracked, self._tracked = self._tracked, {}
+        for message in tracked.values():
+            await self._stage(message)
+        await self.session.flush()
+
+    def discard_tracked(self) -> None:
+        """Forget tracked messages (transaction rolled back)."""
+        self._tracked.clear()
 
+    async def _stage(self, message: Message) -> None:
+        """
+        Copy domain state onto the session without flushing.
+
+        session.get() hits the identity map for messages loaded in this
+        session, so updating an already-loaded message costs no SELECT.
+        """
+        existing = await self.session.get(
+            MessageModel, (message.id, message.campaign_id)
+        )
         if existing:
             await self._update_from_domain(existing, message)
         else:
             self.session.add(self._to_model(message))
 
-        await self.session.flush()
-        return message
-
     async def save_batch(self, messages: List[Message]) -> List[Message]:
         """
-        Bulk-save messages.
-
-        Uses add_all() so SQLAlchemy emits one multi-row INSERT instead of
-        N individual round-trips.
+        Bulk-insert messages.
+
+        Executes one INSERT with a list of parameter sets: SQLAlchemy's
+        insertmanyvalues batches them into multi-row VALUES statements
+        of _INSERT_CHUNK rows (under asyncpg's 32767-parameter limit).
+        Unlike .values([...]), whose SQL changes with every row count,
+        the statement compiles once and is then served from the engine's
+        query cache. IDs are generated client-side, so no RETURNING is
+        needed to keep queue payloads correct.
         """
-        models = [self._to_model(msg) for msg in messages]
-        self.session.add_all(models)
-        await self.session.flush()
+        if messages:
+            await self.session.execute(
+                insert(MessageModel).execution_options(
+                    insertmanyvalues_page_size=self._INSERT_CHUNK
+                ),
+                [self._to_row(m) for m in messages],
+            )
         logger.info("Bulk saved %d messages", len(messages))
         return messages
 
+    async def bulk_copy(self, messages: List[Message]) -> int:
+        """
+        Bulk-load new messages with COPY ... FROM STDIN (asyncpg binary).
+
+        Several times faster than INSERT for large campaign batches. Values
+        go through each column type's bind processor, so enum and JSON
+        columns are encoded exactly as the ORM would write them. Runs in
+        the session's current transaction; the caller commits.
+
+        Returns:
+            Number of rows copied
+        """
+        if not messages:
+            return 0
+
+        conn = await self.session.connection()
+        dialect = conn.dialect
+        rows = [self._to_row(m) for m in messages]
+
+        columns = [MessageModel.__mapper__.columns[attr] for attr in rows[0]]
+        processors = [
+            col.type.dialect_impl(dialect).bind_processor(dialect) for col in columns
+        ]
+        records = [
+            tuple(
+                proc(value) if proc else value
+                for proc, value in zip(processors, row.values())
+            )
+            for row in rows
+        ]
+
+        raw = await conn.get_raw_connection()
+        await raw.driver_connection.copy_records_to_table(
+            MessageModel.__tablename__,
+            records=records,
+            columns=[col.name for col in columns],
+        )
+        logger.info("Bulk copied %d messages", len(messages))
+        return len(messages)
+
+    async def insert_from_audience(
+        self,
+        prototype: Message,
+        audience_id: UUID,
+        template_text: str,
+        variable_names: Sequence[str],
+        after_contact_id: Optional[UUID] = None,
+        limit: int = 1000,
+    ) -> Tuple[List[str], Optional[UUID]]:
+        """
+        Create messages for one keyset page of an audience in the database
+        (INSERT ... SELECT from audience_contacts), never fetching contacts.
+
+        {{name}} placeholders are rendered with nested replace() calls on
+        the contact's positional `variables` (a missing value keeps its
+        placeholder, as CompiledTemplate.render does). Every other column
+        is copied from `prototype`; ids come from uuid_generate_v7(). Runs
+        in the session's current transaction; the caller commits.
+
+        Args:
+            prototype:         Message carrying the shared column values
+            audience_id:       Audience whose contacts become recipients
+            template_text:     Template body with {{name}} placeholders
+            variable_names:    Declared variable names, in contact order
+            after_contact_id:  Keyset cursor from the previous page
+            limit:             Contacts per page
+
+        Returns:
+            (new message ids as text, cursor for the next page or None
+            when done) — the ids are only forwarded to the dispatch queue,
+            so RETURNING id::text skips a UUID object per row
+        """
+        contacts = AudienceContactModel
+        page = [contacts.audience_id == audience_id]
+        if after_contact_id is not None:
+            page.append(contacts.id > after_contact_id)
+
+        # Last contact id of this page (None: the rest fits in one page)
+        cursor = await self.session.scalar(
+            select(contacts.id)
+            .where(*page)
+            .order_by(contacts.id)
+            .offset(limit - 1)
+            .limit(1)
+        )
+        if cursor is not None:
+            page.append(contacts.id <= cursor)
+
+        text = literal(template_text, String)
+        for index, name in enumerate(variable_names):
+            placeholder = "{{%s}}" % name
+            if placeholder in template_text:
+                text = func.replace(
+                    text,
+                    placeholder,
+                    func.coalesce(contacts.variables[index].astext, placeholder),
+                )
+
+        row = self._to_row(prototype)
+        content = row["content"]
+        columns = MessageModel.__mapper__.columns
+        values = {
+            attr: literal(value, columns[attr].type)
+            for attr, value in row.items()
+            if attr not in ("id", "recipient_phone", "content")
+        }
+        values["id"] = func.uuid_generate_v7()
+        values["recipient_phone"] = contacts.phone_number
+        values["content"] = func.jsonb_build_object(
+            literal("text", String), text,
+            literal("template_id", String), literal(content["template_id"], String),
+            literal("variables", String), func.coalesce(
+                contacts.variables, cast(literal("[]", String), JSONB)
+            ),
+            literal("rcs_type", String), literal(content["rcs_type"], String),
+        )
+
+        stmt = (
+            insert(MessageModel)
+            .from_select(
+                [columns[attr] for attr in values],
+                select(*values.values()).where(*page, contacts.phone_number != ""),
+            )
+            .returning(cast(MessageModel.id, String))
+        )
+        ids = list((await self.session.scalars(stmt)).all())
+        return ids, cursor
+
+    async def update_delivery_states(self, messages: List[Message]) -> None:
+        """
+        Persist DLR-driven state for many messages in one statement.
+
+        ORM bulk UPDATE by primary key: SQLAlchemy sends a single
+        executemany UPDATE ... WHERE id = :id AND campaign_id = :campaign_id
+        instead of loading and flushing each row.
+        """
+        if not messages:
+            return
+        now = datetime.utcnow()
+        await self.session.execute(
+            update(MessageModel),
+            [
+                {
+                    "id": m.id,
+                    "campaign_id": m.campaign_id,
+                    "status": m.status.value,
+                    "delivered_at": m.delivered_at,
+                    "read_at": m.read_at,
+                    "updated_at": now,
+                }
+                for m in messages
+            ],
+        )
+
     async def delete(self, id: UUID) -> bool:
         stmt = select(MessageModel).where(MessageModel.id == id)
         result = await self.session.execute(stmt)
@@ -81,6 +282,23 @@ class SQLAlchemyMessageRepository(MessageRepository):
         model = result.scalar_one_or_none()
         return self._to_domain(model) if model else None
 
+    async def get_by_ids(
+        self, ids: List[UUID], for_update: bool = False
+    ) -> List[Message]:
+        """
+        Load many messages with one IN query (order not preserved).
+
+        for_update row-locks them until the transaction ends, so a
+        check-then-write on their status cannot race another writer.
+        """
+        if not ids:
+            return []
+        stmt = select(MessageModel).where(MessageModel.id.in_(set(ids)))
+        if for_update:
+            stmt = stmt.with_for_update()
+        result = await self.session.execute(stmt)
+        return [self._to_domain(m) for m in result.scalars().all()]
+
     async def exists(self, id: UUID) -> bool:
         stmt = select(MessageModel.id).where(MessageModel.id == id)
         result = await self.session.execute(stmt)
@@ -108,6 +326,142 @@ class SQLAlchemyMessageRepository(MessageRepository):
         model = result.scalar_one_or_none()
         return self._to_domain(model) if model else None
 
+    async def get_by_external_ids(self, external_ids: List[str]) -> Dict[str, Message]:
+        """Load messages for a batch of DLRs with one indexed IN query."""
+        if not external_ids:
+            return {}
+        stmt = select(MessageModel).where(
+            MessageModel.external_id.in_(set(external_ids))
+        )
+        result = await self.session.execute(stmt)
+        return {
+            m.external_id: self._to_domain(m) for m in result.scalars().all()
+        }
+
+    async def get_statuses(self, ids: List[UUID]) -> Dict[UUID, MessageStatus]:
+        """
+        Current status of many messages in one query.
+
+        The ids are bound as a single uuid[] parameter (id = ANY($1)), so
+        the statement is the same whatever the number of ids.
+        """
+        if not ids:
+            return {}
+        stmt = select(MessageModel.id, MessageModel.status).where(
+            MessageModel.id == any_(
+                bindparam("ids", list(ids), type_=ARRAY(PGUUID(as_uuid=True)))
+            )
+        )
+        result = await self.session.execute(stmt)
+        return {row.id: MessageStatus(row.status) for row in result}
+
+    async def claim_for_dispatch(
+        self,
+        message_id: UUID,
+        campaign_id: UUID,
+    ) -> bool:
+        """
+        Atomically move one message PENDING -> QUEUED before it is sent.
+
+        Of two copies of a dispatch job consumed at once, the second one's
+        UPDATE waits on the first's row lock and then matches nothing, so
+        only one delivery proceeds to the aggregator. Runs in the session's
+        current transaction; the caller must commit before sending.
+
+        Returns:
+            True if this call claimed the message
+        """
+        stmt = (
+            update(MessageModel)
+            .where(
+                MessageModel.id == message_id,
+                MessageModel.campaign_id == campaign_id,
+                MessageModel.status == MessageStatus.PENDING.value,
+            )
+            .values(status=MessageStatus.QUEUED.value, queued_at=func.now())
+            .returning(MessageModel.id)
+            .execution_options(synchronize_session=False)
+        )
+        result = await self.session.execute(stmt)
+        return result.first() is not None
+
+    async def release_stale_claims(
+        self,
+        campaign_id: UUID,
+        claimed_before: datetime,
+        limit: int = 1000,
+    ) -> List[Tuple[str, str]]:
+        """
+        Put a page of QUEUED messages claimed before `claimed_before` back
+        to PENDING and return them for republishing.
+
+        A live dispatcher commits a claim's outcome within seconds, so a
+        claim older than the lease belongs to a consumer that died between
+        claim_for_dispatch() and its final commit. Released rows are
+        PENDING again, so each is republished once per orphaned claim.
+        Runs in the session's current transaction; the caller commits,
+        then publishes.
+
+        Returns:
+            (message id as text, priority) per released row
+        """
+        stale = (
+            select(MessageModel.id)
+            .where(
+                MessageModel.campaign_id == campaign_id,
+                MessageModel.status == MessageStatus.QUEUED.value,
+                MessageModel.queued_at < claimed_before,
+            )
+            .order_by(MessageModel.id)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        stmt = (
+            update(MessageModel)
+            .where(
+                MessageModel.campaign_id == campaign_id,
+                MessageModel.id.in_(stale.scalar_subquery()),
+            )
+            .values(status=MessageStatus.PENDING.value)
+            .returning(cast(MessageModel.id, String), MessageModel.priority)
+            .execution_options(synchronize_session=False)
+        )
+        result = await self.session.execute(stmt)
+        return [(row[0], row[1]) for row in result]
+
+    async def get_pending_page(
+        self,
+        campaign_id: UUID,
+        priorities: Sequence[str],
+        after_id: Optional[UUID] = None,
+        limit: int = 1000,
+    ) -> List[Tuple[str, str]]:
+        """
+        Keyset page of PENDING messages of the given priorities.
+
+        Used to republish jobs after the broker lost its transient queues.
+        Read-only: a duplicate job is harmless because the dispatcher
+        claims each row with claim_for_dispatch() before sending.
+
+        Returns:
+            (message id as text, priority) ordered by id; pass the last id
+            back as `after_id` for the next page
+        """
+        stmt = (
+            select(cast(MessageModel.id, String), MessageModel.priority)
+            .where(
+                MessageModel.campaign_id == campaign_id,
+                MessageModel.status == MessageStatus.PENDING.value,
+                MessageModel.priority.in_(list(priorities)),
+            )
+            .order_by(MessageModel.id)
+            .limit(limit)
+        )
+        if after_id is not None:
+            stmt = stmt.where(MessageModel.id > after_id)
+        result = await self.session.execute(stmt)
+        return [(row[0], row[1]) for row in result]
+
     async def get_failed_messages(
         self,
         campaign_id: Optional[UUID] = None,
@@ -285,6 +639,82 @@ class SQLAlchemyMessageRepository(MessageRepository):
             "read": read,
         }
 
+    async def get_delivery_stats_bulk(
+        self,
+        campaign_ids: List[UUID],
+    ) -> Dict[UUID, Dict[str, int]]:
+        """
+        Per-status counts for many campaigns in ONE aggregate query.
+
+        Used by dashboard listings — replaces N get_delivery_stats() calls
+        with a single GROUP BY (campaign_id, status). Only parent messages
+        are counted, so SMS fallback children don't inflate the totals,
+        and with get_delivery_stats()'s rules: a FAILED parent whose SMS
+        child was delivered (or read) counts as delivered (or read). The
+        best successful child per parent is LEFT JOINed in the same query.
+
+        Campaigns with no messages are still present with all-zero counts.
+        """
+        stats: Dict[UUID, Dict[str, int]] = {
+            cid: {s.value: 0 for s in MessageStatus} | {"total": 0}
+            for cid in campaign_ids
+        }
+        if not campaign_ids:
+            return stats
+
+        delivered = MessageStatus.DELIVERED.value
+        read = MessageStatus.READ.value
+
+        # Per parent: 2 if some child was read, 1 if only delivered
+        child = aliased(MessageModel)
+        best_child = (
+            select(
+                child.campaign_id,
+                child.parent_message_id,
+                func.max(case((child.status == read, 2), else_=1)).label("best"),
+            )
+            .where(
+                child.campaign_id.in_(campaign_ids),
+                child.parent_message_id.is_not(None),
+                child.status.in_((delivered, read)),
+            )
+            .group_by(child.campaign_id, child.parent_message_id)
+            .subquery()
+        )
+
+        failed = MessageModel.status == MessageStatus.FAILED.value
+        status = case(
+            (and_(failed, best_child.c.best == 2), read),
+            (and_(failed, best_child.c.best == 1), delivered),
+            else_=MessageModel.status,
+        )
+        stmt = (
+            select(MessageModel.campaign_id, status, func.count(MessageModel.id))
+            .outerjoin(
+                best_child,
+                and_(
+                    best_child.c.campaign_id == MessageModel.campaign_id,
+                    best_child.c.parent_message_id == MessageModel.id,
+                ),
+            )
+            .where(
+                and_(
+                    MessageModel.campaign_id.in_(campaign_ids),
+                    MessageModel.parent_message_id.is_(None),
+                )
+            )
+            .group_by(MessageModel.campaign_id, status)
+        )
+        result = await self.session.execute(stmt)
+
+        for campaign_id, status, count in result.all():
+            status_value = status.value if isinstance(status, MessageStatus) else status
+            row = stats[campaign_id]
+            row[status_value] = row.get(status_value, 0) + count
+            row["total"] += count
+
+        return stats
+
     # ------------------------------------------------------------------
     # Mapping helpers
     # ------------------------------------------------------------------
@@ -301,12 +731,10 @@ class SQLAlchemyMessageRepository(MessageRepository):
         # Rebuild rich card if stored
         rich_card = None
         if raw.get("rich_card"):
-            from apps.core.domain.message import RichCard
             rich_card = RichCard(**raw["rich_card"])
 
         # Rebuild suggestions if stored
         suggestions = []
-        from apps.core.domain.message import SuggestedAction
         for s in raw.get("suggestions", []):
             suggestions.append(SuggestedAction(**s))
 
@@ -347,6 +775,8 @@ class SQLAlchemyMessageRepository(MessageRepository):
         message.max_retries = model.max_retries
         message.fallback_enabled = model.fallback_enabled
         message.fallback_triggered = model.fallback_triggered
+        message.rcs_capable = model.rcs_capable
+        message.rcs_checked_at = model.rcs_checked_at
 
         # Aggregator
         message.aggregator = model.aggregator
@@ -358,8 +788,12 @@ class SQLAlchemyMessageRepository(MessageRepository):
         return message
 
     def _to_model(self, message: Message) -> MessageModel:
+        """Convert domain entity → ORM model."""
+        return MessageModel(**self._to_row(message))
+
+    def _to_row(self, message: Message) -> Dict[str, Any]:
         """
-        Convert domain entity → ORM model.
+        Convert domain entity → column values (ORM attribute names).
 
         CRITICAL FIX: template_id and variables are stored inside the content
         JSON blob so they are persisted to the database.
@@ -394,33 +828,35 @@ class SQLAlchemyMessageRepository(MessageRepository):
                 for s in message.content.suggestions
             ]
 
-        return MessageModel(
-            id=message.id,
-            campaign_id=message.campaign_id,
-            tenant_id=message.tenant_id,
-            parent_message_id=message.parent_message_id,  # NEW: Map parent linkage
-            recipient_phone=message.recipient_phone,
-            status=message.status.value,
-            channel=message.channel.value,
-            priority=message.priority,
-            content=content_data,
-            queued_at=message.queued_at,
-            sent_at=message.sent_at,
-            delivered_at=message.delivered_at,
-            read_at=message.read_at,
-            failed_at=message.failed_at,
-            expires_at=message.expires_at,
-            retry_count=message.retry_count,
-            max_retries=message.max_retries,
-            fallback_enabled=message.fallback_enabled,
-            fallback_triggered=message.fallback_triggered,
-            aggregator=message.aggregator,
-            external_id=message.external_id,
-            failure_reason=message.failure_reason.value if message.failure_reason else None,
-            metadata_=message.metadata,
-            created_at=message.created_at,
-            updated_at=message.updated_at,
-        )
+        return {
+            "id": message.id,
+            "campaign_id": message.campaign_id,
+            "tenant_id": message.tenant_id,
+            "parent_message_id": message.parent_message_id,  # NEW: Map parent linkage
+            "recipient_phone": message.recipient_phone,
+            "status": message.status.value,
+            "channel": message.channel.value,
+            "priority": message.priority,
+            "content": content_data,
+            "queued_at": message.queued_at,
+            "sent_at": message.sent_at,
+            "delivered_at": message.delivered_at,
+            "read_at": message.read_at,
+            "failed_at": message.failed_at,
+            "expires_at": message.expires_at,
+            "retry_count": message.retry_count,
+            "max_retries": message.max_retries,
+            "fallback_enabled": message.fallback_enabled,
+            "fallback_triggered": message.fallback_triggered,
+            "rcs_capable": message.rcs_capable,
+            "rcs_checked_at": message.rcs_checked_at,
+            "aggregator": message.aggregator,
+            "external_id": message.external_id,
+            "failure_reason": message.failure_reason.value if message.failure_reason else None,
+            "metadata_": message.metadata,
+            "created_at": message.created_at,
+            "updated_at": message.updated_at,
+        }
 
     async def _update_from_domain(self, model: MessageModel, message: Message) -> None:
         """Update mutable fields on existing ORM model."""
@@ -434,6 +870,8 @@ class SQLAlchemyMessageRepository(MessageRepository):
         model.failed_at = message.failed_at
         model.retry_count = message.retry_count
         model.fallback_triggered = message.fallback_triggered
+        model.rcs_capable = message.rcs_capable
+        model.rcs_checked_at = message.rcs_checked_at
         model.aggregator = message.aggregator
         model.external_id = message.external_id
         model.failure_reason = (
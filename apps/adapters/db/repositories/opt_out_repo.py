@@ -5,28 +5,28 @@ Manages user consent and opt-out records.
 Critical for compliance (GDPR, TCPA, DND).
 
 Features:
-    - Fast opt-out checks
+    - Fast opt-out checks (single and bulk)
     - Consent history tracking
     - Tenant isolation
     - Phone number normalization
 """
 
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Set
 from uuid import UUID
 from datetime import datetime
 import logging
 
-from sqlalchemy import select, and_
+from sqlalchemy import select, and_, func
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from apps.core.ports.repository import OptOutRepository
 from apps.adapters.db.models import OptInModel
 
 
 logger = logging.getLogger(__name__)
 
 
-class SQLAlchemyOptOutRepository(OptOutRepository):
+class SQLAlchemyOptOutRepository:
     """
     SQLAlchemy implementation of OptOut Repository
     
@@ -82,6 +82,40 @@ class SQLAlchemyOptOutRepository(OptOutRepository):
         from apps.core.domain.opt_in import ConsentStatus
         return opt_in.promotional_status == ConsentStatus.OPTED_OUT.value
     
+    async def are_opted_out(
+        self,
+        phone_numbers: List[str],
+        tenant_id: UUID,
+    ) -> Set[str]:
+        """
+        Bulk opt-out check for a batch of recipients
+        
+        Replaces N is_opted_out() round-trips with a single
+        WHERE phone_number IN (...) query.
+        
+        Args:
+            phone_numbers: Phone numbers in E.164
+            tenant_id: Tenant context
+            
+        Returns:
+            Set of phone numbers that have opted out
+        """
+        if not phone_numbers:
+            return set()
+        
+        from apps.core.domain.opt_in import ConsentStatus
+        
+        stmt = select(OptInModel.phone_number).where(
+            and_(
+                OptInModel.tenant_id == tenant_id,
+                OptInModel.phone_number.in_(phone_numbers),
+                OptInModel.promotional_status == ConsentStatus.OPTED_OUT.value,
+            )
+        )
+        
+        result = await self.session.execute(stmt)
+        return set(result.scalars().all())
+    
     async def opt_out(
         self,
         phone_number: str,
@@ -208,6 +242,62 @@ class SQLAlchemyOptOutRepository(OptOutRepository):
         
         logger.info(f"Opt-in recorded for {phone_number} (tenant={tenant_id})")
     
+    async def opt_in_batch(
+        self,
+        phone_numbers: List[str],
+        tenant_id: UUID,
+    ) -> None:
+        """
+        Record opt-in for a batch of phone numbers
+        
+        One INSERT ... ON CONFLICT (tenant_id, phone_number) DO UPDATE
+        for the whole batch instead of a SELECT + write per number.
+        
+        Args:
+            phone_numbers: Phone numbers in E.164
+            tenant_id: Tenant context
+        """
+        if not phone_numbers:
+            return
+        
+        from apps.core.domain.opt_in import ConsentStatus
+        
+        now = datetime.utcnow()
+        entry = {
+            "timestamp": now.isoformat(),
+            "status": ConsentStatus.OPTED_IN.value,
+            "consent_type": "promotional",
+            "method": "api",
+        }
+        
+        # ON CONFLICT cannot touch the same row twice in one statement
+        stmt = pg_insert(OptInModel).values([
+            {
+                "tenant_id": tenant_id,
+                "phone_number": phone,
+                "promotional_status": ConsentStatus.OPTED_IN.value,
+                "promotional_opted_in_at": now,
+                "consent_history": [entry],
+            }
+            for phone in dict.fromkeys(phone_numbers)
+        ])
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[OptInModel.tenant_id, OptInModel.phone_number],
+            set_={
+                "promotional_status": stmt.excluded.promotional_status,
+                "promotional_opted_in_at": stmt.excluded.promotional_opted_in_at,
+                "consent_history": OptInModel.consent_history.op("||")(
+                    stmt.excluded.consent_history
+                ),
+                "updated_at": func.now(),
+            },
+        )
+        await self.session.execute(stmt)
+        
+        logger.info(
+            f"Opt-in recorded for {len(phone_numbers)} numbers (tenant={tenant_id})"
+        )
+    
     async def get_opt_outs(
         self,
         tenant_id: UUID,
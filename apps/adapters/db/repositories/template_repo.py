@@ -7,6 +7,7 @@ Key addition vs original:
     - Handles external_template_id (rcssms.in template ID string)
     - Handles rcs_type (BASIC, RICH, RICHCASOUREL)
     - get_by_external_id() method for webhook template approval callbacks
+    - get_compiled() for amortised per-recipient rendering
 """
 
 from typing import Optional, List
@@ -17,15 +18,16 @@ import logging
 from sqlalchemy import select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from apps.core.domain.template import Template, TemplateStatus, TemplateVariable
-from apps.core.ports.repository import TemplateRepository
+from apps.core.domain.template import (
+    Template, TemplateStatus, TemplateVariable, CompiledTemplate
+)
 from apps.adapters.db.models import TemplateModel
 
 
 logger = logging.getLogger(__name__)
 
 
-class SQLAlchemyTemplateRepository(TemplateRepository):
+class SQLAlchemyTemplateRepository:
     """SQLAlchemy implementation of Template Repository"""
 
     def __init__(self, session: AsyncSession):
@@ -82,6 +84,26 @@ class SQLAlchemyTemplateRepository(TemplateRepository):
 
         return self._to_domain(model)
 
+    async def get_compiled(self, template_id: UUID) -> Optional[CompiledTemplate]:
+        """
+        Get template text pre-compiled for per-recipient rendering.
+
+        The compilation itself is cached process-wide on (content, variable
+        order), so repeated calls for the same template version only pay
+        for the row fetch.
+
+        Args:
+            template_id: Internal template UUID
+
+        Returns:
+            CompiledTemplate or None
+        """
+        template = await self.get_by_id(template_id)
+        if not template:
+            return None
+
+        return template.compiled()
+
     async def delete(self, id: UUID) -> bool:
         """Delete template"""
         stmt = select(TemplateModel).where(TemplateModel.id == id)
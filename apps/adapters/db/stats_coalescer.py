@@ -0,0 +1,141 @@
+"""
+Campaign Stats Coalescer
+
+Per-process buffer for campaign statistics writes. Delivery jobs and DLR
+webhooks touch the same campaign row over and over — every counter
+increment and every recalculate_stats() takes a row lock on it, so a busy
+campaign serialises the whole worker fleet on one row.
+
+Instead, jobs record what they would have written:
+
+    coalescer.add(campaign_id, StatsDelta(opt_outs=3))   # summed
+    coalescer.mark_dirty(campaign_id)                    # recalc requested
+
+and a background task flushes every `flush_interval_ms` (or as soon as
+`max_pending` campaigns are buffered): per campaign, ONE update_stats()
+with the summed delta and at most ONE recalculate_stats(), all in a single
+transaction. Campaigns are flushed in id order so two workers flushing
+concurrently always lock rows in the same order.
+
+Failed flushes put their work back into the buffer for the next attempt.
+Call close() on worker shutdown so buffered counters are not lost: it
+lets an in-progress flush finish (never cancels it mid-transaction) and
+then flushes what is left.
+
+mark_dirty() must only be called once the rows it should count are
+committed (DeliveryService registers it with uow.after_commit()): a
+recalculation that runs first sees stale rows and is never repeated.
+"""
+
+import asyncio
+import logging
+from typing import Dict, Optional, Set
+from uuid import UUID
+
+from apps.adapters.db.postgres import Database
+from apps.adapters.db.unit_of_work import SQLAlchemyUnitOfWork
+from apps.core.domain.campaign import StatsDelta
+
+
+logger = logging.getLogger(__name__)
+
+
+class StatsCoalescer:
+    """
+    Buffers campaign stat increments and recalculations, flushing in batches.
+
+    Args:
+        db:                 Database used for flush transactions
+        flush_interval_ms:  Maximum time a write stays buffered
+        max_pending:        Flush early once this many campaigns are buffered
+    """
+
+    def __init__(
+        self,
+        db: Database,
+        flush_interval_ms: int = 100,
+        max_pending: int = 100,
+    ):
+        self.db = db
+        self.flush_interval = flush_interval_ms / 1000
+        self.max_pending = max_pending
+        self._deltas: Dict[UUID, StatsDelta] = {}
+        self._dirty: Set[UUID] = set()
+        self._lock = asyncio.Lock()
+        self._wakeup = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+        self._closing = False
+
+    def add(self, campaign_id: UUID, delta: StatsDelta) -> None:
+        """Buffer a counter increment for a campaign."""
+        if delta.is_empty():
+            return
+        current = self._deltas.get(campaign_id)
+        self._deltas[campaign_id] = current + delta if current else delta
+        self._schedule()
+
+    def mark_dirty(self, campaign_id: UUID) -> None:
+        """Request a recalculate_stats() for a campaign on the next flush."""
+        self._dirty.add(campaign_id)
+        self._schedule()
+
+    async def flush(self) -> None:
+        """Write everything buffered so far (one transaction)."""
+        async with self._lock:
+            if not self._deltas and not self._dirty:
+                return
+
+            deltas, self._deltas = self._deltas, {}
+            dirty, self._dirty = self._dirty, set()
+
+            try:
+                async with self.db.session() as session:
+                    uow = SQLAlchemyUnitOfWork(session)
+                    async with uow:
+                        for campaign_id in sorted(set(deltas) | dirty, key=str):
+                            if campaign_id in deltas:
+                                await uow.campaigns.update_stats(
+                                    campaign_id, deltas[campaign_id]
+                                )
+                            if campaign_id in dirty:
+                                await uow.campaigns.recalculate_stats(campaign_id)
+            except Exception as e:
+                logger.warning(
+                    f"Stats flush failed ({len(deltas)} deltas, "
+                    f"{len(dirty)} recalcs), will retry: {e}"
+                )
+                for campaign_id, delta in deltas.items():
+                    self.add(campaign_id, delta)
+                self._dirty |= dirty
+                return
+
+            logger.debug(
+                f"Stats flushed: {len(deltas)} deltas, {len(dirty)} recalcs"
+            )
+
+    async def close(self) -> None:
+        """Stop the background task and flush what is left."""
+        self._closing = True
+        self._wakeup.set()
+        if self._task:
+            # The loop exits after its current (or one immediate) flush
+            await self._task
+            self._task = None
+        await self.flush()
+
+    def _schedule(self) -> None:
+        """Start the flush task if needed; wake it early when full."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+        if len(self._deltas) + len(self._dirty) >= self.max_pending:
+            self._wakeup.set()
+
+    async def _run(self) -> None:
+        """Flush every flush_interval (or sooner when max_pending is hit)."""
+        while (self._deltas or self._dirty) and not self._closing:
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), self.flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+            await self.flush()
@@ -8,22 +8,15 @@ Features:
     - Transaction management
     - Repository coordination
     - Automatic rollback on errors
-    - Context manager support
+    - Context manager support (reentrant: nested blocks share one transaction)
+    - After-commit callbacks (e.g. queue publishes that must see the rows)
 """
 
-from typing import Optional
+from typing import Awaitable, Callable, List, Optional
 import logging
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from apps.core.ports.repository import (
-    UnitOfWork,
-    CampaignRepository,
-    MessageRepository,
-    EventRepository,
-    OptOutRepository,
-    TemplateRepository,
-)
 from apps.adapters.db.repositories.campaign_repo import SQLAlchemyCampaignRepository
 from apps.adapters.db.repositories.message_repo import SQLAlchemyMessageRepository
 from apps.adapters.db.repositories.event_repo import SQLAlchemyEventRepository
@@ -34,13 +27,17 @@ from apps.adapters.db.repositories.template_repo import SQLAlchemyTemplateReposi
 logger = logging.getLogger(__name__)
 
 
-class SQLAlchemyUnitOfWork(UnitOfWork):
+class SQLAlchemyUnitOfWork:
     """
     SQLAlchemy Unit of Work implementation
     
     Coordinates multiple repositories in a single transaction.
     Ensures atomic operations across domain aggregates.
     
+    Satisfies the UnitOfWork protocol structurally; repository properties
+    are typed as the concrete SQLAlchemy classes so call sites bind
+    directly to them.
+    
     Example:
         >>> async with uow:
         ...     campaign = await uow.campaigns.get_by_id(campaign_id)
@@ -57,25 +54,45 @@ class SQLAlchemyUnitOfWork(UnitOfWork):
             session: SQLAlchemy async session
         """
         self.session = session
-        self._campaigns: Optional[CampaignRepository] = None
-        self._messages: Optional[MessageRepository] = None
-        self._events: Optional[EventRepository] = None
-        self._opt_outs: Optional[OptOutRepository] = None
-        self._templates: Optional[TemplateRepository] = None
+        self._campaigns: Optional[SQLAlchemyCampaignRepository] = None
+        self._messages: Optional[SQLAlchemyMessageRepository] = None
+        self._events: Optional[SQLAlchemyEventRepository] = None
+        self._opt_outs: Optional[SQLAlchemyOptOutRepository] = None
+        self._templates: Optional[SQLAlchemyTemplateRepository] = None
         self._audiences: Optional["AudienceRepository"] = None
+        # Nesting depth of `async with` blocks; only the outermost commits
+        self._depth = 0
+        self._rollback_only = False
+        # Run once the outermost block commits; dropped on rollback
+        self._after_commit: List[Callable[[], Awaitable[None]]] = []
     
     async def __aenter__(self):
-        """Begin transaction if not already in one"""
-        if not self.session.in_transaction():
+        """
+        Begin transaction if not already in one
+
+        Reentrant: nested ``async with uow`` blocks (e.g. a worker wrapping a
+        service that opens its own block) join the outer transaction, which
+        commits or rolls back once when the outermost block exits.
+        """
+        if self._depth == 0 and not self.session.in_transaction():
             await self.session.begin()
+        self._depth += 1
         return self
     
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        """Commit or rollback transaction"""
+        """Commit or rollback transaction (outermost block only)"""
+        self._depth -= 1
         if exc_type is not None:
-            # Exception occurred, rollback
+            self._rollback_only = True
+        if self._depth > 0:
+            return
+
+        if self._rollback_only:
+            # Exception occurred (here or in a nested block), rollback
+            self._rollback_only = False
             await self.rollback()
-            logger.error(f"Transaction rolled back due to: {exc_type.__name__}")
+            if exc_type is not None:
+                logger.error(f"Transaction rolled back due to: {exc_type.__name__}")
         else:
             # No exception, commit
             try:
@@ -84,11 +101,29 @@ class SQLAlchemyUnitOfWork(UnitOfWork):
                 logger.exception("Commit failed, rolling back")
                 await self.rollback()
                 raise
+            
+            callbacks, self._after_commit = self._after_commit, []
+            for callback in callbacks:
+                await callback()
+    
+    def after_commit(self, callback: Callable[[], Awaitable[None]]) -> None:
+        """
+        Defer `callback` until the outermost block has committed
+        
+        For side effects another process acts on by reading the rows
+        written here (e.g. publishing a dispatch job): run before the
+        commit, the consumer may look the row up and not find it.
+        Discarded if the transaction rolls back.
+        """
+        self._after_commit.append(callback)
     
     async def commit(self) -> None:
         """Commit transaction"""
         if self.session.in_transaction():
             try:
+                # Write messages mutated in this unit of work in one flush
+                if self._messages is not None:
+                    await self._messages.flush_tracked()
                 await self.session.commit()
                 logger.debug("Transaction committed")
             except Exception as e:
@@ -97,8 +132,21 @@ class SQLAlchemyUnitOfWork(UnitOfWork):
         else:
             logger.debug("No active transaction to commit")
     
+    async def release(self) -> None:
+        """
+        End the current transaction early so its pooled connection is
+        returned while the caller waits on non-DB I/O (e.g. an aggregator
+        HTTP call). Tracked messages are written first. The session begins
+        a new transaction on its next query; the enclosing ``async with``
+        commits that one as usual.
+        """
+        await self.commit()
+    
     async def rollback(self) -> None:
         """Rollback transaction"""
+        self._after_commit = []
+        if self._messages is not None:
+            self._messages.discard_tracked()
         if self.session.in_transaction():
             try:
                 await self.session.rollback()
@@ -110,35 +158,35 @@ class SQLAlchemyUnitOfWork(UnitOfWork):
             logger.debug("No active transaction to rollback")
     
     @property
-    def campaigns(self) -> CampaignRepository:
+    def campaigns(self) -> SQLAlchemyCampaignRepository:
         """Get campaign repository"""
         if self._campaigns is None:
             self._campaigns = SQLAlchemyCampaignRepository(self.session)
         return self._campaigns
     
     @property
-    def messages(self) -> MessageRepository:
+    def messages(self) -> SQLAlchemyMessageRepository:
         """Get message repository"""
         if self._messages is None:
             self._messages = SQLAlchemyMessageRepository(self.session)
         return self._messages
     
     @property
-    def events(self) -> EventRepository:
+    def events(self) -> SQLAlchemyEventRepository:
         """Get event repository"""
         if self._events is None:
             self._events = SQLAlchemyEventRepository(self.session)
         return self._events
     
     @property
-    def opt_outs(self) -> OptOutRepository:
+    def opt_outs(self) -> SQLAlchemyOptOutRepository:
         """Get opt-out repository"""
         if self._opt_outs is None:
             self._opt_outs = SQLAlchemyOptOutRepository(self.session)
         return self._opt_outs
     
     @property
-    def templates(self) -> TemplateRepository:
+    def templates(self) -> SQLAlchemyTemplateRepository:
         """Get template repository"""
         if self._templates is None:
             self._templates = SQLAlchemyTemplateRepository(self.session)
@@ -6,22 +6,30 @@ Supports job queuing, priority, retry logic, and Dead Letter Queue.
 
 Features:
     - Priority queues
-    - Delayed jobs
+    - Delayed jobs (per-delay TTL holding queues, no broker plugin needed)
     - Automatic retries with exponential backoff
     - Dead Letter Queue for failed jobs
     - At-least-once delivery guarantee
     - Prefetch control
+    - Event notifications on the "rcs.events" topic exchange
 """
 
 import asyncio
-import json
-from typing import Optional, Dict, Any, Callable, List
-from datetime import datetime, timedelta
+import math
+from typing import Optional, Dict, Any, Awaitable, Callable, Iterable, List, Set
+from datetime import datetime, timedelta, timezone
 import logging
 
 import aio_pika
+import orjson
 from aio_pika import Message, DeliveryMode, ExchangeType
-from aio_pika.abc import AbstractChannel, AbstractConnection, AbstractQueue
+from aio_pika.abc import (
+    AbstractChannel,
+    AbstractConnection,
+    AbstractExchange,
+    AbstractIncomingMessage,
+    AbstractQueue,
+)
 
 from apps.core.ports.queue import (
     QueuePort,
@@ -32,12 +40,30 @@ from apps.core.ports.queue import (
     QueueException,
     QueueConnectionException,
     JobNotFoundException,
+    encode_job_body,
+    TRANSIENT_QUEUE_SUFFIX,
 )
 
 
 logger = logging.getLogger(__name__)
 
 
+def _delivery_mode(queue_name: str) -> DeliveryMode:
+    """
+    Persist every job except those bound for a transient ".bulk" queue.
+
+    Only bulk message-dispatch jobs are routed there (route_by_priority):
+    their rows in the messages table are the source of truth, so a job
+    lost in a broker restart is a PENDING row the scheduler republishes
+    once broker_restarted() reports the restart. Every other job (campaign orchestration,
+    webhooks, HIGH/URGENT dispatch) has no such backstop and stays
+    persistent whatever its priority.
+    """
+    if queue_name.endswith(TRANSIENT_QUEUE_SUFFIX):
+        return DeliveryMode.NOT_PERSISTENT
+    return DeliveryMode.PERSISTENT
+
+
 class RabbitMQAdapter(QueuePort):
     """
     RabbitMQ implementation of queue port
@@ -56,10 +82,14 @@ class RabbitMQAdapter(QueuePort):
         >>> await queue.enqueue(QueueMessage(...))
     """
     
+    # Idle time after its TTL before an unused delay queue is deleted
+    _DELAY_QUEUE_GRACE_MS = 60_000
+    
     def __init__(
         self,
         url: str,
         prefetch_count: int = 10,
+        confirm_batch_size: int = 500,
     ):
         """
         Initialize RabbitMQ adapter
@@ -67,13 +97,19 @@ class RabbitMQAdapter(QueuePort):
         Args:
             url: RabbitMQ connection URL
             prefetch_count: Number of messages to prefetch per worker
+            confirm_batch_size: Publishes per publisher-confirm barrier
         """
         self.url = url
         self.prefetch_count = prefetch_count
+        self.confirm_batch_size = confirm_batch_size
         
         self.connection: Optional[AbstractConnection] = None
         self.channel: Optional[AbstractChannel] = None
+        self._confirm_channel: Optional[AbstractChannel] = None
+        self._confirm_lock = asyncio.Lock()
         self.dlx_exchange = "dlx"
+        self.events_exchange = "rcs.events"
+        self._events: Optional[AbstractExchange] = None
         
         # Queue declarations cache
         self._declared_queues: set = set()
@@ -101,6 +137,13 @@ class RabbitMQAdapter(QueuePort):
                     durable=True,
                 )
                 
+                # Event notifications (routing key e.g. message.sent.<campaign>.<id>)
+                self._events = await self.channel.declare_exchange(
+                    self.events_exchange,
+                    ExchangeType.TOPIC,
+                    durable=True,
+                )
+                
                 logger.info("Connected to RabbitMQ")
                 return
                 
@@ -121,6 +164,9 @@ class RabbitMQAdapter(QueuePort):
         """
         Add job to queue
         
+        Published on the confirm channel: returns once the broker has
+        taken the job, so a caller may then ack whatever it replaces.
+        
         Args:
             message: Job to enqueue
             
@@ -132,21 +178,25 @@ class RabbitMQAdapter(QueuePort):
         try:
             # Ensure queue exists
             await self._declare_queue(message.queue_name)
+            routing_key = message.queue_name
+            if message.delay:
+                routing_key = await self._declare_delay_queue(
+                    message.queue_name, message.delay
+                )
             
             # Build message
-            body = json.dumps({
-                "id": message.id,
-                "payload": message.payload,
-                "metadata": message.metadata or {},
-                "enqueued_at": datetime.utcnow().isoformat(),
-                "max_retries": message.max_retries,
-                "retry_backoff": message.retry_backoff,
-            }).encode()
+            body = encode_job_body(
+                message.id,
+                message.payload,
+                max_retries=message.max_retries,
+                retry_backoff=message.retry_backoff,
+                metadata=message.metadata,
+            )
             
             # Create AMQP message
             amqp_message = Message(
                 body=body,
-                delivery_mode=DeliveryMode.PERSISTENT,
+                delivery_mode=_delivery_mode(message.queue_name),
                 priority=message.priority.value,
                 message_id=message.id,
                 headers={
@@ -155,19 +205,11 @@ class RabbitMQAdapter(QueuePort):
                 },
             )
             
-            # Set delay if needed
-            if message.delay:
-                amqp_message.headers["x-delay"] = int(
-                    message.delay.total_seconds() * 1000
-                )
+            # Publish to queue (or its delay queue) and wait for the confirm
+            exchange = (await self._get_confirm_channel()).default_exchange
+            await exchange.publish(amqp_message, routing_key=routing_key)
             
-            # Publish to queue
-            await self.channel.default_exchange.publish(
-                amqp_message,
-                routing_key=message.queue_name,
-            )
-            
-            logger.debug(f"Enqueued job {message.id} to {message.queue_name}")
+            logger.debug(f"Enqueued job {message.id} to {routing_key}")
             
             return message.id
             
@@ -185,8 +227,8 @@ class RabbitMQAdapter(QueuePort):
         FIX (GAP 7): Old implementation was a plain for-loop — a failure
         halfway through left some messages enqueued and others not, with no
         way to roll back.  Now we:
-          1. Enable publisher confirms on a dedicated channel.
-          2. Publish all messages.
+          1. Publish on the shared publisher-confirm channel.
+          2. Publish in windows of confirm_batch_size messages.
           3. Wait for broker ACK on every message before returning.
         If any publish fails we raise immediately; the caller (orchestrator)
         can retry the whole batch safely because messages are idempotent by
@@ -203,58 +245,141 @@ class RabbitMQAdapter(QueuePort):
 
         await self._ensure_connected()
 
-        # Use a fresh channel with publisher confirms so we know every
-        # message was durably written to the broker before we return.
-        confirm_channel = await self.connection.channel(
-            publisher_confirms=True
-        )
         try:
-            await confirm_channel.set_qos(prefetch_count=self.prefetch_count)
-
-            job_ids: List[str] = []
-            for message in messages:
+            for queue_name in {m.queue_name for m in messages}:
                 # Ensure queue declared on main channel (cached)
-                await self._declare_queue(message.queue_name)
-
-                body = json.dumps({
-                    "id": message.id,
-                    "payload": message.payload,
-                    "metadata": message.metadata or {},
-                    "enqueued_at": datetime.utcnow().isoformat(),
-                    "max_retries": message.max_retries,
-                    "retry_backoff": message.retry_backoff,
-                }).encode()
-
-                amqp_message = Message(
-                    body=body,
-                    delivery_mode=DeliveryMode.PERSISTENT,
-                    priority=message.priority.value,
-                    message_id=message.id,
-                    headers={
-                        "x-max-retries": message.max_retries,
-                        "x-retry-count": 0,
-                    },
-                )
+                await self._declare_queue(queue_name)
 
-                # publish() on a confirm-channel returns a Confirmation;
-                # awaiting it blocks until the broker ACKs the message.
-                await confirm_channel.default_exchange.publish(
-                    amqp_message,
+            exchange = (await self._get_confirm_channel()).default_exchange
+            await self._publish_confirmed((
+                exchange.publish(
+                    Message(
+                        body=encode_job_body(
+                            message.id,
+                            message.payload,
+                            max_retries=message.max_retries,
+                            retry_backoff=message.retry_backoff,
+                            metadata=message.metadata,
+                        ),
+                        delivery_mode=_delivery_mode(message.queue_name),
+                        priority=message.priority.value,
+                        message_id=message.id,
+                        headers={
+                            "x-max-retries": message.max_retries,
+                            "x-retry-count": 0,
+                        },
+                    ),
                     routing_key=message.queue_name,
                 )
-                job_ids.append(message.id)
+                for message in messages
+            ))
 
             logger.info(
                 "Batch enqueued %d messages with publisher confirms",
-                len(job_ids),
+                len(messages),
             )
-            return job_ids
+            return [message.id for message in messages]
 
         except Exception as exc:
             logger.error("Batch enqueue failed: %s", exc)
             raise QueueException(f"Batch enqueue failed: {exc}") from exc
-        finally:
-            await confirm_channel.close()
+    
+    async def publish_many(
+        self,
+        queue_name: str,
+        bodies: List[bytes],
+        priority: QueuePriority = QueuePriority.MEDIUM,
+        message_ids: Optional[List[str]] = None,
+        max_retries: int = 3,
+    ) -> int:
+        """
+        Publish pre-serialized bodies on the shared confirm channel.
+
+        Each window of confirm_batch_size bodies is written to the channel
+        before any of its confirms is awaited, so a batch costs one
+        pipelined burst of frames and one wait for broker ACKs per window
+        rather than N publish/confirm round-trips.
+
+        Args:
+            queue_name: Target queue
+            bodies: Bodies built with encode_job_body()
+            priority: Priority for every job in the batch
+            message_ids: Optional job IDs (same order as bodies)
+            max_retries: Max delivery attempts per job
+
+        Returns:
+            Number of jobs published
+        """
+        if not bodies:
+            return 0
+
+        await self._ensure_connected()
+        await self._declare_queue(queue_name)
+
+        try:
+            exchange = (await self._get_confirm_channel()).default_exchange
+            ids = message_ids or [None] * len(bodies)
+            delivery_mode = _delivery_mode(queue_name)
+            await self._publish_confirmed((
+                exchange.publish(
+                    Message(
+                        body=body,
+                        delivery_mode=delivery_mode,
+                        priority=priority.value,
+                        message_id=job_id,
+                        headers={
+                            "x-max-retries": max_retries,
+                            "x-retry-count": 0,
+                        },
+                    ),
+                    routing_key=queue_name,
+                )
+                for body, job_id in zip(bodies, ids)
+            ))
+
+            logger.info(
+                "Published %d messages to %s with publisher confirms",
+                len(bodies),
+                queue_name,
+            )
+            return len(bodies)
+
+        except Exception as exc:
+            logger.error("Batch publish failed: %s", exc)
+            raise QueueException(f"Batch publish failed: {exc}") from exc
+    
+    async def _get_confirm_channel(self) -> AbstractChannel:
+        """
+        Return (or lazily open) the shared publisher-confirm channel.
+
+        Reused across batches: opening a channel + confirm.select per batch
+        cost extra round-trips before the first publish.
+        """
+        if self._confirm_channel is None or self._confirm_channel.is_closed:
+            async with self._confirm_lock:
+                if self._confirm_channel is None or self._confirm_channel.is_closed:
+                    self._confirm_channel = await self.connection.channel(
+                        publisher_confirms=True
+                    )
+        return self._confirm_channel
+    
+    async def _publish_confirmed(self, publishes: Iterable[Awaitable]) -> None:
+        """
+        Await publishes in windows of confirm_batch_size.
+
+        Each window's frames are written back-to-back and its confirms
+        awaited together — one barrier per window instead of one
+        round-trip per message, with at most confirm_batch_size
+        unconfirmed publishes (and buffered bodies) in flight.
+        """
+        window: List[Awaitable] = []
+        for publish in publishes:
+            window.append(publish)
+            if len(window) >= self.confirm_batch_size:
+                await asyncio.gather(*window)
+                window = []
+        if window:
+            await asyncio.gather(*window)
     
     async def dequeue(
         self,
@@ -282,7 +407,7 @@ class RabbitMQAdapter(QueuePort):
                 async for message in queue_iter:
                     async with message.process():
                         # Parse message
-                        data = json.loads(message.body.decode())
+                        data = orjson.loads(message.body)
                         
                         # Build job
                         job = QueueJob(
@@ -350,8 +475,8 @@ class RabbitMQAdapter(QueuePort):
         Returns:
             Job ID
         """
-        # Calculate delay
-        now = datetime.utcnow()
+        # Calculate delay (match scheduled_for's awareness: services pass UTC-aware)
+        now = datetime.now(timezone.utc) if scheduled_for.tzinfo else datetime.utcnow()
         if scheduled_for <= now:
             # Execute immediately
             return await self.enqueue(message)
@@ -487,7 +612,7 @@ class RabbitMQAdapter(QueuePort):
                         break
                     
                     # Parse message
-                    data = json.loads(message.body.decode())
+                    data = orjson.loads(message.body)
                     
                     job = QueueJob(
                         id=data["id"],
@@ -548,55 +673,183 @@ class RabbitMQAdapter(QueuePort):
             
             logger.info(f"Subscribing to queue: {queue_name}")
             
-            # Consume messages
-            async with queue.iterator() as queue_iter:
-                async for message in queue_iter:
-                    try:
-                        async with message.process(
-                            requeue=True,
-                            reject_on_redelivered=False,
-                        ):
-                            # Parse message
-                            data = json.loads(message.body.decode())
-                            
-                            # Build job
-                            job = QueueJob(
-                                id=data["id"],
-                                queue_name=queue_name,
-                                payload=data["payload"],
-                                attempt=message.headers.get("x-retry-count", 0) + 1,
-                                max_retries=data["max_retries"],
-                                enqueued_at=datetime.fromisoformat(
-                                    data["enqueued_at"]
-                                ),
-                                metadata=data.get("metadata", {}),
-                            )
-                            
-                            # Call handler
-                            await handler(job)
-                            
-                    except Exception as e:
-                        logger.error(f"Handler error for job {data.get('id')}: {e}")
-                        
-                        # Check retry count
-                        retry_count = message.headers.get("x-retry-count", 0)
-                        max_retries = message.headers.get("x-max-retries", 3)
-                        
-                        if retry_count < max_retries:
-                            # Requeue with incremented retry count
-                            await message.reject(requeue=True)
-                        else:
-                            # Move to DLQ
-                            await message.reject(requeue=False)
+            # Consume messages. Each delivery is handled in its own task so
+            # up to `prefetch` jobs run concurrently (the broker stops
+            # pushing once that many are unacked); awaiting the handler
+            # inline would process one job at a time regardless.
+            handlers: Set[asyncio.Task] = set()
+            try:
+                async with queue.iterator() as queue_iter:
+                    async for message in queue_iter:
+                        task = asyncio.create_task(
+                            self._handle_delivery(queue_name, message, handler)
+                        )
+                        handlers.add(task)
+                        task.add_done_callback(handlers.discard)
+            finally:
+                # Iterator closed (shutdown, cancel, channel error): let the
+                # in-flight jobs finish and ack/reject before returning
+                if handlers:
+                    await asyncio.gather(*handlers, return_exceptions=True)
                             
         except Exception as e:
             logger.exception(f"Subscription error: {e}")
             raise QueueException(f"Subscribe failed: {e}")
     
+    async def _handle_delivery(
+        self,
+        queue_name: str,
+        message: AbstractIncomingMessage,
+        handler: Callable[[QueueJob], None],
+    ) -> None:
+        """
+        Decode one delivery, run the handler, ack/reject it
+
+        A failure is settled in _retry_or_dead_letter() only; process()
+        acks a delivery nothing settled (success) and, with
+        ignore_processed=True, leaves settled ones alone. It requeues a
+        delivery only if settling it raised.
+        """
+        data: Dict[str, Any] = {}
+        try:
+            async with message.process(requeue=True, ignore_processed=True):
+                try:
+                    # Parse message
+                    data = orjson.loads(message.body)
+
+                    # Build job
+                    job = QueueJob(
+                        id=data["id"],
+                        queue_name=queue_name,
+                        payload=data["payload"],
+                        attempt=message.headers.get("x-retry-count", 0) + 1,
+                        max_retries=data["max_retries"],
+                        enqueued_at=datetime.fromisoformat(
+                            data["enqueued_at"]
+                        ),
+                        metadata=data.get("metadata", {}),
+                    )
+
+                    # Call handler
+                    await handler(job)
+
+                except Exception as e:
+                    logger.error(f"Handler error for job {data.get('id')}: {e}")
+                    await self._retry_or_dead_letter(queue_name, message)
+
+        except Exception as e:
+            # Settling failed; process() has requeued the delivery
+            logger.error(f"Could not settle job {data.get('id')}: {e}")
+
+    async def _retry_or_dead_letter(
+        self,
+        queue_name: str,
+        message: AbstractIncomingMessage,
+    ) -> None:
+        """
+        Retry a failed delivery or move it to the DLQ
+
+        A requeued delivery keeps its headers, so the retry is published
+        as a copy with x-retry-count incremented (on the confirm channel,
+        before the original is acked). Once x-max-retries is reached the
+        delivery is rejected to the dead-letter exchange.
+        """
+        retry_count = message.headers.get("x-retry-count", 0)
+        max_retries = message.headers.get("x-max-retries", 3)
+
+        if retry_count >= max_retries:
+            # Move to DLQ
+            await message.reject(requeue=False)
+            return
+
+        exchange = (await self._get_confirm_channel()).default_exchange
+        await exchange.publish(
+            Message(
+                body=message.body,
+                delivery_mode=_delivery_mode(queue_name),
+                priority=message.priority,
+                message_id=message.message_id,
+                headers={**message.headers, "x-retry-count": retry_count + 1},
+            ),
+            routing_key=queue_name,
+        )
+        await message.ack()
+    
+    async def publish_event(self, routing_key: str, payload: Dict[str, Any]) -> None:
+        """
+        Publish a notification to the rcs.events topic exchange
+        
+        Events are signals for whoever is listening, not jobs: they are
+        transient, unconfirmed, and dropped by the broker when no queue
+        is bound for the routing key.
+        
+        Args:
+            routing_key: Topic, e.g. "message.sent.<campaign_id>.<message_id>"
+            payload: JSON-serialisable event body
+        """
+        await self._ensure_connected()
+        await self._events.publish(
+            Message(
+                body=orjson.dumps(payload),
+                content_type="application/json",
+                delivery_mode=DeliveryMode.NOT_PERSISTENT,
+            ),
+            routing_key=routing_key,
+        )
+    
+    async def event_queue(self, binding_keys: Iterable[str]) -> AbstractQueue:
+        """
+        Declare a private queue receiving rcs.events for the given topics
+        
+        The queue is exclusive and auto-deleted with the connection, so a
+        listener only sees events published after this call.
+        
+        Args:
+            binding_keys: Topic patterns, e.g. ["message.*.<campaign_id>.*"]
+            
+        Returns:
+            Queue to consume (queue.iterator())
+        """
+        await self._ensure_connected()
+        queue = await self.channel.declare_queue(exclusive=True, auto_delete=True)
+        for key in binding_keys:
+            await queue.bind(self._events, routing_key=key)
+        return queue
+    
+    async def broker_restarted(self, sentinel: str) -> bool:
+        """
+        Report whether the broker has restarted since the last check
+        
+        `sentinel` names a non-durable queue that is never auto-deleted, so
+        it lives exactly as long as the broker process: finding it missing
+        means everything on transient queues was lost with it (also true
+        the first time a broker is ever checked). It is re-declared before
+        returning. Use a short-lived adapter for this: a robust connection
+        re-declares its queues on reconnect and would hide the restart.
+        
+        Returns:
+            True if the sentinel had to be (re)created
+        """
+        await self._ensure_connected()
+        
+        probe = await self.connection.channel()
+        try:
+            await probe.declare_queue(sentinel, passive=True)
+        except aio_pika.exceptions.ChannelNotFoundEntity:
+            # The broker closed the probe channel with the 404
+            await self.channel.declare_queue(
+                sentinel, durable=False, auto_delete=False
+            )
+            return True
+        
+        await probe.close()
+        return False
+    
     async def close(self) -> None:
         """Close connection"""
         if self.connection:
             await self.connection.close()
+            self._confirm_channel = None
             logger.info("RabbitMQ connection closed")
     
     async def _ensure_connected(self) -> None:
@@ -604,8 +857,40 @@ class RabbitMQAdapter(QueuePort):
         if not self.connection or self.connection.is_closed:
             await self.connect()
     
+    async def _declare_delay_queue(
+        self,
+        queue_name: str,
+        delay: timedelta,
+    ) -> str:
+        """
+        Declare the holding queue for jobs delayed by `delay` on queue_name
+        
+        A job published there sits until the queue's TTL expires and is then
+        dead-lettered through the default exchange onto queue_name. Every
+        queue has a single TTL (delays rounded up to whole seconds), so
+        jobs expire in publish order. Holding queues delete themselves once
+        idle for TTL + _DELAY_QUEUE_GRACE_MS; publishing does not reset
+        that timer but declaring does, so this is not cached.
+        
+        Returns:
+            Name of the delay queue to publish to
+        """
+        seconds = max(1, math.ceil(delay.total_seconds()))
+        delay_queue = f"{queue_name}.delay.{seconds}s"
+        await self.channel.declare_queue(
+            delay_queue,
+            durable=not queue_name.endswith(TRANSIENT_QUEUE_SUFFIX),
+            arguments={
+                "x-message-ttl": seconds * 1000,
+                "x-dead-letter-exchange": "",
+                "x-dead-letter-routing-key": queue_name,
+                "x-expires": seconds * 1000 + self._DELAY_QUEUE_GRACE_MS,
+            },
+        )
+        return delay_queue
+    
     async def _declare_queue(self, queue_name: str) -> None:
-        """Declare queue with DLQ"""
+        """Declare queue with DLQ (".bulk" queues are transient, DLQs durable)"""
         if queue_name in self._declared_queues:
             return
         
@@ -619,7 +904,7 @@ class RabbitMQAdapter(QueuePort):
         # Declare main queue with DLX
         await self.channel.declare_queue(
             queue_name,
-            durable=True,
+            durable=not queue_name.endswith(TRANSIENT_QUEUE_SUFFIX),
             arguments={
                 "x-dead-letter-exchange": self.dlx_exchange,
                 "x-dead-letter-routing-key": dlq_name,
@@ -385,7 +385,12 @@ async def upload_csv(
         skip_cols = {"phone_number", "phone"} | {f"var_{k}" for k in range(1, j)}
         metadata = {k: v for k, v in row.items() if k not in skip_cols and v}
 
-        contact = Contact(phone_number=phone, metadata=metadata)
+        try:
+            contact = Contact(phone_number=phone, metadata=metadata)
+        except ValueError as e:
+            errors.append(f"Row {i}: {e}")
+            skipped += 1
+            continue
         contact.variables = variables
         audience.contacts.append(contact)
         imported += 1
@@ -413,7 +418,10 @@ async def add_contacts(
     audience = await get_audience_or_404(audience_id, tenant_id, session)
 
     for c in request.contacts:
-        contact = Contact(phone_number=c.phone_number, metadata=c.metadata)
+        try:
+            contact = Contact(phone_number=c.phone_number, metadata=c.metadata)
+        except ValueError as e:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
         contact.variables = c.variables      # FIX: persist variables
         audience.contacts.append(contact)
 
@@ -30,6 +30,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from apps.adapters.db.postgres import get_db_session
 from apps.adapters.db.unit_of_work import SQLAlchemyUnitOfWork
 from apps.adapters.queue.rabbitmq import RabbitMQAdapter
+from apps.adapters.cache.scheduled_campaigns import get_scheduled_index
 from apps.core.domain.campaign import CampaignStatus, CampaignType, Priority
 from apps.core.services.campaign_service import CampaignService
 from apps.core.config import get_settings
@@ -296,7 +297,7 @@ async def schedule_campaign(
 
     try:
         uow = SQLAlchemyUnitOfWork(session)
-        service = CampaignService(uow, queue)
+        service = CampaignService(uow, queue, scheduled_index=get_scheduled_index())
 
         campaign = await service.get_campaign(campaign_id)
         if not campaign or campaign.tenant_id != tenant_id:
@@ -334,7 +335,7 @@ async def activate_campaign(
 
     try:
         uow = SQLAlchemyUnitOfWork(session)
-        service = CampaignService(uow, queue)
+        service = CampaignService(uow, queue, scheduled_index=get_scheduled_index())
 
         campaign = await service.get_campaign(campaign_id)
         if not campaign or campaign.tenant_id != tenant_id:
@@ -441,7 +442,7 @@ async def cancel_campaign(
 
     try:
         uow = SQLAlchemyUnitOfWork(session)
-        service = CampaignService(uow, queue)
+        service = CampaignService(uow, queue, scheduled_index=get_scheduled_index())
 
         campaign = await service.get_campaign(campaign_id)
         if not campaign or campaign.tenant_id != tenant_id:
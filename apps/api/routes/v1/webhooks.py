@@ -26,6 +26,8 @@ Template approval DLR:
 import logging
 from typing import Dict, Any
 
+import orjson
+
 from fastapi import APIRouter, Request, HTTPException, status, BackgroundTasks
 from pydantic import BaseModel
 
@@ -83,9 +85,7 @@ async def rcssms_webhook(
                 detail="Invalid webhook signature",
             )
 
-        import json as _json
-        payload = _json.loads(raw_body)
-        headers = dict(request.headers)
+        payload = orjson.loads(raw_body)
 
         # Support both DLR types
         webhook_id = (
@@ -104,7 +104,6 @@ async def rcssms_webhook(
             queue_webhook_for_processing,
             aggregator="rcssms",
             payload=payload,
-            headers=headers,
         )
 
         return WebhookResponse(
@@ -135,8 +134,7 @@ async def generic_webhook(
         aggregator: Name of aggregator (rcssms, mock, etc.)
     """
     try:
-        payload = await request.json()
-        headers = dict(request.headers)
+        payload = orjson.loads(await request.body())
 
         logger.info(f"Received generic webhook from {aggregator}")
 
@@ -144,7 +142,6 @@ async def generic_webhook(
             queue_webhook_for_processing,
             aggregator=aggregator,
             payload=payload,
-            headers=headers,
         )
 
         return WebhookResponse(
@@ -179,15 +176,16 @@ async def test_webhook():
 async def queue_webhook_for_processing(
     aggregator: str,
     payload: Dict[str, Any],
-    headers: Dict[str, str],
 ) -> None:
     """
     Queue webhook for asynchronous processing by webhook_processor worker.
 
+    Signatures are checked at ingress (rcssms_webhook) before this runs, so
+    only the parsed body is queued — HTTP headers are not forwarded.
+
     Args:
         aggregator: Aggregator name (rcssms, etc.)
         payload:    Webhook POST body
-        headers:    HTTP headers
     """
     try:
         settings = get_settings()
@@ -205,7 +203,6 @@ async def queue_webhook_for_processing(
                 "webhook_id": webhook_id,
                 "aggregator": aggregator,
                 "payload": payload,
-                "headers": headers,
             },
             priority=QueuePriority.HIGH,
         )
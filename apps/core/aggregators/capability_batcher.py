@@ -0,0 +1,104 @@
+"""
+Batching RCS Capability Client
+
+Coalesces single-number RCS capability checks from concurrent dispatcher
+jobs into micro-batches, so one aggregator call covers up to `max_batch`
+numbers instead of one HTTP round-trip per message.
+
+How it works:
+    check(phone) submits the number to a DelayedBatcher and awaits it.
+    The batcher flushes once `max_batch` checks are pending or
+    `max_wait_ms` has elapsed since the first; each flush calls
+    aggregator.check_rcs_capability(unique_phones) once and answers every
+    waiting check from the result.
+
+With a CapabilityCache attached, check() answers L1 hits without queueing,
+and each flush consults the cache (L1, then Redis MGET) before calling the
+aggregator for the remaining numbers, writing fresh results back through.
+
+Usage (in MessageDispatcher.start):
+    self.capability_batcher = BatchingCapabilityClient(
+        self.aggregator, cache=CapabilityCache(settings.redis.url)
+    )
+    ...
+    service = DeliveryService(uow, aggregator, queue,
+                              capability_checker=self.capability_batcher)
+"""
+
+import logging
+from typing import Dict, List, Optional, Union
+
+from apps.core.aggregators.capability_cache import CapabilityCache
+from apps.core.ports.aggregator import AggregatorPort
+from apps.core.resilience.delayed_batcher import DelayedBatcher
+
+
+logger = logging.getLogger(__name__)
+
+
+class BatchingCapabilityClient:
+    """
+    Micro-batching wrapper around AggregatorPort.check_rcs_capability.
+
+    Args:
+        aggregator:   Aggregator whose check_rcs_capability accepts a list
+        max_batch:    Flush when this many checks are pending
+        max_wait_ms:  Flush at most this long after the first pending check
+        cache:        Optional TTL cache consulted before the aggregator
+    """
+
+    def __init__(
+        self,
+        aggregator: AggregatorPort,
+        max_batch: int = 100,
+        max_wait_ms: int = 20,
+        cache: Optional[CapabilityCache] = None,
+    ):
+        self.aggregator = aggregator
+        self.cache = cache
+        self._batcher: DelayedBatcher[str, bool] = DelayedBatcher(
+            self._flush,
+            max_batch_size=max_batch,
+            batch_interval_ms=max_wait_ms,
+        )
+
+    async def check(self, phone_number: str) -> bool:
+        """Return True if phone_number is RCS capable (batched)."""
+        if self.cache:
+            cached = self.cache.get_local(phone_number)
+            if cached is not None:
+                return cached
+
+        return await self._batcher.submit(phone_number)
+
+    async def close(self) -> None:
+        """Stop the batcher (failing any checks still waiting)."""
+        await self._batcher.close()
+
+        if self.cache:
+            await self.cache.close()
+
+    async def _flush(self, batch: List[str]) -> List[Union[bool, Exception]]:
+        """Run one aggregator call for the batch; one answer per check."""
+        phones = list(dict.fromkeys(batch))
+
+        capable: Dict[str, bool] = {}
+        if self.cache:
+            capable = await self.cache.get_many(phones)
+            phones = [p for p in phones if p not in capable]
+
+        if phones:
+            try:
+                results = await self.aggregator.check_rcs_capability(phones)
+            except Exception as e:
+                logger.warning(f"Batched capability check failed ({len(phones)} numbers): {e}")
+                # Cached numbers are still answered; only the rest fail
+                return [capable.get(phone, e) for phone in batch]
+
+            fresh = {r.phone_number: r.rcs_enabled for r in results}
+            if self.cache:
+                await self.cache.set_many(fresh)
+            capable.update(fresh)
+
+        logger.debug(f"Capability batch flushed: {len(batch)} checks, {len(phones)} numbers")
+        return [capable.get(phone, False) for phone in batch]
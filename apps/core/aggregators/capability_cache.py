@@ -0,0 +1,137 @@
+"""
+RCS Capability Cache
+
+Two-level cache for RCS capability results, keyed by phone number:
+
+  L1: in-process cachetools.TTLCache  (per worker, no network hop)
+  L2: Redis  "rcs_capable:{phone}" -> "1" | "0"  with the same TTL
+      (shared across dispatcher workers, read with one MGET per batch)
+
+Campaign sends have strong temporal locality on phone numbers (retries,
+fallbacks, overlapping audiences), so most checks never reach the
+aggregator. Writes go through to both layers.
+
+Redis is skipped for batches smaller than `redis_min_batch` — for one or
+two numbers the extra round-trip costs about as much as it saves — and
+every Redis error degrades to L1-only rather than failing the send.
+"""
+
+import asyncio
+import logging
+from typing import Dict, List, Optional
+
+import redis.asyncio as aioredis
+from cachetools import TTLCache
+
+
+logger = logging.getLogger(__name__)
+
+
+class CapabilityCache:
+    """
+    In-memory + Redis TTL cache of phone -> RCS capable.
+
+    Args:
+        redis_url:        Redis URL, or None for in-process only
+        ttl_seconds:      Lifetime of a cached result in both layers
+        maxsize:          L1 entry limit
+        redis_min_batch:  Minimum L1 misses before consulting Redis
+    """
+
+    _PREFIX = "rcs_capable"
+
+    def __init__(
+        self,
+        redis_url: Optional[str] = None,
+        ttl_seconds: int = 600,
+        maxsize: int = 100_000,
+        redis_min_batch: int = 3,
+    ):
+        self.ttl_seconds = ttl_seconds
+        self.redis_min_batch = redis_min_batch
+        self._local: TTLCache = TTLCache(maxsize=maxsize, ttl=ttl_seconds)
+        self._redis_url = redis_url
+        self._redis: Optional[aioredis.Redis] = None
+        self._lock = asyncio.Lock()
+
+    def _key(self, phone_number: str) -> str:
+        return f"{self._PREFIX}:{phone_number}"
+
+    async def _redis_conn(self) -> Optional[aioredis.Redis]:
+        """Return (or lazily create) the Redis connection."""
+        if self._redis_url is None:
+            return None
+        if self._redis is None:
+            async with self._lock:
+                if self._redis is None:
+                    self._redis = await aioredis.from_url(
+                        self._redis_url,
+                        decode_responses=True,
+                        socket_connect_timeout=2,
+                        socket_timeout=2,
+                    )
+        return self._redis
+
+    async def close(self) -> None:
+        """Close the Redis connection."""
+        if self._redis:
+            await self._redis.aclose()
+            self._redis = None
+
+    def get_local(self, phone_number: str) -> Optional[bool]:
+        """L1 lookup only (no await, no network)."""
+        return self._local.get(phone_number)
+
+    async def get_many(self, phone_numbers: List[str]) -> Dict[str, bool]:
+        """
+        Look up several numbers: L1 first, then one Redis MGET for misses.
+
+        Returns:
+            Mapping for the numbers that were found (misses are omitted)
+        """
+        found: Dict[str, bool] = {}
+        misses: List[str] = []
+        for phone in phone_numbers:
+            cached = self._local.get(phone)
+            if cached is None:
+                misses.append(phone)
+            else:
+                found[phone] = cached
+
+        if len(misses) < self.redis_min_batch:
+            return found
+
+        try:
+            r = await self._redis_conn()
+            if r is None:
+                return found
+            values = await r.mget([self._key(p) for p in misses])
+        except Exception as e:
+            logger.warning(f"Capability cache Redis read failed: {e}")
+            return found
+
+        for phone, value in zip(misses, values):
+            if value is not None:
+                capable = value == "1"
+                self._local[phone] = capable
+                found[phone] = capable
+
+        return found
+
+    async def set_many(self, results: Dict[str, bool]) -> None:
+        """Write results through to L1 and Redis."""
+        if not results:
+            return
+
+        self._local.update(results)
+
+        try:
+            r = await self._redis_conn()
+            if r is None:
+                return
+            async with r.pipeline(transaction=False) as pipe:
+                for phone, capable in results.items():
+                    pipe.set(self._key(phone), "1" if capable else "0", ex=self.ttl_seconds)
+                await pipe.execute()
+        except Exception as e:
+            logger.warning(f"Capability cache Redis write failed: {e}")
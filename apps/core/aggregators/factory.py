@@ -29,7 +29,10 @@ class AggregatorFactory:
     """Factory for creating aggregator adapters."""
 
     @staticmethod
-    def create_aggregator(settings: Settings = None) -> AggregatorPort:
+    def create_aggregator(
+        settings: Settings = None,
+        max_connections: int = 100,
+    ) -> AggregatorPort:
         """
         Create the primary RCS aggregator (rcssms.in).
 
@@ -37,6 +40,7 @@ class AggregatorFactory:
 
         Args:
             settings: Application settings. If None, uses cached settings.
+            max_connections: HTTP connection pool size for the adapter
 
         Returns:
             RcsSmsAdapter or MockAdapter
@@ -68,6 +72,7 @@ class AggregatorFactory:
                 send_url=settings.rcssms.send_url,
                 token_url=settings.rcssms.token_url,
                 template_url=settings.rcssms.template_url,
+                max_connections=max_connections,
             )
 
         logger.error("❌ No RCS aggregator configured and MOCK is disabled")
@@ -77,7 +82,10 @@ class AggregatorFactory:
         )
 
     @staticmethod
-    def create_sms_adapter(settings: Settings = None) -> Optional[AggregatorPort]:
+    def create_sms_adapter(
+        settings: Settings = None,
+        max_connections: int = 20,
+    ) -> Optional[AggregatorPort]:
         """
         Create the SMS fallback adapter (smsidea.co.in).
 
@@ -88,6 +96,7 @@ class AggregatorFactory:
 
         Args:
             settings: Application settings. If None, uses cached settings.
+            max_connections: HTTP connection pool size for the adapter
 
         Returns:
             SmsIdeaAdapter, MockAdapter (in mock mode), or None
@@ -119,6 +128,7 @@ class AggregatorFactory:
                 timeout=settings.smsidea.timeout,
                 send_url=settings.smsidea.send_url,
                 balance_url=settings.smsidea.balance_url,
+                max_connections=max_connections,
             )
 
         logger.warning(
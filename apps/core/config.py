@@ -8,6 +8,7 @@ from functools import lru_cache
 from pathlib import Path
 from typing import Optional, List, Dict, Any
 from pydantic import BaseModel, Field
+import logging
 import os
 import yaml
 from dotenv import load_dotenv
@@ -26,6 +27,8 @@ class DatabaseConfig(BaseModel):
     password: str = "postgres"
     pool_size: int = 20
     max_overflow: int = 10
+    # Compiled-SQL cache entries per engine (SQLAlchemy default: 500)
+    query_cache_size: int = 1200
     echo: bool = False
 
     @property
@@ -326,17 +329,20 @@ def _apply_env_overrides(config: Dict[str, Any]) -> Dict[str, Any]:
     return config
 
 
-@lru_cache()
+@lru_cache(maxsize=1)
 def get_settings() -> Settings:
+    """Load, validate and memoize settings (built once per process)."""
     environment = os.getenv("ENVIRONMENT", "dev")
     config = _load_yaml(environment)
     config = _apply_env_overrides(config)
     config["environment"] = environment
     
-    # DEBUG
     db_cfg = config.get("database", {})
-    print(f"DEBUG_CONFIG: port={db_cfg.get('port')}, user={db_cfg.get('username')}, env_port={os.getenv('DB_PORT')}")
-    
+    logging.getLogger(__name__).debug(
+        "Database config: port=%s, user=%s, env_port=%s",
+        db_cfg.get("port"), db_cfg.get("username"), os.getenv("DB_PORT"),
+    )
+
     settings = Settings(**config)
     _validate_settings(settings)
     return settings
@@ -16,12 +16,19 @@ Audience Types:
     - SUPPRESSION: Exclude list (DND, opt-outs)
 """
 
+import re
 from typing import List, Dict, Any, Optional
-from uuid import UUID, uuid4
+from uuid import UUID
 from datetime import datetime
 from enum import Enum
 from dataclasses import dataclass, field
 
+from apps.core.domain.ids import uuid7
+
+
+# E.164: '+', country code (no leading 0), up to 15 digits in total
+_PHONE_RE = re.compile(r"^\+[1-9]\d{6,14}$")
+
 
 class AudienceType(Enum):
     """Type of audience"""
@@ -52,7 +59,7 @@ class Contact:
     
     def __post_init__(self):
         """Validate phone number format"""
-        if not self.phone_number.startswith('+'):
+        if not _PHONE_RE.match(self.phone_number):
             raise ValueError(f"Phone number must be in E.164 format: {self.phone_number}")
 
 
@@ -132,7 +139,7 @@ class Audience:
         now = datetime.utcnow()
         
         audience = cls(
-            id=uuid4(),
+            id=uuid7(),
             tenant_id=tenant_id,
             name=name,
             audience_type=audience_type,
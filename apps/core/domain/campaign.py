@@ -21,7 +21,9 @@ from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from enum import Enum
 from typing import Optional, List, Dict, Any
-from uuid import UUID, uuid4
+from uuid import UUID
+
+from apps.core.domain.ids import uuid7
 
 
 class CampaignStatus(str, Enum):
@@ -77,10 +79,52 @@ class CampaignStats:
         return (self.messages_read / self.messages_delivered) * 100
 
 
-@dataclass
+@dataclass(slots=True)
+class StatsDelta:
+    """
+    Increment to apply to a campaign's stats counters
+
+    Fixed-slot replacement for ad-hoc {"messages_sent": 1} dicts on the
+    per-message hot path. Field names match the campaigns table columns;
+    zero fields are no-ops, so every delta maps onto one fixed UPDATE.
+
+    Example:
+        >>> delta = StatsDelta(messages_sent=1) + StatsDelta(messages_delivered=1)
+    """
+    messages_sent: int = 0
+    messages_delivered: int = 0
+    messages_failed: int = 0
+    messages_read: int = 0
+    fallback_triggered: int = 0
+    opt_outs: int = 0
+
+    def __add__(self, other: "StatsDelta") -> "StatsDelta":
+        return StatsDelta(
+            messages_sent=self.messages_sent + other.messages_sent,
+            messages_delivered=self.messages_delivered + other.messages_delivered,
+            messages_failed=self.messages_failed + other.messages_failed,
+            messages_read=self.messages_read + other.messages_read,
+            fallback_triggered=self.fallback_triggered + other.fallback_triggered,
+            opt_outs=self.opt_outs + other.opt_outs,
+        )
+
+    def is_empty(self) -> bool:
+        """True if applying this delta would change nothing"""
+        return not (
+            self.messages_sent or self.messages_delivered or self.messages_failed
+            or self.messages_read or self.fallback_triggered or self.opt_outs
+        )
+
+    @classmethod
+    def from_dict(cls, stats_update: Dict[str, int]) -> "StatsDelta":
+        """Build a delta from a legacy {"column": increment} dict"""
+        return cls(**{k: v for k, v in stats_update.items() if k in cls.__slots__})
+
+
+@dataclass(slots=True, frozen=True)
 class DomainEvent:
-    """Base class for domain events"""
-    event_id: UUID = field(default_factory=uuid4)
+    """Base class for domain events (immutable, no per-instance __dict__)"""
+    event_id: UUID = field(default_factory=uuid7)
     event_type: str = ""
     occurred_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
     aggregate_id: UUID = None
@@ -184,7 +228,7 @@ class Campaign:
             raise ValueError("Campaign name cannot be empty")
         
         campaign = cls(
-            id=uuid4(),
+            id=uuid7(),
             tenant_id=tenant_id,
             name=name.strip(),
             campaign_type=campaign_type,
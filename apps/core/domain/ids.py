@@ -0,0 +1,25 @@
+"""
+Time-ordered identifiers
+
+uuid7() returns RFC 9562 version-7 UUIDs: a 48-bit Unix millisecond
+timestamp followed by random bits. Ids created later sort later, so new
+primary keys land on the rightmost B-tree leaf instead of a random page
+— denser indexes and near-sequential heap/WAL writes on insert-heavy
+tables such as messages. The column type stays UUID.
+
+The database-side twin is uuid_generate_v7() (migration 010), used by
+server-side inserts.
+"""
+
+import os
+import time
+from uuid import UUID
+
+
+def uuid7() -> UUID:
+    """Generate a UUIDv7 (millisecond timestamp + 74 random bits)."""
+    value = (time.time_ns() // 1_000_000) << 80 | int.from_bytes(os.urandom(10), "big")
+    # version 7 in bits 76-79, RFC 4122 variant (0b10) in bits 62-63
+    value = (value & ~(0xF << 76)) | (0x7 << 76)
+    value = (value & ~(0x3 << 62)) | (0x2 << 62)
+    return UUID(int=value)
@@ -22,7 +22,9 @@ from dataclasses import dataclass, field
 from datetime import datetime, timezone, timedelta
 from enum import Enum
 from typing import Optional, List, Dict, Any
-from uuid import UUID, uuid4
+from uuid import UUID
+
+from apps.core.domain.ids import uuid7
 
 
 class MessageStatus(str, Enum):
@@ -193,6 +195,10 @@ class Message:
         self.retry_count: int = 0
         self.max_retries: int = 3
 
+        # Last RCS capability check for the recipient (reused on retries)
+        self.rcs_capable: Optional[bool] = None
+        self.rcs_checked_at: Optional[datetime] = None
+
         # 24h rolling window from creation
         self.expires_at: datetime = self.created_at + timedelta(hours=24)
 
@@ -222,7 +228,7 @@ class Message:
     ) -> "Message":
         """Factory method to create a new message"""
         return cls(
-            id=uuid4(),
+            id=uuid7(),
             campaign_id=campaign_id,
             tenant_id=tenant_id,
             recipient_phone=recipient_phone,
@@ -316,6 +322,19 @@ class Message:
             error_message=error_message
         )
 
+    def record_rcs_capability(self, capable: bool) -> None:
+        """Remember the result of an RCS capability check"""
+        self.rcs_capable = capable
+        self.rcs_checked_at = datetime.now(timezone.utc)
+
+    def cached_rcs_capability(self, ttl: timedelta) -> Optional[bool]:
+        """Last capability result if checked within ttl, else None"""
+        if self.rcs_checked_at is None or self.rcs_capable is None:
+            return None
+        if datetime.now(timezone.utc) - self.rcs_checked_at > ttl:
+            return None
+        return self.rcs_capable
+
     def mark_expired(self) -> None:
         """Mark message as expired (can transition from any non-terminal status)"""
         if not self.is_terminal():
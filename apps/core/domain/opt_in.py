@@ -22,7 +22,9 @@ from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
 from typing import Optional, List, Dict, Any
-from uuid import UUID, uuid4
+from uuid import UUID
+
+from apps.core.domain.ids import uuid7
 
 
 class ConsentType(str, Enum):
@@ -140,7 +142,7 @@ class OptIn:
             New OptIn instance
         """
         return cls(
-            id=uuid4(),
+            id=uuid7(),
             tenant_id=tenant_id,
             phone_number=phone_number,
         )
@@ -20,11 +20,13 @@ Example:
 """
 
 from dataclasses import dataclass, field
-from typing import Optional, List, Dict, Any, Set
-from uuid import UUID, uuid4
+from functools import lru_cache
+from typing import Optional, List, Dict, Any, Set, Sequence, Tuple, Union
+from uuid import UUID
 from datetime import datetime
 import re
 
+from apps.core.domain.ids import uuid7
 from apps.core.domain.message import MessageContent, RichCard, SuggestedAction
 
 
@@ -53,6 +55,74 @@ class TemplateVariable:
         return True
 
 
+_PLACEHOLDER_RE = re.compile(r"\{\{(\w+)\}\}")
+
+
+class CompiledTemplate:
+    """
+    Template text pre-split into literal fragments and variable slots
+
+    Parsing happens once per template version; rendering a recipient is a
+    single join over the fragments instead of one str.replace() pass per
+    variable.
+
+    Slots refer to the template's declared variable order, matching the
+    ordered `variables` list stored on each audience contact.
+
+    Example:
+        >>> compiled = template.compiled()
+        >>> compiled.render(["Alice", "#1234"])
+        'Thanks Alice! Order #1234 confirmed.'
+    """
+
+    __slots__ = ("_parts",)
+
+    def __init__(self, content: str, variable_names: Tuple[str, ...]):
+        position = {name: i for i, name in enumerate(variable_names)}
+        parts: List[Union[str, Tuple[int, str]]] = []
+        last = 0
+        for match in _PLACEHOLDER_RE.finditer(content):
+            if match.start() > last:
+                parts.append(content[last:match.start()])
+            index = position.get(match.group(1))
+            if index is None:
+                # Undeclared placeholder — keep it verbatim
+                parts.append(match.group(0))
+            else:
+                parts.append((index, match.group(0)))
+            last = match.end()
+        if last < len(content):
+            parts.append(content[last:])
+        self._parts = tuple(parts)
+
+    def render(self, values: Sequence[Any]) -> str:
+        """
+        Render with positional values
+
+        Slots without a value (short `values` list) keep their placeholder.
+        """
+        count = len(values)
+        return "".join(
+            part if part.__class__ is str
+            else (str(values[part[0]]) if part[0] < count else part[1])
+            for part in self._parts
+        )
+
+
+def _substitute(text: str, values: Dict[str, Any]) -> str:
+    """Replace {{name}} placeholders from a dict in one regex pass"""
+    return _PLACEHOLDER_RE.sub(
+        lambda m: str(values[m.group(1)]) if m.group(1) in values else m.group(0),
+        text,
+    )
+
+
+@lru_cache(maxsize=1024)
+def compile_template(content: str, variable_names: Tuple[str, ...]) -> CompiledTemplate:
+    """Compile (and cache) a template body for a given variable order"""
+    return CompiledTemplate(content, variable_names)
+
+
 class Template:
     """
     Message Template Value Object
@@ -154,7 +224,7 @@ class Template:
                 )
         
         template = cls(
-            id=uuid4(),
+            id=uuid7(),
             tenant_id=tenant_id,
             name=name.strip(),
             content=content.strip(),
@@ -187,10 +257,9 @@ class Template:
         # Validate required variables
         self._validate_variables(variable_values)
         
-        # Substitute variables in content
-        rendered_text = self.content
+        # Resolve values in declared order, then substitute in one pass
+        values = []
         for var in self.variables:
-            placeholder = f"{{{{{var.name}}}}}"
             value = variable_values.get(var.name, var.default_value or "")
             
             # Validate value
@@ -199,7 +268,9 @@ class Template:
                     f"Invalid value for variable '{var.name}': {value}"
                 )
             
-            rendered_text = rendered_text.replace(placeholder, value)
+            values.append(value)
+        
+        rendered_text = self.compiled().render(values)
         
         # Render rich card if present
         rich_card = None
@@ -221,6 +292,17 @@ class Template:
             suggestions=suggestions,
         )
     
+    def compiled(self) -> CompiledTemplate:
+        """
+        Get the compiled form of this template's text
+
+        Cached process-wide on (content, variable order), so an edited
+        template naturally gets a fresh compilation.
+        """
+        return compile_template(
+            self.content, tuple(v.name for v in self.variables)
+        )
+    
     def add_variable(
         self,
         name: str,
@@ -419,11 +501,7 @@ class Template:
         def substitute(text: Optional[str]) -> Optional[str]:
             if not text:
                 return None
-            result = text
-            for var_name, value in variable_values.items():
-                placeholder = f"{{{{{var_name}}}}}"
-                result = result.replace(placeholder, value)
-            return result
+            return _substitute(text, variable_values)
         
         return RichCard(
             title=substitute(self.rich_card_template.get("title")),
@@ -443,11 +521,7 @@ class Template:
             suggestion_data = {}
             for key, value in suggestion_template.items():
                 if isinstance(value, str):
-                    result = value
-                    for var_name, var_value in variable_values.items():
-                        placeholder = f"{{{{{var_name}}}}}"
-                        result = result.replace(placeholder, var_value)
-                    suggestion_data[key] = result
+                    suggestion_data[key] = _substitute(value, variable_values)
                 else:
                     suggestion_data[key] = value
             
@@ -11,6 +11,7 @@ Implementations:
 Design Pattern: Hexagonal Architecture (Ports & Adapters)
 """
 
+import asyncio
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from typing import Optional, List, Dict, Any
@@ -32,6 +33,9 @@ class SendMessageRequest:
     priority: str = "medium"
     callback_url: Optional[str] = None
     metadata: Dict[str, Any] = None
+    # "<message_id>:<retry_count>" — same key for a network-level retry of
+    # one attempt, new key for each deliberate retry
+    idempotency_key: Optional[str] = None
 
 
 @dataclass
@@ -115,6 +119,49 @@ class AggregatorPort(ABC):
         """
         pass
     
+    async def send_sms_batch(
+        self,
+        requests: List[SendMessageRequest],
+    ) -> List[SendMessageResponse]:
+        """
+        Send several SMS messages (fallback batches)
+        
+        Default: concurrent send_sms_message() calls over the adapter's
+        pooled client. Adapters with a real bulk endpoint may override.
+        Any exception raised for one request becomes a failed response for
+        that request only, so one bad number (or one dropped connection)
+        cannot fail the batch and hide the sends that did go out.
+        
+        Args:
+            requests: Message send requests (text only)
+            
+        Returns:
+            One response per request, in request order
+        """
+        results = await asyncio.gather(
+            *(self.send_sms_message(r) for r in requests),
+            return_exceptions=True,
+        )
+        responses = []
+        for result in results:
+            if isinstance(result, AggregatorException):
+                result = SendMessageResponse(
+                    success=False,
+                    error_code=result.error_code,
+                    error_message=str(result),
+                    retry_after=result.retry_after,
+                )
+            elif isinstance(result, Exception):
+                result = SendMessageResponse(
+                    success=False,
+                    error_code="UNEXPECTED_ERROR",
+                    error_message=f"{type(result).__name__}: {result}",
+                )
+            elif isinstance(result, BaseException):
+                raise result
+            responses.append(result)
+        return responses
+    
     @abstractmethod
     async def check_rcs_capability(
         self,
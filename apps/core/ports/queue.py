@@ -18,6 +18,8 @@ from typing import Optional, Dict, Any, Callable, List
 from datetime import datetime, timedelta
 from enum import Enum
 
+import orjson
+
 
 class QueuePriority(int, Enum):
     """Message priority levels"""
@@ -27,6 +29,24 @@ class QueuePriority(int, Enum):
     URGENT = 20
 
 
+# Queue-name convention: "<name>.bulk" is the transient (non-durable)
+# sibling of the durable queue "<name>"; see route_by_priority()
+TRANSIENT_QUEUE_SUFFIX = ".bulk"
+
+
+def route_by_priority(queue_name: str, priority: QueuePriority) -> str:
+    """
+    Pick the durable or transient variant of a queue for a job.
+
+    HIGH/URGENT jobs stay on the durable queue; LOW/MEDIUM bulk jobs go to
+    its transient ".bulk" sibling, which the broker never writes to disk.
+    Consumers must subscribe to both names.
+    """
+    if priority >= QueuePriority.HIGH:
+        return queue_name
+    return queue_name + TRANSIENT_QUEUE_SUFFIX
+
+
 @dataclass
 class QueueMessage:
     """Message to be enqueued"""
@@ -40,6 +60,41 @@ class QueueMessage:
     metadata: Dict[str, Any] = None
 
 
+def encode_job_body(
+    job_id: str,
+    payload: Dict[str, Any],
+    max_retries: int = 3,
+    retry_backoff: int = 60,
+    metadata: Optional[Dict[str, Any]] = None,
+    enqueued_at: Optional[str] = None,
+) -> bytes:
+    """
+    Serialize a job envelope for publish_many
+    
+    Produces the same body shape consumers decode into QueueJob, so callers
+    can pre-serialize a whole batch without building QueueMessage objects.
+    
+    Args:
+        job_id: Unique job ID
+        payload: Job payload
+        max_retries: Max delivery attempts
+        retry_backoff: Seconds between retries
+        metadata: Optional job metadata
+        enqueued_at: ISO timestamp (defaults to now, UTC)
+        
+    Returns:
+        JSON-encoded body
+    """
+    return orjson.dumps({
+        "id": job_id,
+        "payload": payload,
+        "metadata": metadata or {},
+        "enqueued_at": enqueued_at or datetime.utcnow().isoformat(),
+        "max_retries": max_retries,
+        "retry_backoff": retry_backoff,
+    })
+
+
 @dataclass
 class QueueJob:
     """Job retrieved from queue"""
@@ -121,6 +176,33 @@ class QueuePort(ABC):
         """
         pass
     
+    @abstractmethod
+    async def publish_many(
+        self,
+        queue_name: str,
+        bodies: List[bytes],
+        priority: QueuePriority = QueuePriority.MEDIUM,
+        message_ids: Optional[List[str]] = None,
+        max_retries: int = 3,
+    ) -> int:
+        """
+        Publish pre-serialized job bodies to one queue in a single batch
+        
+        All bodies share queue, priority and retry policy, so the adapter
+        can pipeline them on one channel and wait for confirms once.
+        
+        Args:
+            queue_name: Target queue
+            bodies: Bodies built with encode_job_body()
+            priority: Priority for every job in the batch
+            message_ids: Optional job IDs (same order as bodies)
+            max_retries: Max delivery attempts per job
+            
+        Returns:
+            Number of jobs published
+        """
+        pass
+    
     @abstractmethod
     async def dequeue(
         self,
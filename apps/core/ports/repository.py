@@ -10,23 +10,26 @@ Implementations:
     - MessageRepository
     
 Pattern: Repository Pattern + Unit of Work
+
+Ports are typing.Protocol classes (structural typing): adapters satisfy
+them by shape and do not inherit from them, so hot-path calls such as
+update_stats / save_batch / is_opted_out dispatch straight to the
+concrete class.
 """
 
-from abc import ABC, abstractmethod
-from typing import Optional, List, Dict, Any, TypeVar, Generic
+from typing import Optional, List, Dict, Any, Awaitable, Callable, Sequence, Set, Tuple, TypeVar, Protocol
 from uuid import UUID
 from datetime import datetime
 
-from apps.core.domain.campaign import Campaign, CampaignStatus
-from apps.core.domain.campaign import Campaign, CampaignStatus
+from apps.core.domain.campaign import Campaign, CampaignStatus, StatsDelta
 from apps.core.domain.message import Message, MessageStatus, MessageChannel
-from apps.core.domain.template import Template, TemplateStatus
+from apps.core.domain.template import Template, TemplateStatus, CompiledTemplate
 
 
 T = TypeVar('T')
 
 
-class Repository(ABC, Generic[T]):
+class Repository(Protocol[T]):
     """
     Generic repository interface
     
@@ -34,7 +37,6 @@ class Repository(ABC, Generic[T]):
     All repositories must implement this interface.
     """
     
-    @abstractmethod
     async def save(self, entity: T) -> T:
         """
         Save entity (insert or update)
@@ -45,9 +47,8 @@ class Repository(ABC, Generic[T]):
         Returns:
             Saved entity with updated fields
         """
-        pass
+        ...
     
-    @abstractmethod
     async def get_by_id(self, id: UUID) -> Optional[T]:
         """
         Retrieve entity by ID
@@ -58,9 +59,8 @@ class Repository(ABC, Generic[T]):
         Returns:
             Entity or None if not found
         """
-        pass
+        ...
     
-    @abstractmethod
     async def delete(self, id: UUID) -> bool:
         """
         Delete entity
@@ -71,9 +71,8 @@ class Repository(ABC, Generic[T]):
         Returns:
             True if deleted, False if not found
         """
-        pass
+        ...
     
-    @abstractmethod
     async def exists(self, id: UUID) -> bool:
         """
         Check if entity exists
@@ -84,17 +83,16 @@ class Repository(ABC, Generic[T]):
         Returns:
             True if exists
         """
-        pass
+        ...
 
 
-class CampaignRepository(Repository[Campaign]):
+class CampaignRepository(Repository[Campaign], Protocol):
     """
     Campaign-specific repository operations
     
     Extends base repository with campaign queries.
     """
     
-    @abstractmethod
     async def get_by_tenant(
         self,
         tenant_id: UUID,
@@ -114,9 +112,8 @@ class CampaignRepository(Repository[Campaign]):
         Returns:
             List of campaigns
         """
-        pass
+        ...
     
-    @abstractmethod
     async def get_scheduled_campaigns(
         self,
         before: datetime,
@@ -130,9 +127,23 @@ class CampaignRepository(Repository[Campaign]):
         Returns:
             Campaigns ready for execution
         """
-        pass
+        ...
+    
+    async def get_many(
+        self,
+        ids: List[UUID],
+    ) -> List[Campaign]:
+        """
+        Get several campaigns in one query
+        
+        Args:
+            ids: Campaign identifiers
+            
+        Returns:
+            Campaigns found (missing IDs are skipped)
+        """
+        ...
     
-    @abstractmethod
     async def get_active_campaigns(
         self,
         tenant_id: Optional[UUID] = None,
@@ -146,24 +157,38 @@ class CampaignRepository(Repository[Campaign]):
         Returns:
             List of active campaigns
         """
-        pass
+        ...
     
-    @abstractmethod
     async def update_stats(
         self,
         campaign_id: UUID,
-        stats_update: Dict[str, int],
+        delta: StatsDelta,
     ) -> None:
         """
         Update campaign statistics atomically
         
         Args:
             campaign_id: Campaign to update
-            stats_update: Stats to increment (e.g., {"messages_sent": 1})
+            delta: Counters to increment (e.g., StatsDelta(messages_sent=1))
+        """
+        ...
+    
+    async def increment_stat(
+        self,
+        campaign_id: UUID,
+        field: str,
+        delta: int = 1,
+    ) -> None:
+        """
+        Increment a single campaign counter atomically
+        
+        Args:
+            campaign_id: Campaign to update
+            field: Counter column, e.g. "messages_sent"
+            delta: Amount to add
         """
-        pass
+        ...
     
-    @abstractmethod
     async def recalculate_stats(
         self,
         campaign_id: UUID,
@@ -176,9 +201,8 @@ class CampaignRepository(Repository[Campaign]):
         Args:
             campaign_id: Campaign to update
         """
-        pass
+        ...
     
-    @abstractmethod
     async def search(
         self,
         tenant_id: UUID,
@@ -196,16 +220,15 @@ class CampaignRepository(Repository[Campaign]):
         Returns:
             Matching campaigns
         """
-        pass
+        ...
 
 
 
-class TemplateRepository(Repository[Template]):
+class TemplateRepository(Repository[Template], Protocol):
     """
     Template-specific repository operations
     """
     
-    @abstractmethod
     async def get_by_tenant(
         self,
         tenant_id: UUID,
@@ -225,17 +248,31 @@ class TemplateRepository(Repository[Template]):
         Returns:
             List of templates
         """
-        pass
+        ...
+    
+    async def get_compiled(
+        self,
+        template_id: UUID,
+    ) -> Optional[CompiledTemplate]:
+        """
+        Get a template's text pre-compiled for repeated rendering
+        
+        Args:
+            template_id: Template identifier
+            
+        Returns:
+            Compiled template or None if not found
+        """
+        ...
 
 
-class MessageRepository(Repository[Message]):
+class MessageRepository(Repository[Message], Protocol):
     """
     Message-specific repository operations
     
     Handles high-volume message persistence with optimizations.
     """
     
-    @abstractmethod
     async def save_batch(
         self,
         messages: List[Message],
@@ -249,9 +286,74 @@ class MessageRepository(Repository[Message]):
         Returns:
             Saved messages
         """
-        pass
+        ...
+    
+    async def bulk_copy(
+        self,
+        messages: List[Message],
+    ) -> int:
+        """
+        Bulk-load new messages via COPY (large campaign batches)
+        
+        Args:
+            messages: New messages to insert
+            
+        Returns:
+            Number of rows copied
+        """
+        ...
+    
+    async def insert_from_audience(
+        self,
+        prototype: Message,
+        audience_id: UUID,
+        template_text: str,
+        variable_names: Sequence[str],
+        after_contact_id: Optional[UUID] = None,
+        limit: int = 1000,
+    ) -> Tuple[List[str], Optional[UUID]]:
+        """
+        Create messages for one page of audience contacts server-side
+        
+        Args:
+            prototype: Message carrying the values shared by every row
+            audience_id: Audience whose contacts become recipients
+            template_text: Template body rendered per contact
+            variable_names: Declared variable names, in contact order
+            after_contact_id: Keyset cursor from the previous page
+            limit: Contacts per page
+            
+        Returns:
+            New message IDs (as strings) and the next cursor (None when
+            exhausted)
+        """
+        ...
+    
+    def track(
+        self,
+        message: Message,
+    ) -> Message:
+        """
+        Register a loaded message for write-back on commit
+        
+        Mutations made to a tracked message are persisted once, when the
+        unit of work commits, instead of one save() per state change.
+        
+        Args:
+            message: Message to track
+            
+        Returns:
+            The same message
+        """
+        ...
+    
+    async def flush_tracked(self) -> None:
+        """
+        Write tracked messages now (when a later query in the same
+        transaction must see their state)
+        """
+        ...
     
-    @abstractmethod
     async def get_by_campaign(
         self,
         campaign_id: UUID,
@@ -271,9 +373,8 @@ class MessageRepository(Repository[Message]):
         Returns:
             List of messages
         """
-        pass
+        ...
     
-    @abstractmethod
     async def get_by_external_id(
         self,
         external_id: str,
@@ -287,9 +388,116 @@ class MessageRepository(Repository[Message]):
         Returns:
             Message or None
         """
-        pass
+        ...
+    
+    async def get_by_ids(
+        self,
+        ids: List[UUID],
+        for_update: bool = False,
+    ) -> List[Message]:
+        """
+        Get many messages in one query
+        
+        Args:
+            ids: Message identifiers
+            for_update: Row-lock the messages until the transaction ends
+            
+        Returns:
+            Messages found (missing IDs are skipped, order not preserved)
+        """
+        ...
+    
+    async def get_statuses(
+        self,
+        ids: List[UUID],
+    ) -> Dict[UUID, MessageStatus]:
+        """
+        Get the current status of many messages in one query
+        
+        Args:
+            ids: Message identifiers
+            
+        Returns:
+            Mapping of message ID to status (unknown IDs are absent)
+        """
+        ...
+    
+    async def claim_for_dispatch(
+        self,
+        message_id: UUID,
+        campaign_id: UUID,
+    ) -> bool:
+        """
+        Atomically move a message PENDING -> QUEUED before sending it
+        
+        Returns:
+            True if this call claimed the message (False: another
+            delivery already has it)
+        """
+        ...
+    
+    async def release_stale_claims(
+        self,
+        campaign_id: UUID,
+        claimed_before: datetime,
+        limit: int = 1000,
+    ) -> List[Tuple[str, str]]:
+        """
+        Reset QUEUED messages claimed before a time back to PENDING
+        
+        Args:
+            campaign_id: Campaign whose messages to sweep
+            claimed_before: Claims older than this are orphaned
+            limit: Max rows per call
+            
+        Returns:
+            (message ID as text, priority) per released row
+        """
+        ...
+    
+    async def get_pending_page(
+        self,
+        campaign_id: UUID,
+        priorities: Sequence[str],
+        after_id: Optional[UUID] = None,
+        limit: int = 1000,
+    ) -> List[Tuple[str, str]]:
+        """
+        Keyset page of PENDING messages of the given priorities
+        
+        Returns:
+            (message ID as text, priority) ordered by ID
+        """
+        ...
+    
+    async def get_by_external_ids(
+        self,
+        external_ids: List[str],
+    ) -> Dict[str, Message]:
+        """
+        Get messages for many vendor IDs in one query
+        
+        Args:
+            external_ids: Aggregator message IDs
+            
+        Returns:
+            Mapping of external_id to message (unknown IDs are absent)
+        """
+        ...
+    
+    async def update_delivery_states(
+        self,
+        messages: List[Message],
+    ) -> None:
+        """
+        Write status/delivered_at/read_at for many messages in one
+        executemany UPDATE (DLR bulk path)
+        
+        Args:
+            messages: Messages whose delivery state changed
+        """
+        ...
     
-    @abstractmethod
     async def get_failed_messages(
         self,
         campaign_id: Optional[UUID] = None,
@@ -305,9 +513,8 @@ class MessageRepository(Repository[Message]):
         Returns:
             List of failed messages
         """
-        pass
+        ...
     
-    @abstractmethod
     async def get_pending_fallback(
         self,
         limit: int = 100,
@@ -321,9 +528,8 @@ class MessageRepository(Repository[Message]):
         Returns:
             Messages that should fallback to SMS
         """
-        pass
+        ...
     
-    @abstractmethod
     async def update_status(
         self,
         message_id: UUID,
@@ -338,9 +544,8 @@ class MessageRepository(Repository[Message]):
             status: New status
             metadata: Additional data to update
         """
-        pass
+        ...
     
-    @abstractmethod
     async def get_delivery_stats(
         self,
         campaign_id: UUID,
@@ -354,17 +559,31 @@ class MessageRepository(Repository[Message]):
         Returns:
             Stats dictionary with counts
         """
-        pass
+        ...
+
+    async def get_delivery_stats_bulk(
+        self,
+        campaign_ids: List[UUID],
+    ) -> Dict[UUID, Dict[str, int]]:
+        """
+        Get per-status message counts for many campaigns at once
+
+        Args:
+            campaign_ids: Campaign identifiers
+
+        Returns:
+            Mapping of campaign_id -> {status value: count, "total": count}
+        """
+        ...
 
 
-class EventRepository(ABC):
+class EventRepository(Protocol):
     """
     Repository for domain events (Event Sourcing)
     
     Stores domain events for audit trail and event replay.
     """
     
-    @abstractmethod
     async def save_event(
         self,
         event_type: str,
@@ -386,9 +605,8 @@ class EventRepository(ABC):
         Returns:
             Event ID
         """
-        pass
+        ...
     
-    @abstractmethod
     async def get_events(
         self,
         aggregate_id: UUID,
@@ -404,9 +622,8 @@ class EventRepository(ABC):
         Returns:
             List of events in order
         """
-        pass
+        ...
     
-    @abstractmethod
     async def get_events_by_type(
         self,
         event_type: str,
@@ -424,13 +641,12 @@ class EventRepository(ABC):
         Returns:
             List of matching events
         """
-        pass
+        ...
 
 
-class OptOutRepository(ABC):
+class OptOutRepository(Protocol):
     """Repository for opt-out/consent management"""
     
-    @abstractmethod
     async def is_opted_out(
         self,
         phone_number: str,
@@ -446,9 +662,25 @@ class OptOutRepository(ABC):
         Returns:
             True if opted out
         """
-        pass
+        ...
+    
+    async def are_opted_out(
+        self,
+        phone_numbers: List[str],
+        tenant_id: UUID,
+    ) -> Set[str]:
+        """
+        Bulk opt-out check (one query for a whole batch)
+        
+        Args:
+            phone_numbers: Phone numbers in E.164
+            tenant_id: Tenant context
+            
+        Returns:
+            The subset of phone_numbers that have opted out
+        """
+        ...
     
-    @abstractmethod
     async def opt_out(
         self,
         phone_number: str,
@@ -463,9 +695,8 @@ class OptOutRepository(ABC):
             tenant_id: Tenant context
             reason: Opt-out reason
         """
-        pass
+        ...
     
-    @abstractmethod
     async def opt_in(
         self,
         phone_number: str,
@@ -478,9 +709,22 @@ class OptOutRepository(ABC):
             phone_number: Phone number
             tenant_id: Tenant context
         """
-        pass
+        ...
+    
+    async def opt_in_batch(
+        self,
+        phone_numbers: List[str],
+        tenant_id: UUID,
+    ) -> None:
+        """
+        Record opt-in for a batch of phone numbers (one upsert)
+        
+        Args:
+            phone_numbers: Phone numbers in E.164
+            tenant_id: Tenant context
+        """
+        ...
     
-    @abstractmethod
     async def get_opt_outs(
         self,
         tenant_id: UUID,
@@ -496,65 +740,64 @@ class OptOutRepository(ABC):
         Returns:
             List of opt-out records
         """
-        pass
+        ...
 
 
-class UnitOfWork(ABC):
+class UnitOfWork(Protocol):
     """
     Unit of Work pattern for transaction management
     
     Ensures atomic operations across multiple repositories.
     """
     
-    @abstractmethod
     async def __aenter__(self):
         """Begin transaction"""
-        pass
+        ...
     
-    @abstractmethod
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         """Commit or rollback transaction"""
-        pass
+        ...
     
-    @abstractmethod
     async def commit(self) -> None:
         """Commit transaction"""
-        pass
+        ...
     
-    @abstractmethod
     async def rollback(self) -> None:
         """Rollback transaction"""
-        pass
+        ...
+    
+    async def release(self) -> None:
+        """Commit now and give the connection back before non-DB I/O"""
+        ...
+    
+    def after_commit(self, callback: Callable[[], Awaitable[None]]) -> None:
+        """Run callback once the outermost block commits (not on rollback)"""
+        ...
     
     @property
-    @abstractmethod
     def campaigns(self) -> CampaignRepository:
         """Get campaign repository"""
-        pass
+        ...
     
     @property
-    @abstractmethod
     def messages(self) -> MessageRepository:
         """Get message repository"""
-        pass
+        ...
     
     @property
-    @abstractmethod
     def events(self) -> EventRepository:
         """Get event repository"""
-        pass
+        ...
     
     @property
-    @abstractmethod
     def opt_outs(self) -> OptOutRepository:
         """Get opt-out repository"""
-        pass
+        ...
     
     @property
-    @abstractmethod
     def templates(self) -> TemplateRepository:
         """Get template repository"""
-        pass
+        ...
 
 
 class RepositoryException(Exception):
@@ -0,0 +1,140 @@
+"""
+Delayed Batcher
+
+Generic time + size micro-batcher: callers submit one item each and await
+its result, while a single consumer coroutine flushes pending items
+together once `max_batch_size` are waiting or `batch_interval_ms` has
+passed since the first one.
+
+    batcher = DelayedBatcher(flush_fn, max_batch_size=50, batch_interval_ms=100)
+    result = await batcher.submit(item)
+
+`flush_fn(items)` must return one result per item, in order. A result
+that is an exception instance is raised to that item's caller only; if
+flush_fn itself raises (or returns the wrong number of results), every
+caller in the batch gets an exception — so a queue job that awaits
+submit() is only acked after its batch (or its own item) succeeded.
+close() fails every item not yet resolved, including the batch being
+collected or flushed, so no submit() is left waiting.
+
+Shared by the batching workers: RCS capability checks
+(BatchingCapabilityClient), DLR webhooks (WebhookBatchProcessor) and SMS
+fallback jobs (SMSFallbackWorker).
+"""
+
+import asyncio
+import logging
+from typing import Awaitable, Callable, Generic, List, Optional, Tuple, TypeVar
+
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+class DelayedBatcher(Generic[T, R]):
+    """
+    Collects submitted items and flushes them in batches.
+
+    Args:
+        flush_fn:           Coroutine processing a batch, one result per item
+        max_batch_size:     Flush when this many items are pending
+        batch_interval_ms:  Flush at most this long after the first item
+    """
+
+    def __init__(
+        self,
+        flush_fn: Callable[[List[T]], Awaitable[List[R]]],
+        max_batch_size: int = 50,
+        batch_interval_ms: int = 100,
+    ):
+        self.flush_fn = flush_fn
+        self.max_batch_size = max_batch_size
+        self.batch_interval = batch_interval_ms / 1000
+        self._pending: "asyncio.Queue[Tuple[T, asyncio.Future]]" = asyncio.Queue()
+        self._task: Optional[asyncio.Task] = None
+
+    async def submit(self, item: T) -> R:
+        """Add an item to the next batch and wait for its result."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._flusher())
+
+        future = asyncio.get_running_loop().create_future()
+        await self._pending.put((item, future))
+        return await future
+
+    async def close(self) -> None:
+        """Stop the flusher and fail any items still waiting."""
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+        while not self._pending.empty():
+            _, future = self._pending.get_nowait()
+            if not future.done():
+                future.set_exception(RuntimeError("Batcher closed"))
+
+    async def _flusher(self) -> None:
+        """Collect pending items into batches and flush them."""
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._pending.get()]
+            try:
+                deadline = loop.time() + self.batch_interval
+
+                while len(batch) < self.max_batch_size:
+                    remaining = deadline - loop.time()
+                    if remaining <= 0:
+                        break
+                    try:
+                        batch.append(
+                            await asyncio.wait_for(self._pending.get(), remaining)
+                        )
+                    except asyncio.TimeoutError:
+                        break
+
+                await self._flush(batch)
+            except BaseException:
+                # Cancelled by close() while collecting or flushing: these
+                # items are already off the queue, so fail them here
+                self._fail(batch, RuntimeError("Batcher closed"))
+                raise
+
+    async def _flush(self, batch: List[Tuple[T, asyncio.Future]]) -> None:
+        """Run flush_fn for the batch and resolve its futures."""
+        try:
+            results = await self.flush_fn([item for item, _ in batch])
+        except Exception as e:
+            logger.warning(f"Batch flush failed ({len(batch)} items): {e}")
+            self._fail(batch, e)
+            return
+
+        if len(results) != len(batch):
+            logger.warning(
+                f"Batch flush returned {len(results)} results "
+                f"for {len(batch)} items"
+            )
+            self._fail(batch, RuntimeError(
+                f"flush_fn returned {len(results)} results for {len(batch)} items"
+            ))
+            return
+
+        for (_, future), result in zip(batch, results):
+            if future.done():
+                continue
+            if isinstance(result, BaseException):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
+
+    @staticmethod
+    def _fail(batch: List[Tuple[T, asyncio.Future]], error: BaseException) -> None:
+        """Fail every still-unresolved future in the batch."""
+        for _, future in batch:
+            if not future.done():
+                future.set_exception(error)
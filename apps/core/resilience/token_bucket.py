@@ -0,0 +1,55 @@
+"""
+Token Bucket Rate Limiter
+
+In-process limiter for pacing work at a steady rate:
+
+    bucket = TokenBucket(rate=10, capacity=10)   # 10/s, bursts of 10
+    await bucket.acquire(len(batch))             # waits only as needed
+
+Tokens refill continuously (monotonic clock), so time the caller spends
+doing work between acquire() calls counts towards the next one — unlike
+a fixed sleep after each batch, which adds the work time on top.
+
+A request larger than `capacity` is allowed and puts the bucket into
+debt: it is granted as soon as the balance is non-negative, and the next
+caller waits until the debt is repaid. The long-run rate is therefore
+still `rate` even when batches are bigger than the bucket.
+"""
+
+import asyncio
+import time
+
+
+class TokenBucket:
+    """
+    Continuously refilling token bucket (single process, asyncio).
+
+    Args:
+        rate:      Tokens added per second
+        capacity:  Maximum tokens held (burst size)
+    """
+
+    def __init__(self, rate: float, capacity: float):
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(
+            self.capacity, self._tokens + (now - self._updated) * self.rate
+        )
+        self._updated = now
+
+    async def acquire(self, tokens: float = 1) -> None:
+        """Wait until the bucket is out of debt, then take `tokens`."""
+        async with self._lock:
+            self._refill()
+            if self._tokens < 0:
+                await asyncio.sleep(-self._tokens / self.rate)
+                self._refill()
+            self._tokens -= tokens
@@ -17,19 +17,23 @@ Dependencies:
     - QueuePort (for job enqueueing)
 """
 
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, TYPE_CHECKING
 from uuid import UUID
 from datetime import datetime
 import logging
 
+import numpy as np
+from cachetools import TTLCache
+
 from apps.core.domain.campaign import (
     Campaign,
     CampaignStatus,
     CampaignType,
     Priority,
+    StatsDelta,
     InvalidStateTransition,
 )
-from apps.core.domain.message import Message, MessageContent
+from apps.core.domain.message import Message, MessageContent, MessageStatus
 from apps.core.ports.repository import (
     CampaignRepository,
     MessageRepository,
@@ -38,9 +42,25 @@ from apps.core.ports.repository import (
 )
 from apps.core.ports.queue import QueuePort, QueueMessage, QueuePriority
 
+if TYPE_CHECKING:
+    from apps.adapters.cache.scheduled_campaigns import ScheduledCampaignIndex
+
 
 logger = logging.getLogger(__name__)
 
+_PRIORITY_MAP = {
+    Priority.LOW: QueuePriority.LOW,
+    Priority.MEDIUM: QueuePriority.MEDIUM,
+    Priority.HIGH: QueuePriority.HIGH,
+    Priority.URGENT: QueuePriority.URGENT,
+}
+
+# list_delivery_stats() results per campaign: dashboards re-poll the same
+# listing every few seconds, and counts that are 30s old are fine there
+_DELIVERY_STATS_CACHE: "TTLCache[UUID, Dict[str, Any]]" = TTLCache(
+    maxsize=10_000, ttl=30
+)
+
 
 class CampaignService:
     """
@@ -64,6 +84,7 @@ class CampaignService:
         self,
         uow: UnitOfWork,
         queue: QueuePort,
+        scheduled_index: Optional["ScheduledCampaignIndex"] = None,
     ):
         """
         Initialize campaign service
@@ -71,9 +92,12 @@ class CampaignService:
         Args:
             uow: Unit of Work for transaction management
             queue: Message queue for async processing
+            scheduled_index: Optional Redis mirror of scheduled campaigns,
+                kept in sync on schedule/activate/cancel/complete
         """
         self.uow = uow
         self.queue = queue
+        self.scheduled_index = scheduled_index
     
     async def create_campaign(
         self,
@@ -201,12 +225,18 @@ class CampaignService:
                 message=QueueMessage(
                     id=f"campaign-{campaign_id}",
                     queue_name="campaign.orchestrator",
-                    payload={"campaign_id": str(campaign_id)},
+                    payload={
+                        "campaign_id": str(campaign_id),
+                        "tenant_id": str(campaign.tenant_id),
+                    },
                     priority=self._map_priority(campaign.priority),
                 ),
                 scheduled_for=scheduled_for,
             )
             
+            if self.scheduled_index:
+                await self.scheduled_index.add(campaign_id, scheduled_for)
+            
             logger.info(
                 f"Campaign {campaign_id} scheduled for {scheduled_for}"
             )
@@ -247,11 +277,17 @@ class CampaignService:
                 QueueMessage(
                     id=f"campaign-{campaign_id}",
                     queue_name="campaign.orchestrator",
-                    payload={"campaign_id": str(campaign_id)},
+                    payload={
+                        "campaign_id": str(campaign_id),
+                        "tenant_id": str(campaign.tenant_id),
+                    },
                     priority=self._map_priority(campaign.priority),
                 )
             )
             
+            if self.scheduled_index:
+                await self.scheduled_index.remove(campaign_id)
+            
             logger.info(f"Campaign {campaign_id} activated")
             
             return campaign
@@ -335,6 +371,9 @@ class CampaignService:
             campaign = await self.uow.campaigns.save(campaign)
             await self._publish_events(campaign)
             
+            if self.scheduled_index:
+                await self.scheduled_index.remove(campaign_id)
+            
             logger.info(f"Campaign {campaign_id} cancelled: {reason}")
             
             return campaign
@@ -379,27 +418,94 @@ class CampaignService:
             limit=limit,
             offset=offset,
         )
-    
+
+    async def list_delivery_stats(
+        self,
+        campaign_ids: List[UUID],
+    ) -> Dict[UUID, Dict[str, Any]]:
+        """
+        Delivery counts and rates for many campaigns (dashboard listing)
+
+        Counts come from a single GROUP BY query; rates are computed in one
+        vectorised divide over a (campaigns x statuses) count matrix instead
+        of a Python loop per campaign. Results are cached per campaign for
+        30 seconds; only campaigns missing from the cache are queried.
+
+        Args:
+            campaign_ids: Campaign identifiers
+
+        Returns:
+            Mapping of campaign_id -> counts plus delivery_rate / read_rate (%)
+        """
+        if not campaign_ids:
+            return {}
+
+        results: Dict[UUID, Dict[str, Any]] = {}
+        missing: List[UUID] = []
+        for campaign_id in campaign_ids:
+            cached = _DELIVERY_STATS_CACHE.get(campaign_id)
+            if cached is None:
+                missing.append(campaign_id)
+            else:
+                results[campaign_id] = cached
+
+        if missing:
+            results.update(await self._compute_delivery_stats(missing))
+        return {campaign_id: results[campaign_id] for campaign_id in campaign_ids}
+
+    async def _compute_delivery_stats(
+        self,
+        campaign_ids: List[UUID],
+    ) -> Dict[UUID, Dict[str, Any]]:
+        """Query and vectorise delivery stats, refreshing the cache."""
+        raw = await self.uow.messages.get_delivery_stats_bulk(campaign_ids)
+
+        statuses = [s.value for s in MessageStatus]
+        column = {status: i for i, status in enumerate(statuses)}
+        counts = np.zeros((len(campaign_ids), len(statuses)), dtype=np.int64)
+        for row, campaign_id in enumerate(campaign_ids):
+            for status, count in raw.get(campaign_id, {}).items():
+                if status in column:
+                    counts[row, column[status]] = count
+
+        totals = counts.sum(axis=1)
+        read = counts[:, column[MessageStatus.READ.value]]
+        delivered = counts[:, column[MessageStatus.DELIVERED.value]] + read
+        delivery_rate = delivered * 100.0 / np.maximum(totals, 1)
+        read_rate = read * 100.0 / np.maximum(delivered, 1)
+
+        results = {
+            campaign_id: {
+                **{status: int(counts[row, i]) for i, status in enumerate(statuses)},
+                "total": int(totals[row]),
+                "delivery_rate": float(delivery_rate[row]),
+                "read_rate": float(read_rate[row]),
+            }
+            for row, campaign_id in enumerate(campaign_ids)
+        }
+        _DELIVERY_STATS_CACHE.update(results)
+        return results
+
     async def update_campaign_stats(
         self,
         campaign_id: UUID,
-        stats_update: Dict[str, int],
+        delta: StatsDelta,
     ) -> None:
         """
         Update campaign statistics
         
         Args:
             campaign_id: Campaign identifier
-            stats_update: Statistics to increment
+            delta: Counters to increment
             
         Example:
             >>> await service.update_campaign_stats(
             ...     campaign_id,
-            ...     {"messages_sent": 1, "messages_delivered": 1}
+            ...     StatsDelta(messages_sent=1, messages_delivered=1),
             ... )
         """
         async with self.uow:
-            await self.uow.campaigns.update_stats(campaign_id, stats_update)
+            await self.uow.campaigns.update_stats(campaign_id, delta)
     
     async def complete_campaign(
         self,
@@ -424,6 +530,9 @@ class CampaignService:
             campaign = await self.uow.campaigns.save(campaign)
             await self._publish_events(campaign)
             
+            if self.scheduled_index:
+                await self.scheduled_index.remove(campaign_id)
+            
             logger.info(
                 f"Campaign {campaign_id} completed - "
                 f"Sent: {campaign.stats.messages_sent}, "
@@ -452,10 +561,4 @@ class CampaignService:
     
     def _map_priority(self, priority: Priority) -> QueuePriority:
         """Map campaign priority to queue priority"""
-        mapping = {
-            Priority.LOW: QueuePriority.LOW,
-            Priority.MEDIUM: QueuePriority.MEDIUM,
-            Priority.HIGH: QueuePriority.HIGH,
-            Priority.URGENT: QueuePriority.URGENT,
-        }
-        return mapping.get(priority, QueuePriority.MEDIUM)
+        return _PRIORITY_MAP.get(priority, QueuePriority.MEDIUM)
@@ -11,12 +11,17 @@ Dependencies:
     - OptOutRepository
 """
 
-from typing import Optional, List
+from typing import Optional, Dict, List, Tuple, TYPE_CHECKING
 from uuid import UUID
+import asyncio
 import logging
+import random
 import time
 from datetime import datetime, timedelta, timezone
 
+from cachetools import TTLCache
+
+from apps.core.config import get_settings
 from apps.core.domain.message import (
     Message,
     MessageContent,
@@ -26,16 +31,41 @@ from apps.core.domain.message import (
 )
 from apps.core.ports.aggregator import (
     AggregatorPort,
+    DeliveryStatus,
     SendMessageRequest,
     AggregatorException,
     RateLimitException,
 )
 from apps.core.ports.repository import UnitOfWork
-from apps.core.ports.queue import QueuePort, QueueMessage, QueuePriority
+from apps.core.ports.queue import (
+    QueuePort,
+    QueueMessage,
+    QueuePriority,
+    encode_job_body,
+    route_by_priority,
+)
+
+if TYPE_CHECKING:
+    from apps.adapters.db.stats_coalescer import StatsCoalescer
+    from apps.core.aggregators.capability_batcher import BatchingCapabilityClient
 
 
 logger = logging.getLogger(__name__)
 
+# Message priority (Priority enum values, always lowercase) -> queue priority
+_PRIORITY_MAP = {
+    "low": QueuePriority.LOW,
+    "medium": QueuePriority.MEDIUM,
+    "high": QueuePriority.HIGH,
+    "urgent": QueuePriority.URGENT,
+}
+_DEFAULT_PRIORITY = QueuePriority.MEDIUM
+
+# Idempotency key -> external_id of sends accepted by the aggregator in this
+# process. A broker redelivery of the same attempt (crash/timeout between the
+# send and the DB commit) is answered from here instead of sending twice.
+_RECENT_SENDS: "TTLCache[str, Optional[str]]" = TTLCache(maxsize=100_000, ttl=600)
+
 
 class DeliveryService:
     """
@@ -45,15 +75,36 @@ class DeliveryService:
     handling capability checks, opt-out validation, and failures.
     """
 
+    # How long a capability result stored on a message stays valid
+    _RCS_CAPABILITY_TTL = timedelta(minutes=10)
+
+    # Rate-limit requeue: full-jitter backoff of up to 2**retry_count seconds
+    _BACKOFF_MAX_EXPONENT = 8
+    _BACKOFF_CAP_SECONDS = 300
+
+    # Batch enqueue: bodies per publish_many call / concurrent calls
+    _PUBLISH_CHUNK = 1000
+    _PUBLISH_CONCURRENCY = 8
+
     def __init__(
         self,
         uow: UnitOfWork,
         aggregator: AggregatorPort,
         queue: QueuePort,
+        capability_checker: Optional["BatchingCapabilityClient"] = None,
+        stats_coalescer: Optional["StatsCoalescer"] = None,
     ):
         self.uow = uow
         self.aggregator = aggregator
         self.queue = queue
+        # Shared micro-batcher for RCS capability checks (dispatcher worker);
+        # falls back to one aggregator call per number when not provided.
+        self.capability_checker = capability_checker
+        # Per-worker buffer for campaign stat writes (hot campaign row);
+        # without it, stats are written inline in the job's transaction.
+        self.stats_coalescer = stats_coalescer
+        # Resolved once: the enqueue paths run per message
+        self._dispatcher_queue = get_settings().queue_names["message_dispatcher"]
 
     async def send_message(
         self,
@@ -96,7 +147,8 @@ class DeliveryService:
                 priority=priority,
             )
 
-            message = await self.uow.messages.save(message)
+            # New row: plain INSERT, no identity-map lookup / SELECT first
+            await self.uow.messages.save_batch([message])
 
         await self._queue_message_for_delivery(message)
 
@@ -114,18 +166,17 @@ class DeliveryService:
     ) -> List[Message]:
         """
         Send messages to multiple recipients.
+
+        Opt-outs are resolved with one bulk query for the whole batch.
         """
         messages = []
 
         async with self.uow:
-            valid_recipients = []
-            for phone in recipients:
-                is_opted_out = await self.uow.opt_outs.is_opted_out(
-                    phone_number=phone,
-                    tenant_id=tenant_id,
-                )
-                if not is_opted_out:
-                    valid_recipients.append(phone)
+            opted_out = await self.uow.opt_outs.are_opted_out(
+                phone_numbers=recipients,
+                tenant_id=tenant_id,
+            )
+            valid_recipients = [p for p in recipients if p not in opted_out]
 
             for phone in valid_recipients:
                 message = Message.create(
@@ -150,14 +201,19 @@ class DeliveryService:
     async def process_message_delivery(
         self,
         message_id: UUID,
+        message: Optional[Message] = None,
     ) -> None:
         """
         Process message delivery (called by dispatcher worker).
+
+        Pass `message` when the caller already loaded it in this unit of
+        work (e.g. for its idempotency check) to skip a second SELECT.
         """
         start_time = time.monotonic()
 
         async with self.uow:
-            message = await self.uow.messages.get_by_id(message_id)
+            if message is None:
+                message = await self.uow.messages.get_by_id(message_id)
             if not message:
                 logger.error(
                     "Message not found — skipping",
@@ -165,6 +221,24 @@ class DeliveryService:
                 )
                 return
 
+            # Claim the row (PENDING -> QUEUED) before anything is sent: of
+            # two copies of this job consumed at once, only one gets past
+            # here. The claim is committed by release() below, before any
+            # aggregator call.
+            if not await self.uow.messages.claim_for_dispatch(
+                message.id, message.campaign_id
+            ):
+                logger.info(
+                    "Message claimed by another delivery — skipping",
+                    extra={"message_id": str(message_id), "step": "claim"},
+                )
+                return
+            if message.status == MessageStatus.PENDING:
+                message.queue()
+
+            # State changes below are written once, on commit
+            self.uow.messages.track(message)
+
             logger.info(
                 "Message loaded — starting delivery",
                 extra={
@@ -194,9 +268,13 @@ class DeliveryService:
                     reason=FailureReason.UNKNOWN,
                     error_message="template_id missing in MessageContent",
                 )
-                await self.uow.messages.save(message)
                 return
 
+            # Everything below until the final write is aggregator I/O: hand
+            # the DB connection back to the pool instead of holding it idle
+            # across HTTP round-trips (the job's writes reconnect on commit).
+            await self.uow.release()
+
             try:
                 if message.channel == MessageChannel.RCS:
                     logger.info(
@@ -207,9 +285,7 @@ class DeliveryService:
                             "step": "rcs_capability_check",
                         },
                     )
-                    rcs_capable = await self._check_rcs_capability(
-                        message.recipient_phone
-                    )
+                    rcs_capable = await self._check_rcs_capability(message)
 
                     if not rcs_capable:
                         logger.info(
@@ -224,10 +300,9 @@ class DeliveryService:
                             reason=FailureReason.RCS_NOT_SUPPORTED,
                             error_message="RCS not supported",
                         )
-                        await self.uow.messages.save(message)
                         await self._handle_fallback_inline(message)
                         # Recalculate stats after fallback
-                        await self.uow.campaigns.recalculate_stats(message.campaign_id)
+                        await self._recalculate_stats(message.campaign_id)
                         return
 
                     logger.info(
@@ -239,9 +314,6 @@ class DeliveryService:
                         },
                     )
 
-                message.queue()
-                await self.uow.messages.save(message)
-
                 logger.info(
                     "Sending message via rcssms.in",
                     extra={
@@ -281,7 +353,7 @@ class DeliveryService:
                         "step": "rate_limited",
                     },
                 )
-                await self._requeue_with_delay(message, delay=e.retry_after or 60)
+                await self._requeue_with_delay(message, retry_after=e.retry_after)
 
             except AggregatorException as e:
                 logger.error(
@@ -330,50 +402,175 @@ class DeliveryService:
                 )
                 return
 
-            logger.info(
-                "DLR status update received",
+            await self._apply_delivery_status(
+                message, status, error_code, error_message
+            )
+
+            await self.uow.messages.save(message)
+            
+            # Recalculate campaign stats after terminal state change
+            await self._recalculate_stats(message.campaign_id)
+
+    async def handle_delivery_status_batch(
+        self,
+        updates: List[DeliveryStatus],
+    ) -> List[bool]:
+        """
+        Apply a batch of DLRs in one transaction.
+
+        One query loads every referenced message. Delivered/read updates
+        are written with one bulk UPDATE; failures take the tracked
+        per-message path because they may spawn an SMS fallback. Stats are
+        recalculated once per touched campaign.
+
+        A DLR that is not a valid transition for its message (e.g. an
+        out-of-order "delivered" after "read") is logged and skipped so it
+        cannot fail the rest of the batch.
+
+        Returns:
+            Per update, in order: True if it was applied, False if it was
+            skipped (message not found — e.g. its external_id is not
+            committed yet — or an invalid transition)
+        """
+        applied: List[bool] = []
+        async with self.uow:
+            messages = await self.uow.messages.get_by_external_ids(
+                [u.external_id for u in updates]
+            )
+
+            bulk: Dict[UUID, Message] = {}
+            campaign_ids = set()
+            for update in updates:
+                applied.append(False)
+                message = messages.get(update.external_id)
+                if not message:
+                    logger.warning(
+                        "DLR received but message not found",
+                        extra={
+                            "external_id": update.external_id,
+                            "status": update.status,
+                            "step": "dlr_lookup",
+                        },
+                    )
+                    continue
+
+                try:
+                    await self._apply_delivery_status(
+                        message,
+                        update.status,
+                        update.error_code,
+                        update.error_message,
+                    )
+                except ValueError as e:
+                    logger.warning(
+                        "DLR skipped — invalid status transition",
+                        extra={
+                            "message_id": str(message.id),
+                            "external_id": update.external_id,
+                            "dlr_status": update.status,
+                            "error": str(e),
+                            "step": "dlr_update",
+                        },
+                    )
+                    continue
+
+                if message.status == MessageStatus.FAILED:
+                    bulk.pop(message.id, None)
+                    self.uow.messages.track(message)
+                elif update.status in ("delivered", "read"):
+                    bulk[message.id] = message
+                campaign_ids.add(message.campaign_id)
+                applied[-1] = True
+
+            await self.uow.messages.update_delivery_states(list(bulk.values()))
+
+            for campaign_id in campaign_ids:
+                await self._recalculate_stats(campaign_id)
+
+        return applied
+
+    async def _apply_delivery_status(
+        self,
+        message: Message,
+        status: str,
+        error_code: Optional[str],
+        error_message: Optional[str],
+    ) -> None:
+        """Move a message to the state reported by a DLR."""
+        logger.info(
+            "DLR status update received",
+            extra={
+                "message_id": str(message.id),
+                "external_id": message.external_id,
+                "dlr_status": status,
+                "recipient": message.recipient_phone,
+                "step": "dlr_update",
+            },
+        )
+
+        if status == "delivered":
+            message.mark_delivered()
+        elif status == "read":
+            message.mark_read()
+        elif status == "failed":
+            message.mark_failed(
+                reason=FailureReason.NETWORK_ERROR,
+                error_code=error_code,
+                error_message=error_message,
+            )
+            logger.warning(
+                "Message delivery failed per DLR",
                 extra={
                     "message_id": str(message.id),
-                    "external_id": external_id,
-                    "dlr_status": status,
-                    "recipient": message.recipient_phone,
-                    "step": "dlr_update",
+                    "external_id": message.external_id,
+                    "error_code": error_code,
+                    "step": "dlr_failed",
                 },
             )
+            if message.should_trigger_fallback():
+                await self._handle_fallback_inline(message)
 
-            if status == "delivered":
-                message.mark_delivered()
-            elif status == "read":
-                message.mark_read()
-            elif status == "failed":
-                message.mark_failed(
-                    reason=FailureReason.NETWORK_ERROR,
-                    error_code=error_code,
-                    error_message=error_message,
-                )
-                logger.warning(
-                    "Message delivery failed per DLR",
-                    extra={
-                        "message_id": str(message.id),
-                        "external_id": external_id,
-                        "error_code": error_code,
-                        "step": "dlr_failed",
-                    },
-                )
-                if message.should_trigger_fallback():
-                    await self._handle_fallback_inline(message)
+    async def _recalculate_stats(self, campaign_id: UUID) -> None:
+        """
+        Recalculate campaign stats from the messages table.
 
-            await self.uow.messages.save(message)
-            
-            # Recalculate campaign stats after terminal state change
-            await self.uow.campaigns.recalculate_stats(message.campaign_id)
+        With a coalescer the campaign is marked dirty only once this
+        transaction commits, so the flush (once per campaign) sees the new
+        message states. Inline, tracked messages are written first so the
+        aggregate query sees their new state.
+        """
+        if self.stats_coalescer:
+            coalescer = self.stats_coalescer
+
+            async def mark_dirty() -> None:
+                coalescer.mark_dirty(campaign_id)
+
+            self.uow.after_commit(mark_dirty)
+        else:
+            await self.uow.messages.flush_tracked()
+            await self.uow.campaigns.recalculate_stats(campaign_id)
+
+    async def _check_rcs_capability(self, message: Message) -> bool:
+        """
+        Check if the message's recipient is RCS capable.
+
+        A result already recorded on the message (e.g. by an earlier attempt
+        that was rate-limited or failed) is reused while fresh; otherwise the
+        check runs and is recorded on the message, persisted with the job.
+        """
+        cached = message.cached_rcs_capability(self._RCS_CAPABILITY_TTL)
+        if cached is not None:
+            return cached
+
+        phone_number = message.recipient_phone
+        if self.capability_checker:
+            capable = await self.capability_checker.check(phone_number)
+        else:
+            results = await self.aggregator.check_rcs_capability([phone_number])
+            capable = bool(results) and results[0].rcs_enabled
 
-    async def _check_rcs_capability(self, phone_number: str) -> bool:
-        """Check if phone number is RCS capable."""
-        results = await self.aggregator.check_rcs_capability([phone_number])
-        if not results:
-            return False
-        return results[0].rcs_enabled
+        message.record_rcs_capability(capable)
+        return capable
 
     async def _send_via_aggregator(self, message: Message) -> None:
         """
@@ -381,7 +578,28 @@ class DeliveryService:
 
         Passes template_id and variables from MessageContent into metadata
         so the rcssms adapter can build the correct payload.
+
+        Each attempt carries an idempotency key of message_id:retry_count,
+        sent as an Idempotency-Key header and remembered locally once the
+        aggregator accepts it, so a redelivered job for the same attempt
+        does not reach the aggregator again.
         """
+        idempotency_key = f"{message.id}:{message.retry_count}"
+        if idempotency_key in _RECENT_SENDS:
+            logger.info(
+                "Send already accepted for this attempt — skipping aggregator call",
+                extra={
+                    "message_id": str(message.id),
+                    "idempotency_key": idempotency_key,
+                    "step": "idempotent_skip",
+                },
+            )
+            message.mark_sent(
+                aggregator=self.aggregator.get_name(),
+                external_id=_RECENT_SENDS[idempotency_key],
+            )
+            return
+
         request = SendMessageRequest(
             message_id=message.id,
             recipient_phone=message.recipient_phone,
@@ -395,6 +613,7 @@ class DeliveryService:
                 "variables": message.content.variables or [],
                 "rcs_type": message.content.rcs_type,   # BASIC|RICH|RICHCASOUREL
             },
+            idempotency_key=idempotency_key,
         )
 
         if message.channel == MessageChannel.RCS:
@@ -403,11 +622,11 @@ class DeliveryService:
             response = await self.aggregator.send_sms_message(request)
 
         if response.success:
+            _RECENT_SENDS[idempotency_key] = response.external_id
             message.mark_sent(
                 aggregator=self.aggregator.get_name(),
                 external_id=response.external_id,
             )
-            await self.uow.messages.save(message)
         else:
             raise AggregatorException(
                 message=response.error_message or "Unknown aggregator error",
@@ -417,35 +636,56 @@ class DeliveryService:
 
     async def _queue_message_for_delivery(self, message: Message) -> None:
         """Queue a single message for delivery."""
-        from apps.core.config import get_settings
-
-        settings = get_settings()
-
+        priority = self._map_priority(message.priority)
         await self.queue.enqueue(
             QueueMessage(
                 id=str(message.id),
-                queue_name=settings.queue_names["message_dispatcher"],
+                queue_name=route_by_priority(self._dispatcher_queue, priority),
                 payload={"message_id": str(message.id)},
-                priority=self._map_priority(message.priority),
+                priority=priority,
             )
         )
 
     async def _queue_messages_batch(self, messages: List[Message]) -> None:
-        """Queue a batch of messages for delivery."""
-        from apps.core.config import get_settings
+        """
+        Queue a batch of messages for delivery.
 
-        settings = get_settings()
+        Bodies are pre-serialized (orjson) and grouped by priority; each
+        group goes out in publish_many chunks on their own confirm channels,
+        with the chunks in flight concurrently.
+        """
+        enqueued_at = datetime.utcnow().isoformat()
 
-        queue_messages = [
-            QueueMessage(
-                id=str(msg.id),
-                queue_name=settings.queue_names["message_dispatcher"],
-                payload={"message_id": str(msg.id)},
-                priority=self._map_priority(msg.priority),
+        groups: Dict[QueuePriority, Tuple[List[str], List[bytes]]] = {}
+        for msg in messages:
+            msg_id = str(msg.id)
+            ids, bodies = groups.setdefault(
+                self._map_priority(msg.priority), ([], [])
+            )
+            ids.append(msg_id)
+            bodies.append(
+                encode_job_body(msg_id, {"message_id": msg_id}, enqueued_at=enqueued_at)
             )
-            for msg in messages
-        ]
-        await self.queue.enqueue_batch(queue_messages)
+
+        # Publish priority groups (and large groups in chunks) concurrently;
+        # each publish_many holds its own confirm channel, so cap the fan-out.
+        semaphore = asyncio.Semaphore(self._PUBLISH_CONCURRENCY)
+
+        async def publish(priority, ids, bodies):
+            async with semaphore:
+                await self.queue.publish_many(
+                    route_by_priority(self._dispatcher_queue, priority),
+                    bodies,
+                    priority=priority,
+                    message_ids=ids,
+                )
+
+        step = self._PUBLISH_CHUNK
+        await asyncio.gather(*(
+            publish(priority, ids[i:i + step], bodies[i:i + step])
+            for priority, (ids, bodies) in groups.items()
+            for i in range(0, len(bodies), step)
+        ))
 
     async def _handle_fallback_inline(self, message: Message) -> None:
         """
@@ -471,14 +711,15 @@ class DeliveryService:
         # Create NEW SMS message (doesn't modify parent)
         fallback_message = message.create_fallback_message()
         
-        # Save child message
+        # Save child; queue it for delivery (standard dispatcher queue) only
+        # once the transaction has committed, so the dispatcher finds the row
         await self.uow.messages.save(fallback_message)
-        
-        # Queue child for delivery (standard dispatcher queue)
-        await self._queue_message_for_delivery(fallback_message)
+        self.uow.after_commit(
+            lambda: self._queue_message_for_delivery(fallback_message)
+        )
         
         logger.info(
-            "SMS fallback message created and queued",
+            "SMS fallback message created — queued on commit",
             extra={
                 "parent_message_id": str(message.id),
                 "fallback_message_id": str(fallback_message.id),
@@ -489,27 +730,44 @@ class DeliveryService:
             },
         )
 
-    async def _requeue_with_delay(self, message: Message, delay: int) -> None:
+    async def _requeue_with_delay(
+        self,
+        message: Message,
+        retry_after: Optional[int] = None,
+    ) -> None:
         """Requeue message with a delay (for rate limiting).
 
         FIX: previously passed datetime.utcnow() as scheduled_for, ignoring
         the delay parameter entirely.  Now correctly schedules in the future.
+
+        NEW: exponential backoff with full jitter on retry_count, so a burst
+        of 429s spreads its retries out instead of returning in lockstep.
+        The aggregator's Retry-After (if any) is honoured as a floor.
+
+        The job is published only once the reset to PENDING (and the new
+        retry_count) has committed; published earlier, it could load the
+        old row and reuse the failed attempt's Idempotency-Key.
         """
-        from apps.core.config import get_settings
+        exponent = min(message.retry_count, self._BACKOFF_MAX_EXPONENT)
+        backoff = min(2 ** exponent, self._BACKOFF_CAP_SECONDS)
+        delay = (retry_after or 0) + random.uniform(0, backoff)
 
-        settings = get_settings()
+        message.increment_retry()
 
-        scheduled_for = datetime.now(timezone.utc) + timedelta(seconds=delay)
+        priority = self._map_priority(message.priority)
 
-        await self.queue.schedule(
-            message=QueueMessage(
-                id=str(message.id),
-                queue_name=settings.queue_names["message_dispatcher"],
-                payload={"message_id": str(message.id)},
-                priority=self._map_priority(message.priority),
-            ),
-            scheduled_for=scheduled_for,
-        )
+        async def schedule() -> None:
+            await self.queue.schedule(
+                message=QueueMessage(
+                    id=str(message.id),
+                    queue_name=route_by_priority(self._dispatcher_queue, priority),
+                    payload={"message_id": str(message.id)},
+                    priority=priority,
+                ),
+                scheduled_for=datetime.now(timezone.utc) + timedelta(seconds=delay),
+            )
+
+        self.uow.after_commit(schedule)
 
     async def _handle_delivery_failure(
         self,
@@ -540,8 +798,11 @@ class DeliveryService:
 
         if message.should_retry():
             message.increment_retry()
-            await self.uow.messages.save(message)
-            await self._queue_message_for_delivery(message)
+            # Publish once the new retry_count is committed (see
+            # _requeue_with_delay)
+            self.uow.after_commit(
+                lambda: self._queue_message_for_delivery(message)
+            )
             logger.info(
                 "Message scheduled for retry",
                 extra={
@@ -553,16 +814,13 @@ class DeliveryService:
                 },
             )
         elif message.should_trigger_fallback():
-            # Save parent as FAILED first
-            await self.uow.messages.save(message)
             # Create and queue child fallback message
             await self._handle_fallback_inline(message)
             # Recalculate stats after fallback
-            await self.uow.campaigns.recalculate_stats(message.campaign_id)
+            await self._recalculate_stats(message.campaign_id)
         else:
-            await self.uow.messages.save(message)
             # Recalculate stats for permanent failure
-            await self.uow.campaigns.recalculate_stats(message.campaign_id)
+            await self._recalculate_stats(message.campaign_id)
             logger.error(
                 "Message permanently failed — no retry or fallback possible",
                 extra={
@@ -577,10 +835,4 @@ class DeliveryService:
 
     def _map_priority(self, priority: str) -> QueuePriority:
         """Map message priority to queue priority."""
-        mapping = {
-            "low": QueuePriority.LOW,
-            "medium": QueuePriority.MEDIUM,
-            "high": QueuePriority.HIGH,
-            "urgent": QueuePriority.URGENT,
-        }
-        return mapping.get(priority.lower(), QueuePriority.MEDIUM)
+        return _PRIORITY_MAP.get(priority, _DEFAULT_PRIORITY)
@@ -1,22 +1,33 @@
 """
 Message Dispatcher Worker
 
-Consumes message.dispatch queue and calls DeliveryService per message.
+Consumes the message.dispatch queues and calls DeliveryService per message:
+message.dispatch (durable, HIGH/URGENT) and message.dispatch.bulk
+(transient, LOW/MEDIUM — the messages table is the source of truth).
 Uses AggregatorFactory which returns RcsSmsAdapter (or MockAdapter) based
 on settings.
+
+Once a job's outcome is committed the dispatcher publishes a
+message.<status>.<campaign_id>.<message_id> event on the rcs.events
+exchange, so listeners (e.g. the end-to-end test) need not poll.
 """
 
 import asyncio
 import logging
+import signal
 import time
+from typing import Optional
 from uuid import UUID
 
-from apps.core.domain.message import MessageStatus
+from apps.core.domain.message import Message, MessageStatus
 from apps.core.services.delivery_service import DeliveryService
 from apps.adapters.db.postgres import Database, get_database
+from apps.adapters.db.stats_coalescer import StatsCoalescer
 from apps.adapters.db.unit_of_work import SQLAlchemyUnitOfWork
 from apps.adapters.queue.rabbitmq import RabbitMQAdapter
-from apps.core.ports.queue import QueueJob
+from apps.core.ports.queue import QueueJob, TRANSIENT_QUEUE_SUFFIX
+from apps.core.aggregators.capability_batcher import BatchingCapabilityClient
+from apps.core.aggregators.capability_cache import CapabilityCache
 from apps.core.config import get_settings
 
 
@@ -35,6 +46,10 @@ class MessageDispatcher:
 
     Concurrency is controlled by RabbitMQ prefetch_count — each asyncio task
     processes one message at a time, but N tasks run concurrently.
+
+    max_in_flight bounds how many jobs run inside the worker at once,
+    independently of prefetch: extra deliveries wait on the semaphore
+    instead of piling onto the event loop and the aggregator.
     """
 
     def __init__(
@@ -42,19 +57,27 @@ class MessageDispatcher:
         db: Database = None,
         queue: RabbitMQAdapter = None,
         concurrency: int = 10,
+        max_in_flight: Optional[int] = None,
     ):
         self.db = db or get_database()
         self.queue = queue
         self.concurrency = concurrency
+        self.max_in_flight = max_in_flight or concurrency
+        self._gate = asyncio.Semaphore(self.max_in_flight)
         self.settings = get_settings()
         self.aggregator = None
+        self.capability_batcher = None
+        self.stats_coalescer = None
         self.running = False
 
     async def start(self) -> None:
         """Start the dispatcher worker."""
         logger.info(
             "🚀 Message Dispatcher starting...",
-            extra={"concurrency": self.concurrency},
+            extra={
+                "concurrency": self.concurrency,
+                "max_in_flight": self.max_in_flight,
+            },
         )
 
         await self.db.connect()
@@ -68,7 +91,18 @@ class MessageDispatcher:
 
         from apps.core.aggregators.factory import AggregatorFactory
 
-        self.aggregator = AggregatorFactory.create_aggregator(self.settings)
+        # Pool sized to in-flight jobs (sends + capability checks)
+        self.aggregator = AggregatorFactory.create_aggregator(
+            self.settings, max_connections=self.max_in_flight * 2
+        )
+
+        # One batcher per worker: concurrent jobs share capability HTTP calls
+        self.capability_batcher = BatchingCapabilityClient(
+            self.aggregator,
+            cache=CapabilityCache(self.settings.redis.url),
+        )
+        # One coalescer per worker: campaign stat writes batched per flush
+        self.stats_coalescer = StatsCoalescer(self.db)
 
         self.running = True
 
@@ -81,16 +115,24 @@ class MessageDispatcher:
             },
         )
 
-        await self.queue.subscribe(
-            queue_name=self.settings.queue_names["message_dispatcher"],
-            handler=self.process_message_job,
-            prefetch=self.concurrency,
-        )
+        queue_name = self.settings.queue_names["message_dispatcher"]
+        await asyncio.gather(*(
+            self.queue.subscribe(
+                queue_name=name,
+                handler=self.process_message_job,
+                prefetch=self.concurrency,
+            )
+            for name in (queue_name, queue_name + TRANSIENT_QUEUE_SUFFIX)
+        ))
 
     async def stop(self) -> None:
         """Stop the dispatcher worker."""
         logger.info("🛑 Message Dispatcher stopping...")
         self.running = False
+        if self.capability_batcher:
+            await self.capability_batcher.close()
+        if self.stats_coalescer:
+            await self.stats_coalescer.close()
         if self.aggregator:
             await self.aggregator.close()
         if self.queue:
@@ -99,11 +141,16 @@ class MessageDispatcher:
 
     async def process_message_job(self, job: QueueJob) -> None:
         """
-        Process a single message delivery job.
+        Process a single message delivery job (gated by max_in_flight).
 
         Args:
             job: Queue job payload must contain {"message_id": "<uuid>"}
         """
+        async with self._gate:
+            await self._process_message_job(job)
+
+    async def _process_message_job(self, job: QueueJob) -> None:
+        """Deliver one message: idempotency check, then DeliveryService."""
         message_id = UUID(job.payload["message_id"])
         start = time.monotonic()
 
@@ -119,7 +166,9 @@ class MessageDispatcher:
                     # Idempotency guard — RabbitMQ is at-least-once.
                     # If the dispatcher crashes after sending but before ACKing,
                     # the broker redelivers the same message_id.  Check current
-                    # status so we never send the same message twice.
+                    # status so we never send the same message twice (a cheap
+                    # pre-check; DeliveryService then claims the row atomically,
+                    # which also covers two copies consumed at once).
                     message = await uow.messages.get_by_id(message_id)
                     if message is None:
                         logger.warning(
@@ -143,8 +192,14 @@ class MessageDispatcher:
                         uow=uow,
                         aggregator=self.aggregator,
                         queue=self.queue,
+                        capability_checker=self.capability_batcher,
+                        stats_coalescer=self.stats_coalescer,
                     )
-                    await service.process_message_delivery(message_id)
+                    # Hand over the row loaded above — no second SELECT
+                    await service.process_message_delivery(message_id, message)
+
+            if message.status not in (MessageStatus.PENDING, MessageStatus.QUEUED):
+                await self._publish_processed(message)
 
             elapsed = round(time.monotonic() - start, 3)
             logger.info(
@@ -161,18 +216,58 @@ class MessageDispatcher:
             # Re-raise so RabbitMQ requeues (at-least-once delivery)
             raise
 
+    async def _publish_processed(self, message: Message) -> None:
+        """Announce a committed job outcome (best effort, never fails the job)."""
+        try:
+            await self.queue.publish_event(
+                f"message.{message.status.value}.{message.campaign_id}.{message.id}",
+                {
+                    "message_id": str(message.id),
+                    "campaign_id": str(message.campaign_id),
+                    "status": message.status.value,
+                    "failure_reason": (
+                        message.failure_reason.value if message.failure_reason else None
+                    ),
+                },
+            )
+        except Exception:
+            logger.warning(
+                "Message processed event not published",
+                extra={"message_id": str(message.id)},
+            )
+
 
 async def main():
     dispatcher = MessageDispatcher()
+
+    # Idle until SIGINT/SIGTERM (or the consumer exits) — no polling loop
+    stop_event = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    try:
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            loop.add_signal_handler(sig, stop_event.set)
+    except NotImplementedError:
+        # Windows: Ctrl+C still raises KeyboardInterrupt below
+        pass
+
+    consumer = asyncio.create_task(dispatcher.start())
+    consumer.add_done_callback(lambda _: stop_event.set())
     try:
-        await dispatcher.start()
-        while True:
-            await asyncio.sleep(1)
+        await stop_event.wait()
+        logger.info("Received shutdown signal")
     except KeyboardInterrupt:
         logger.info("Received shutdown signal")
     finally:
+        consumer.cancel()
+        # subscribe() drains its in-flight jobs before the connections close
+        await asyncio.gather(consumer, return_exceptions=True)
         await dispatcher.stop()
 
 
 if __name__ == "__main__":
+    try:
+        import uvloop
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    except ImportError:  # e.g. Windows: keep the default asyncio loop
+        pass
     asyncio.run(main())
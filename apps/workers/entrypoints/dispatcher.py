@@ -4,6 +4,7 @@ Dispatcher Worker Entry Point
 Runs ONLY the MessageDispatcher worker — no other workers.
 
 Concurrency is configurable via the DISPATCHER_CONCURRENCY env var (default 10).
+DISPATCHER_MAX_IN_FLIGHT caps jobs running at once (default: same as concurrency).
 Run multiple replicas of this container to scale message throughput horizontally.
 
 Usage:
@@ -29,10 +30,12 @@ from apps.workers.dispatcher.message_dispatcher import MessageDispatcher
 logger = structlog.get_logger(__name__)
 
 CONCURRENCY = int(os.getenv("DISPATCHER_CONCURRENCY", "10"))
+# In-process cap on concurrently running jobs (defaults to CONCURRENCY)
+MAX_IN_FLIGHT = int(os.getenv("DISPATCHER_MAX_IN_FLIGHT", "0")) or None
 
 
 async def main() -> None:
-    worker = MessageDispatcher(concurrency=CONCURRENCY)
+    worker = MessageDispatcher(concurrency=CONCURRENCY, max_in_flight=MAX_IN_FLIGHT)
 
     loop = asyncio.get_running_loop()
 
@@ -53,4 +56,9 @@ async def main() -> None:
 
 
 if __name__ == "__main__":
+    try:
+        import uvloop
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    except ImportError:  # e.g. Windows: keep the default asyncio loop
+        pass
     asyncio.run(main())
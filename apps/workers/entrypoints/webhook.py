@@ -4,6 +4,7 @@ Webhook Processor Worker Entry Point
 Runs ONLY the WebhookProcessor — no other workers.
 
 Concurrency is configurable via WEBHOOK_CONCURRENCY (default 20).
+WEBHOOK_MAX_IN_FLIGHT caps jobs running at once (default: same as concurrency).
 
 Usage:
     python -m apps.workers.entrypoints.webhook
@@ -28,10 +29,12 @@ from apps.workers.events.webhook_processor import WebhookProcessor
 logger = structlog.get_logger(__name__)
 
 CONCURRENCY = int(os.getenv("WEBHOOK_CONCURRENCY", "20"))
+# In-process cap on concurrently running jobs (defaults to CONCURRENCY)
+MAX_IN_FLIGHT = int(os.getenv("WEBHOOK_MAX_IN_FLIGHT", "0")) or None
 
 
 async def main() -> None:
-    worker = WebhookProcessor(concurrency=CONCURRENCY)
+    worker = WebhookProcessor(concurrency=CONCURRENCY, max_in_flight=MAX_IN_FLIGHT)
 
     loop = asyncio.get_running_loop()
 
@@ -52,4 +55,9 @@ async def main() -> None:
 
 
 if __name__ == "__main__":
+    try:
+        import uvloop
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    except ImportError:  # e.g. Windows: keep the default asyncio loop
+        pass
     asyncio.run(main())
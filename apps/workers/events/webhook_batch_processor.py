@@ -0,0 +1,130 @@
+"""
+Webhook Batch Processor
+
+Coalesces parsed DLRs from concurrent webhook jobs into micro-batches, so
+one transaction covers up to `max_batch` delivery updates instead of one
+lookup + UPDATE per event.
+
+How it works:
+    submit(status) hands the DLR to a DelayedBatcher and awaits it. The
+    batcher flushes once `max_batch` DLRs are pending or `max_wait_ms`
+    has elapsed since the first; each flush applies the whole batch via
+    DeliveryService.handle_delivery_status_batch() in one transaction.
+
+Jobs only ack after their update committed; submit() tells the caller
+whether its DLR was actually applied or skipped (message not found yet,
+invalid transition). If the batch transaction
+fails, its DLRs are retried one per transaction, so only the offending
+ones fail their jobs (and are redelivered by RabbitMQ); the rest commit
+and ack.
+
+Usage (in WebhookProcessor.start):
+    self.batcher = WebhookBatchProcessor(db, aggregator, queue,
+                                         stats_coalescer=self.stats_coalescer)
+    ...
+    await self.batcher.submit(delivery_status)
+"""
+
+import logging
+from typing import List, Optional, Union
+
+from apps.adapters.db.postgres import Database
+from apps.adapters.db.stats_coalescer import StatsCoalescer
+from apps.adapters.db.unit_of_work import SQLAlchemyUnitOfWork
+from apps.core.ports.aggregator import AggregatorPort, DeliveryStatus
+from apps.core.ports.queue import QueuePort
+from apps.core.resilience.delayed_batcher import DelayedBatcher
+from apps.core.services.delivery_service import DeliveryService
+
+
+logger = logging.getLogger(__name__)
+
+
+class WebhookBatchProcessor:
+    """
+    Micro-batching wrapper around DeliveryService.handle_delivery_status_batch.
+
+    Args:
+        db:               Database used for batch transactions
+        aggregator:       Aggregator passed to DeliveryService (fallbacks)
+        queue:            Queue passed to DeliveryService (fallbacks)
+        stats_coalescer:  Optional coalescer for campaign stat recalcs
+        max_batch:        Flush when this many DLRs are pending
+        max_wait_ms:      Flush at most this long after the first pending DLR
+    """
+
+    def __init__(
+        self,
+        db: Database,
+        aggregator: AggregatorPort,
+        queue: QueuePort,
+        stats_coalescer: Optional[StatsCoalescer] = None,
+        max_batch: int = 200,
+        max_wait_ms: int = 50,
+    ):
+        self.db = db
+        self.aggregator = aggregator
+        self.queue = queue
+        self.stats_coalescer = stats_coalescer
+        self._batcher: DelayedBatcher[DeliveryStatus, bool] = DelayedBatcher(
+            self._flush,
+            max_batch_size=max_batch,
+            batch_interval_ms=max_wait_ms,
+        )
+
+    async def submit(self, status: DeliveryStatus) -> bool:
+        """
+        Apply one DLR as part of the next batch; returns once committed.
+
+        Returns:
+            True if the DLR was applied, False if it was skipped
+        """
+        return await self._batcher.submit(status)
+
+    async def close(self) -> None:
+        """Stop the batcher (failing any DLRs still waiting)."""
+        await self._batcher.close()
+
+    async def _flush(
+        self, batch: List[DeliveryStatus]
+    ) -> List[Union[bool, Exception]]:
+        """
+        Apply the batch in one transaction; if that fails, apply each DLR
+        in its own transaction so one bad status fails only its own job.
+        """
+        try:
+            applied = await self._apply(batch)
+        except Exception as e:
+            if len(batch) == 1:
+                raise
+            logger.warning(
+                f"DLR batch failed ({len(batch)} updates), "
+                f"retrying one by one: {e}"
+            )
+            return [await self._apply_one(status) for status in batch]
+
+        logger.debug(f"DLR batch flushed: {len(batch)} updates")
+        return applied
+
+    async def _apply_one(self, status: DeliveryStatus) -> Union[bool, Exception]:
+        """Apply a single DLR; the error (if any) becomes its result."""
+        try:
+            [applied] = await self._apply([status])
+        except Exception as e:
+            logger.warning(
+                f"DLR update failed for {status.external_id}: {e}"
+            )
+            return e
+        return applied
+
+    async def _apply(self, statuses: List[DeliveryStatus]) -> List[bool]:
+        """Apply DLRs in one transaction; per DLR, whether it was applied."""
+        async with self.db.session() as session:
+            uow = SQLAlchemyUnitOfWork(session)
+            service = DeliveryService(
+                uow=uow,
+                aggregator=self.aggregator,
+                queue=self.queue,
+                stats_coalescer=self.stats_coalescer,
+            )
+            return await service.handle_delivery_status_batch(statuses)
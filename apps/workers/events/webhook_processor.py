@@ -1,21 +1,24 @@
 """Webhook Processor Worker
 
-Consumes webhook.process queue and calls DeliveryService.handle_delivery_status_update().
+Consumes webhook.process queue and applies DLRs in micro-batches through
+WebhookBatchProcessor (DeliveryService.handle_delivery_status_batch()).
 Uses AggregatorFactory which returns RcsSmsAdapter (or MockAdapter) based on settings.
 """
 
 import asyncio
 import logging
+import signal
 import time
-from typing import Dict, Any
+from typing import Dict, Any, Optional, Tuple
+
+from cachetools import TTLCache
 
-from apps.core.services.delivery_service import DeliveryService
 from apps.adapters.db.postgres import Database, get_database
-from apps.adapters.db.unit_of_work import SQLAlchemyUnitOfWork
+from apps.adapters.db.stats_coalescer import StatsCoalescer
 from apps.adapters.queue.rabbitmq import RabbitMQAdapter
 from apps.core.ports.queue import QueueJob
-from apps.core.ports.aggregator import WebhookValidationException
 from apps.core.config import get_settings
+from apps.workers.events.webhook_batch_processor import WebhookBatchProcessor
 
 
 import structlog
@@ -30,8 +33,20 @@ class WebhookProcessor:
 
     Pulls jobs from webhook.process queue.  Each job was enqueued by the
     /api/v1/webhooks/rcssms API route after receiving a DLR push from rcssms.in.
+    The route verifies the signature before enqueueing, so jobs here are
+    trusted and are only parsed, never re-validated.
 
     The aggregator is used only to parse the raw payload into a DeliveryStatus.
+
+    max_in_flight bounds how many jobs run inside the worker at once,
+    independently of the RabbitMQ prefetch count.
+
+    Jobs that cannot change anything — unparseable payloads, DLRs without
+    an external_id, and repeats of a (external_id, status) pair already
+    applied by this worker — are acked before a DB session is checked out.
+    Only pairs the batch actually applied are remembered: a DLR skipped
+    because its message was not found (the send's external_id not yet
+    committed) stays eligible when the aggregator retries it.
     """
 
     def __init__(
@@ -39,12 +54,22 @@ class WebhookProcessor:
         db: Database = None,
         queue: RabbitMQAdapter = None,
         concurrency: int = 20,
+        max_in_flight: Optional[int] = None,
     ):
         self.db = db or get_database()
         self.queue = queue
         self.concurrency = concurrency
+        self.max_in_flight = max_in_flight or concurrency
+        self._gate = asyncio.Semaphore(self.max_in_flight)
         self.settings = get_settings()
         self.aggregator = None
+        self.stats_coalescer = None
+        self.batcher = None
+        # (external_id, status) pairs applied recently — aggregator retries
+        # of the same DLR are acked without touching the pool
+        self._applied: "TTLCache[Tuple[str, str], bool]" = TTLCache(
+            maxsize=100_000, ttl=600
+        )
         self.running = False
 
     async def start(self) -> None:
@@ -64,12 +89,24 @@ class WebhookProcessor:
         from apps.core.aggregators.factory import AggregatorFactory
         self.aggregator = AggregatorFactory.create_aggregator(self.settings)
 
+        # DLR bursts hit the same campaigns: recalculate once per flush
+        self.stats_coalescer = StatsCoalescer(self.db)
+
+        # Concurrent jobs share one lookup + bulk UPDATE per batch
+        self.batcher = WebhookBatchProcessor(
+            self.db,
+            self.aggregator,
+            self.queue,
+            stats_coalescer=self.stats_coalescer,
+        )
+
         self.running = True
 
         logger.info("✅ Webhook Processor ready",
                     extra={
                         "queue": self.settings.queue_names["webhook_processor"],
                         "concurrency": self.concurrency,
+                        "max_in_flight": self.max_in_flight,
                         "aggregator": self.aggregator.get_name(),
                     })
 
@@ -82,6 +119,10 @@ class WebhookProcessor:
     async def stop(self) -> None:
         logger.info("🛑 Webhook Processor stopping...")
         self.running = False
+        if self.batcher:
+            await self.batcher.close()
+        if self.stats_coalescer:
+            await self.stats_coalescer.close()
         if self.aggregator:
             await self.aggregator.close()
         if self.queue:
@@ -90,12 +131,17 @@ class WebhookProcessor:
 
     async def process_webhook_job(self, job: QueueJob) -> None:
         """
-        Process a single DLR webhook job.
+        Process a single DLR webhook job (gated by max_in_flight).
 
         Args:
             job: payload must contain:
-                 {"webhook_id": str, "payload": dict, "headers": dict}
+                 {"webhook_id": str, "payload": dict}
         """
+        async with self._gate:
+            await self._process_webhook_job(job)
+
+    async def _process_webhook_job(self, job: QueueJob) -> None:
+        """Parse one DLR and apply it as part of the next batch."""
         webhook_id = job.payload.get("webhook_id", "unknown")
         start = time.monotonic()
 
@@ -104,18 +150,12 @@ class WebhookProcessor:
 
         try:
             payload = job.payload.get("payload", {})
-            headers = job.payload.get("headers", {})
-
-            # Parse DLR through adapter
-            try:
-                delivery_status = await self.aggregator.handle_webhook(
-                    payload=payload,
-                    headers=headers,
-                )
-            except WebhookValidationException as e:
-                logger.error("Invalid webhook signature — dropping",
-                             extra={"webhook_id": webhook_id, "error": str(e)})
-                return  # Do NOT requeue invalid webhooks
+
+            # Parse DLR through adapter (signature already verified at ingress)
+            delivery_status = await self.aggregator.handle_webhook(
+                payload=payload,
+                headers=job.payload.get("headers", {}),
+            )
 
             if not delivery_status:
                 logger.warning("Could not parse webhook payload — dropping",
@@ -129,20 +169,22 @@ class WebhookProcessor:
                             "status": delivery_status.status,
                         })
 
-            async with self.db.session() as session:
-                uow = SQLAlchemyUnitOfWork(session)
-                async with uow:
-                    service = DeliveryService(
-                        uow=uow,
-                        aggregator=self.aggregator,
-                        queue=self.queue,
-                    )
-                    await service.handle_delivery_status_update(
-                        external_id=delivery_status.external_id,
-                        status=delivery_status.status,
-                        error_code=delivery_status.error_code,
-                        error_message=delivery_status.error_message,
-                    )
+            if not delivery_status.external_id:
+                logger.warning("DLR has no external_id — dropping",
+                               extra={"webhook_id": webhook_id})
+                return
+
+            dedup_key = (delivery_status.external_id, str(delivery_status.status))
+            if dedup_key in self._applied:
+                logger.info("Duplicate DLR — already applied, dropping",
+                            extra={
+                                "webhook_id": webhook_id,
+                                "external_id": delivery_status.external_id,
+                            })
+                return
+
+            if await self.batcher.submit(delivery_status):
+                self._applied[dedup_key] = True
 
             elapsed = round(time.monotonic() - start, 3)
             logger.info("✅ Webhook job done",
@@ -162,15 +204,35 @@ class WebhookProcessor:
 
 async def main():
     processor = WebhookProcessor()
+
+    # Idle until SIGINT/SIGTERM (or the consumer exits) — no polling loop
+    stop_event = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    try:
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            loop.add_signal_handler(sig, stop_event.set)
+    except NotImplementedError:
+        # Windows: Ctrl+C still raises KeyboardInterrupt below
+        pass
+
+    consumer = asyncio.create_task(processor.start())
+    consumer.add_done_callback(lambda _: stop_event.set())
     try:
-        await processor.start()
-        while True:
-            await asyncio.sleep(1)
+        await stop_event.wait()
+        logger.info("Received shutdown signal")
     except KeyboardInterrupt:
         logger.info("Received shutdown signal")
     finally:
+        consumer.cancel()
+        # subscribe() drains its in-flight jobs before the connections close
+        await asyncio.gather(consumer, return_exceptions=True)
         await processor.stop()
 
 
 if __name__ == "__main__":
+    try:
+        import uvloop
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    except ImportError:  # e.g. Windows: keep the default asyncio loop
+        pass
     asyncio.run(main())
@@ -10,26 +10,33 @@ IMPORTANT — rcssms.in limitation:
     Wire one in by creating a second adapter and injecting it here.
 
 Flow:
-    1. Receive fallback job from queue
-    2. Load message from database
-    3. Verify fallback should be triggered
-    4. Send via aggregator (rcssms BASIC or a true SMS provider)
-    5. Update message and campaign stats
+    1. Receive fallback job from queue (jobs are micro-batched: up to
+       max_batch_size jobs or batch_interval_ms, whichever comes first)
+    2. Load the batch's messages (one query), verify fallback should be
+       triggered, mark it and commit
+    3. Send via aggregator.send_sms_batch() with no transaction open
+    4. Reload, update messages, commit; campaign counters go through the
+       StatsCoalescer (one UPDATE per campaign per second)
 """
 
 import asyncio
 import logging
+from typing import Dict, List, Optional, Tuple
 from uuid import UUID
 
-from apps.core.domain.message import MessageChannel, FailureReason
+from apps.core.domain.campaign import StatsDelta
+from apps.core.domain.message import Message, MessageChannel, FailureReason
+from apps.adapters.cache.idempotency import IdempotencyGuard
 from apps.adapters.db.postgres import Database, get_database
+from apps.adapters.db.stats_coalescer import StatsCoalescer
 from apps.adapters.db.unit_of_work import SQLAlchemyUnitOfWork
 from apps.adapters.queue.rabbitmq import RabbitMQAdapter
 from apps.core.ports.queue import QueueJob
-from apps.core.ports.aggregator import SendMessageRequest, AggregatorException
+from apps.core.ports.aggregator import SendMessageRequest
 from apps.core.aggregators.factory import AggregatorFactory
 from apps.adapters.aggregators.mock_adapter import MockAdapter
 from apps.core.config import get_settings
+from apps.core.resilience.delayed_batcher import DelayedBatcher
 
 
 import structlog
@@ -51,12 +58,26 @@ class SMSFallbackWorker:
         queue: RabbitMQAdapter = None,
         aggregator=None,
         concurrency: int = 10,
+        max_batch_size: int = 50,
+        batch_interval_ms: int = 100,
     ):
         self.db = db or get_database()
         self.queue = queue
         self.aggregator = aggregator
         self.concurrency = concurrency
         self.settings = get_settings()
+        # Redeliveries of a fallback job are acked without a second send
+        self.idempotency = IdempotencyGuard(
+            self.settings.redis.url, prefix="fallback:idem"
+        )
+        # Concurrent jobs share one SELECT, send batch and commit. Batches
+        # are bounded by the prefetch count as well as max_batch_size.
+        self.batcher = DelayedBatcher(
+            self._process_fallback_batch,
+            max_batch_size=max_batch_size,
+            batch_interval_ms=batch_interval_ms,
+        )
+        self.stats_coalescer = None
         self.running = False
 
     async def start(self) -> None:
@@ -81,7 +102,11 @@ class SMSFallbackWorker:
                     rcs_capable_rate=0.0,
                 )
             else:
-                self.aggregator = AggregatorFactory.create_sms_adapter(self.settings)
+                # One adapter (one pooled HTTP client) for all concurrent
+                # fallback sends; pool sized to the worker's concurrency
+                self.aggregator = AggregatorFactory.create_sms_adapter(
+                    self.settings, max_connections=self.concurrency * 2
+                )
                 if not self.aggregator:
                     logger.error(
                         "SMS fallback adapter not configured — "
@@ -89,6 +114,10 @@ class SMSFallbackWorker:
                         "Worker will consume jobs but skip sending."
                     )
 
+        # Fallback counters are flushed once a second per campaign instead
+        # of one UPDATE on the hot campaign row per batch
+        self.stats_coalescer = StatsCoalescer(self.db, flush_interval_ms=1000)
+
         self.running = True
 
         await self.queue.subscribe(
@@ -106,15 +135,24 @@ class SMSFallbackWorker:
         logger.info("🛑 SMS Fallback Worker stopping...")
         self.running = False
 
+        await self.batcher.close()
+
+        if self.stats_coalescer:
+            await self.stats_coalescer.close()
+
         if self.aggregator:
             await self.aggregator.close()
 
+        await self.idempotency.close()
         await self.queue.close()
         await self.db.disconnect()
 
     async def process_fallback_job(self, job: QueueJob) -> None:
         """
-        Process a fallback job.
+        Process a fallback job (as part of the next batch).
+
+        Returns once the job's batch has committed, so the delivery is
+        only acked after its fallback is persisted.
 
         Args:
             job: Queue job with message_id
@@ -123,18 +161,65 @@ class SMSFallbackWorker:
 
         logger.info(f"📲 Processing fallback for message {message_id}")
 
+        idempotency_key = job.payload.get("idempotency_key") or str(message_id)
+        if not await self.idempotency.claim(idempotency_key):
+            prior = await self.idempotency.get(idempotency_key)
+            logger.info(
+                f"Fallback for message {message_id} deduplicated "
+                f"(prior={prior})"
+            )
+            return
+
         try:
-            async with self.db.session() as session:
-                uow = SQLAlchemyUnitOfWork(session)
-
-                # Single async-with block — the context manager commits on
-                # clean exit.  Do NOT call uow.commit() manually mid-block
-                # as that causes a double-commit error.
-                async with uow:
-                    message = await uow.messages.get_by_id(message_id)
+            await self.batcher.submit((message_id, idempotency_key))
+
+        except Exception:
+            logger.exception(f"❌ Error processing fallback for {message_id}")
+            raise
+
+        finally:
+            # An accepted send has already recorded its outcome; only a
+            # still-pending claim is dropped so the job can be retried
+            # (the DB status check still guards repeat fallbacks)
+            await self.idempotency.release(idempotency_key)
+
+    async def _process_fallback_batch(
+        self,
+        items: List[Tuple[UUID, str]],
+    ) -> List[Optional[str]]:
+        """
+        Fall back a batch of messages in three phases, so no transaction
+        is held open across the aggregator's HTTP round-trip:
+
+            1. short transaction: load, verify, trigger_fallback, commit
+            2. no session:        send_sms_batch()
+            3. short transaction: reload with row locks, record outcomes
+               where the status is still the one phase 1 wrote, commit;
+               stats are buffered in the StatsCoalescer
+
+        Args:
+            items: (message_id, idempotency_key) per queued job
+
+        Returns:
+            external_id per item (None when nothing was sent)
+        """
+        keys = dict(items)
+
+        # Phase 1 — claim the fallback
+        async with self.db.session() as session:
+            uow = SQLAlchemyUnitOfWork(session)
+
+            # Single async-with block — the context manager commits on
+            # clean exit; tracked messages are written in that flush.
+            async with uow:
+                found = {m.id: m for m in await uow.messages.get_by_ids(list(keys))}
+
+                eligible = []
+                for message_id in keys:
+                    message = found.get(message_id)
                     if not message:
                         logger.error(f"Message {message_id} not found")
-                        return
+                        continue
 
                     if not message.should_fallback_to_sms():
                         logger.warning(
@@ -142,91 +227,123 @@ class SMSFallbackWorker:
                             f"(status={message.status}, "
                             f"fallback_triggered={message.fallback_triggered})"
                         )
-                        return
+                        continue
 
                     message.trigger_fallback()
-                    await uow.messages.save(message)
+                    uow.messages.track(message)
+                    eligible.append(message)
 
-                    sms_text = message.content.to_sms_text()
+                if not eligible:
+                    return [None] * len(items)
 
-                    logger.info(
-                        f"Sending fallback for message {message_id}: "
-                        f"{sms_text[:60]}..."
+                if not self.aggregator:
+                    logger.error(
+                        "SMS fallback adapter not configured — "
+                        f"dropping fallback for {len(eligible)} messages. "
+                        "Set SMS_USERNAME / SMS_PASSWORD / SMS_SENDER_ID in .env."
                     )
+                    for message in eligible:
+                        message.mark_failed(
+                            reason=FailureReason.NETWORK_ERROR,
+                            error_message="SMS adapter not configured",
+                        )
+                    return [None] * len(items)
+
+        # Phase 2 — send, outside any transaction
+        requests = [self._build_request(m) for m in eligible]
+        logger.info(f"Sending fallback batch of {len(eligible)} messages")
+        responses = await self.aggregator.send_sms_batch(requests)
+
+        sent: Dict[UUID, str] = {
+            message.id: response.external_id or "sent"
+            for message, response in zip(eligible, responses)
+            if response.success
+        }
+
+        # Record accepted sends before persisting: a redelivery after a
+        # failed phase-3 commit must not send them again
+        await asyncio.gather(
+            *(
+                self.idempotency.complete(keys[message_id], external_id)
+                for message_id, external_id in sent.items()
+            )
+        )
 
-                    # Build fallback request — use template_id if available,
-                    # otherwise send as plain BASIC text.
-                    request = SendMessageRequest(
-                        message_id=message.id,
-                        recipient_phone=message.recipient_phone,
-                        channel=MessageChannel.SMS,
-                        content_text=sms_text,
-                        priority=message.priority,
-                        metadata={
-                            "template_id": message.content.template_id,
-                            "variables": message.content.variables or [],
-                        },
+        # Phase 3 — persist outcomes
+        async with self.db.session() as session:
+            uow = SQLAlchemyUnitOfWork(session)
+
+            async with uow:
+                # Locked until commit: the status check below and the write
+                # are atomic (a conditional UPDATE ... WHERE status = ...)
+                current = {
+                    m.id: m
+                    for m in await uow.messages.get_by_ids(
+                        [m.id for m in eligible], for_update=True
                     )
+                }
+
+                deltas: Dict[UUID, StatsDelta] = {}
+                for snapshot, response in zip(eligible, responses):
+                    message = current.get(snapshot.id)
+                    # The status phase 1 persisted is the optimistic-lock
+                    # token (updated_at is re-stamped by the repository on
+                    # write, so the in-memory snapshot never matches it)
+                    if message is None or message.status != snapshot.status:
+                        logger.warning(
+                            f"Message {snapshot.id} changed during fallback send "
+                            "— outcome not applied"
+                        )
+                        continue
 
-                    try:
-                        if not self.aggregator:
-                            logger.error(
-                                "SMS fallback adapter not configured — "
-                                f"dropping fallback for message {message_id}. "
-                                "Set SMS_USERNAME / SMS_PASSWORD / SMS_SENDER_ID in .env."
-                            )
-                            message.mark_failed(
-                                reason=FailureReason.NETWORK_ERROR,
-                                error_message="SMS adapter not configured",
-                            )
-                            await uow.messages.save(message)
-                            return
-
-                        response = await self.aggregator.send_sms_message(request)
-
-                        if response.success:
-                            message.mark_fallback_sent(
-                                aggregator=self.aggregator.get_name(),
-                                external_id=response.external_id,
-                            )
-                            await uow.messages.save(message)
-
-                            await uow.campaigns.update_stats(
-                                message.campaign_id, {"fallback_triggered": 1}
-                            )
-
-                            logger.info(
-                                f"✅ Fallback sent for message {message_id} "
-                                f"(external_id={response.external_id})"
-                            )
-
-                        else:
-                            logger.error(
-                                f"Fallback failed for message {message_id}: "
-                                f"{response.error_message}"
-                            )
-                            message.mark_failed(
-                                reason=FailureReason.NETWORK_ERROR,
-                                error_code=response.error_code,
-                                error_message=response.error_message,
-                            )
-                            await uow.messages.save(message)
-
-                            await uow.campaigns.update_stats(
-                                message.campaign_id, {"messages_failed": 1}
-                            )
-
-                    except AggregatorException as e:
-                        logger.error(f"Fallback aggregator error: {e}")
+                    if response.success:
+                        message.mark_fallback_sent(
+                            aggregator=self.aggregator.get_name(),
+                            external_id=response.external_id,
+                        )
+                        delta = StatsDelta(fallback_triggered=1)
+                        logger.info(
+                            f"✅ Fallback sent for message {message.id} "
+                            f"(external_id={response.external_id})"
+                        )
+                    else:
+                        logger.error(
+                            f"Fallback failed for message {message.id}: "
+                            f"{response.error_message}"
+                        )
                         message.mark_failed(
                             reason=FailureReason.NETWORK_ERROR,
-                            error_message=str(e),
+                            error_code=response.error_code,
+                            error_message=response.error_message,
                         )
-                        await uow.messages.save(message)
+                        delta = StatsDelta(messages_failed=1)
+                    uow.messages.track(message)
 
-        except Exception:
-            logger.exception(f"❌ Error processing fallback for {message_id}")
-            raise
+                    prior = deltas.get(message.campaign_id)
+                    deltas[message.campaign_id] = prior + delta if prior else delta
+
+        # Counted only once the outcomes are committed
+        for campaign_id, delta in deltas.items():
+            self.stats_coalescer.add(campaign_id, delta)
+
+        return [sent.get(message_id) for message_id, _ in items]
+
+    def _build_request(self, message: Message) -> SendMessageRequest:
+        """
+        Build the fallback request — template_id if available, otherwise
+        plain BASIC text.
+        """
+        return SendMessageRequest(
+            message_id=message.id,
+            recipient_phone=message.recipient_phone,
+            channel=MessageChannel.SMS,
+            content_text=message.content.to_sms_text(),
+            priority=message.priority,
+            metadata={
+                "template_id": message.content.template_id,
+                "variables": message.content.variables or [],
+            },
+        )
 
 
 async def main():
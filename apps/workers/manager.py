@@ -8,13 +8,22 @@ New approach: each worker runs as an independent asyncio.Task.  If one
 crashes, the manager logs the error, waits a backoff period, and restarts
 that worker individually without touching the others.
 
+Modes:
+    process (default)  each worker runs in its own OS process (spawned),
+                       so a CPU-heavy stall in one — e.g. rendering a large
+                       orchestrator batch — cannot block the event loop of
+                       the others. The parent restarts a process that dies.
+    thread             all workers share one event loop in this process
+                       (the original dev mode; simplest to debug).
+
 NOTE — Production deployment:
     In production (docker-compose.prod.yml), each worker type runs as its
     OWN service with its own entry point (apps/workers/entrypoints/).
     This all-in-one manager is convenient for local development only.
 
 Usage (local dev):
-    python -m apps.workers.manager
+    python -m apps.workers.manager               # one process per worker
+    python -m apps.workers.manager --mode=thread # single process
 
 Production:
     docker compose -f docker-compose.prod.yml up -d
@@ -22,10 +31,12 @@ Production:
     #     worker-fallback as separate scalable services
 """
 
+import argparse
 import asyncio
 import logging
+import multiprocessing
 import signal
-from typing import Dict, Optional
+from typing import Dict, List, Optional
 
 from apps.workers.orchestrator.campaign_orchestrator import CampaignOrchestrator
 from apps.workers.dispatcher.message_dispatcher import MessageDispatcher
@@ -79,31 +90,64 @@ WORKER_CONFIGS = {
 
 RESTART_BACKOFF_SECONDS = 5
 MAX_RESTARTS = 10  # per worker; after this the manager marks it permanently failed
+STOP_GRACE_SECONDS = 30  # process mode: SIGTERM → SIGKILL grace period
+
+# "spawn" gives each child a clean interpreter: no inherited event loop,
+# signal wakeup fd or open sockets from the parent
+_MP = multiprocessing.get_context("spawn")
+
+
+def _run_worker_process(name: str) -> None:
+    """Entry point of a worker child process (process mode)."""
+    try:
+        import uvloop
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    except ImportError:  # e.g. Windows: keep the default asyncio loop
+        pass
+    asyncio.run(main(mode="thread", workers=[name]))
 
 
 class WorkerManager:
     """
     Manages multiple background workers with independent fault isolation.
 
-    Each worker runs in its own asyncio.Task.  A crash in one worker triggers
-    a supervised restart with exponential backoff; it does NOT affect any other
-    worker.
+    In thread mode each worker runs in its own asyncio.Task; in process
+    mode each runs in its own OS process (which itself runs a thread-mode
+    manager for that one worker). Either way a crash triggers a supervised
+    restart with exponential backoff and does NOT affect any other worker.
+
+    Args:
+        mode:     "process" or "thread"
+        workers:  Names from WORKER_CONFIGS to run (default: all)
     """
 
-    def __init__(self):
+    def __init__(
+        self,
+        mode: str = "thread",
+        workers: Optional[List[str]] = None,
+    ):
+        if mode not in ("process", "thread"):
+            raise ValueError(f"Unknown worker mode: {mode}")
+        self.mode = mode
+        self.workers = workers or list(WORKER_CONFIGS)
         self._tasks: Dict[str, asyncio.Task] = {}
+        self._processes: Dict[str, multiprocessing.process.BaseProcess] = {}
         self._restart_counts: Dict[str, int] = {}
         self._shutdown = asyncio.Event()
         self.running = False
 
     async def start_all(self) -> None:
-        """Start all workers as independent supervised tasks."""
-        logger.info("🚀 Starting all workers with fault isolation...")
-
-        for name, cfg in WORKER_CONFIGS.items():
+        """Start all workers as independent supervised tasks/processes."""
+        logger.info("🚀 Starting all workers with fault isolation...", mode=self.mode)
+
+        supervise = (
+            self._supervise_process if self.mode == "process" else self._supervise
+        )
+        for name in self.workers:
+            cfg = WORKER_CONFIGS[name]
             self._restart_counts[name] = 0
             task = asyncio.create_task(
-                self._supervise(name, cfg),
+                supervise(name, cfg),
                 name=f"worker-{name}",
             )
             self._tasks[name] = task
@@ -168,12 +212,65 @@ class WorkerManager:
 
             backoff = min(backoff * 2, 60)  # cap at 60s
 
+    async def _supervise_process(self, name: str, cfg: dict) -> None:
+        """
+        Supervised runner for one worker process.
+
+        The child restarts its worker on ordinary crashes itself; this
+        respawns the process when it dies (OOM kill, segfault, exit).
+        """
+        backoff = RESTART_BACKOFF_SECONDS
+
+        while not self._shutdown.is_set():
+            process = _MP.Process(
+                target=_run_worker_process,
+                args=(name,),
+                name=f"worker-{name}",
+            )
+            process.start()
+            self._processes[name] = process
+            logger.info("[%s] Process started (pid=%s)", name, process.pid)
+
+            # join() blocks, so wait for it off the event loop
+            await asyncio.to_thread(process.join)
+
+            if self._shutdown.is_set():
+                return
+
+            self._restart_counts[name] += 1
+            restarts = self._restart_counts[name]
+            if restarts > MAX_RESTARTS:
+                logger.critical(
+                    "[%s] Exceeded max restarts (%d). Giving up. "
+                    "Other workers are still running.",
+                    name, MAX_RESTARTS,
+                )
+                return
+
+            logger.error(
+                "[%s] Process exited (code %s, restart %d/%d) — restarting in %ds",
+                name, process.exitcode, restarts, MAX_RESTARTS, backoff,
+            )
+
+            try:
+                await asyncio.wait_for(
+                    self._shutdown.wait(),
+                    timeout=backoff,
+                )
+            except asyncio.TimeoutError:
+                pass
+
+            backoff = min(backoff * 2, 60)  # cap at 60s
+
     async def stop_all(self) -> None:
         """Signal all workers to stop and wait for them."""
         logger.info("🛑 Stopping all workers...")
         self._shutdown.set()
         self.running = False
 
+        if self.mode == "process":
+            await self._stop_processes()
+
         # Cancel all tasks
         for name, task in self._tasks.items():
             if not task.done():
@@ -185,15 +282,33 @@ class WorkerManager:
 
         logger.info("✅ All workers stopped")
 
+    async def _stop_processes(self) -> None:
+        """Forward SIGTERM to every child; SIGKILL any still alive after the grace period."""
+        for process in self._processes.values():
+            if process.is_alive():
+                process.terminate()
+
+        def _join_all() -> None:
+            for name, process in self._processes.items():
+                process.join(STOP_GRACE_SECONDS)
+                if process.is_alive():
+                    logger.warning("[%s] Did not stop in %ds — killing", name, STOP_GRACE_SECONDS)
+                    process.kill()
+                    process.join()
+
+        await asyncio.to_thread(_join_all)
+
 
-async def main():
-    manager = WorkerManager()
+async def main(mode: str = "thread", workers: Optional[List[str]] = None):
+    manager = WorkerManager(mode=mode, workers=workers)
 
     loop = asyncio.get_running_loop()
 
     def _handle_signal():
+        # Only flag the shutdown; the single stop_all() below runs in this
+        # coroutine, so repeated signals cannot start overlapping stops
         logger.info("Received shutdown signal")
-        asyncio.create_task(manager.stop_all())
+        manager._shutdown.set()
 
     # loop.add_signal_handler is Unix-only; gracefully skip on Windows
     try:
@@ -205,9 +320,8 @@ async def main():
 
     try:
         await manager.start_all()
-        # Block until shutdown
-        while manager.running:
-            await asyncio.sleep(1)
+        # Block until shutdown — no polling
+        await manager._shutdown.wait()
     except KeyboardInterrupt:
         logger.info("Keyboard interrupt")
     except Exception:
@@ -217,4 +331,12 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    parser = argparse.ArgumentParser(description="Run all background workers")
+    parser.add_argument(
+        "--mode",
+        choices=("process", "thread"),
+        default="process",
+        help="process: one OS process per worker; thread: one shared event loop",
+    )
+    args = parser.parse_args()
+    asyncio.run(main(mode=args.mode))
@@ -9,25 +9,34 @@ Flow:
     2. Load campaign and template from DB
     3. Load recipients from audience
     4. Create Message entities with template_id + variables
-    5. Bulk save to database
-    6. Queue messages for dispatcher
+    5. Bulk save to database (by default one INSERT ... SELECT per audience
+       page, rendered in Postgres; server_render=False streams contacts
+       through Python and COPYs the rendered rows instead)
+    6. Queue messages for dispatcher (each checkpoint commits the audience
+       position reached into campaign metadata, so a redelivered job
+       resumes there instead of re-creating committed messages)
     7. Update campaign statistics
 """
 
 import asyncio
 import logging
 import time
-from typing import AsyncGenerator, List, Dict, Any
+from typing import AsyncGenerator, List, Dict, Any, Optional, Set, Tuple
 from uuid import UUID
-from datetime import datetime
+from datetime import datetime, timedelta
 
 from apps.core.domain.campaign import Campaign, CampaignStatus
 from apps.core.domain.message import Message, MessageContent
+from apps.core.domain.template import CompiledTemplate
 from apps.core.services.campaign_service import CampaignService
+from apps.adapters.cache.idempotency import IdempotencyGuard
 from apps.adapters.db.postgres import Database, get_database
 from apps.adapters.db.unit_of_work import SQLAlchemyUnitOfWork
 from apps.adapters.queue.rabbitmq import RabbitMQAdapter
-from apps.core.ports.queue import QueueMessage, QueuePriority, QueueJob
+from apps.core.resilience.token_bucket import TokenBucket
+from apps.core.ports.queue import (
+    QueueMessage, QueuePriority, QueueJob, route_by_priority,
+)
 from apps.core.config import get_settings
 
 
@@ -37,6 +46,22 @@ configure_structlog(service="worker")
 
 logger = logging.getLogger(__name__)
 
+# Message priority string -> queue priority (module-level: no per-call dict)
+_PRIORITY_MAP = {
+    "low": QueuePriority.LOW,
+    "medium": QueuePriority.MEDIUM,
+    "high": QueuePriority.HIGH,
+    "urgent": QueuePriority.URGENT,
+}
+
+
+# Where audience expansion stands: (index into campaign.audience_ids, last
+# contact id done in that audience or None for its start)
+Position = Tuple[int, Optional[UUID]]
+
+# Campaign metadata key holding the last committed Position (see _checkpoint)
+_CURSOR_KEY = "orchestration_cursor"
+
 
 def _log(level: str, msg: str, **ctx):
     """Emit a structured log with consistent context fields."""
@@ -55,18 +80,37 @@ class CampaignOrchestrator:
         >>> await orchestrator.start()
     """
 
+    # Messages per commit + dispatch checkpoint (bounds redelivery work)
+    _CHECKPOINT_ROWS = 10_000
+    # Audience contacts per server-side INSERT ... SELECT
+    _SERVER_PAGE_ROWS = 1000
+    # Redelivery delay for a job whose tenant already has a campaign running
+    _BUSY_TENANT_DELAY = timedelta(seconds=30)
+
     def __init__(
         self,
         db: Database = None,
         queue: RabbitMQAdapter = None,
         batch_size: int = 100,
         poll_interval: int = 10,
+        campaign_concurrency: int = 4,
+        server_render: bool = True,
     ):
         self.db = db or get_database()
         self.queue = queue
         self.batch_size = batch_size
         self.poll_interval = poll_interval
+        self.campaign_concurrency = campaign_concurrency
+        self.server_render = server_render
+        # Campaigns of one tenant run one at a time (keeps each tenant's
+        # rate limit meaningful); different tenants run concurrently.
+        # Holds only tenants with a campaign in flight.
+        self._busy_tenants: Set[str] = set()
         self.settings = get_settings()
+        # Redeliveries of a campaign job are acked without re-expanding it
+        self.idempotency = IdempotencyGuard(
+            self.settings.redis.url, prefix="orch:idem"
+        )
         self.running = False
 
     async def start(self) -> None:
@@ -78,7 +122,7 @@ class CampaignOrchestrator:
         if not self.queue:
             self.queue = RabbitMQAdapter(
                 url=self.settings.rabbitmq.url,
-                prefetch_count=1,
+                prefetch_count=self.campaign_concurrency,
             )
         await self.queue.connect()
 
@@ -87,7 +131,7 @@ class CampaignOrchestrator:
         await self.queue.subscribe(
             queue_name=self.settings.queue_names["campaign_orchestrator"],
             handler=self.process_campaign_job,
-            prefetch=1,
+            prefetch=self.campaign_concurrency,
         )
 
         logger.info("✅ Campaign Orchestrator ready")
@@ -96,22 +140,64 @@ class CampaignOrchestrator:
         """Stop the orchestrator worker"""
         logger.info("🛑 Campaign Orchestrator stopping...")
         self.running = False
+        await self.idempotency.close()
         await self.queue.close()
         await self.db.disconnect()
 
     async def process_campaign_job(self, job: QueueJob) -> None:
         """
-        Process a campaign execution job.
+        Process a campaign execution job (serialized per tenant).
+
+        A job whose tenant already has a campaign in flight is not waited
+        on — that would hold a prefetch slot other tenants could use — but
+        re-published with a delay and acked.
 
         Args:
-            job: Queue job with campaign_id
+            job: Queue job with campaign_id (and tenant_id; jobs enqueued
+                 before it was added are serialized per campaign only)
         """
+        tenant_key = job.payload.get("tenant_id") or job.payload["campaign_id"]
+        if tenant_key in self._busy_tenants:
+            await self.queue.enqueue(
+                QueueMessage(
+                    id=job.id,
+                    queue_name=job.queue_name,
+                    payload=job.payload,
+                    delay=self._BUSY_TENANT_DELAY,
+                    max_retries=job.max_retries,
+                    metadata=job.metadata,
+                )
+            )
+            _log("info", "Tenant busy — campaign job deferred",
+                 campaign_id=job.payload["campaign_id"],
+                 tenant_key=tenant_key,
+                 delay_seconds=self._BUSY_TENANT_DELAY.total_seconds(),
+                 step="tenant_busy")
+            return
+
+        self._busy_tenants.add(tenant_key)
+        try:
+            await self._process_campaign_job(job)
+        finally:
+            self._busy_tenants.discard(tenant_key)
+
+    async def _process_campaign_job(self, job: QueueJob) -> None:
+        """Orchestrate one campaign: expand the audience, save, dispatch."""
         campaign_id = UUID(job.payload["campaign_id"])
         start_time = time.monotonic()
 
         _log("info", "STEP 1/7 | Campaign job received — starting orchestration",
              campaign_id=str(campaign_id), step="job_received")
 
+        idempotency_key = job.payload.get("idempotency_key") or str(campaign_id)
+        if not await self.idempotency.claim(idempotency_key):
+            _log("info", "STEP 1/7 | Campaign job deduplicated — already orchestrated",
+                 campaign_id=str(campaign_id),
+                 prior_result=await self.idempotency.get(idempotency_key),
+                 step="deduplicated")
+            return
+
+        completed = False
         try:
             async with self.db.session() as session:
                 uow = SQLAlchemyUnitOfWork(session)
@@ -185,47 +271,82 @@ class CampaignOrchestrator:
 
                     # STEP 4 / 5 / 6: Stream recipients in batches and create+queue messages
                     # Memory usage is bounded to batch_size rows at a time.
-                    total_created = 0
+                    # A run that failed after a checkpoint resumes from the
+                    # committed cursor instead of re-creating its messages.
+                    start, total_created = await self._resume_point(uow, campaign)
+                    position = start
                     batch_num = 0
-                    found_any = False
+                    found_any = total_created > 0
+
+                    # One count up front for progress metrics; the stream
+                    # itself never materialises the audience
+                    expected_recipients = 0
+                    for audience_id in campaign.audience_ids:
+                        expected_recipients += await uow.audiences.count_contacts(
+                            audience_id
+                        )
+
+                    # Messages are COPYed per batch but committed (and only
+                    # then queued — the dispatcher must see the rows) every
+                    # checkpoint. A rate-limited campaign keeps per-batch
+                    # checkpoints, paced by a token bucket at rate_limit/s.
+                    checkpoint_rows = (
+                        self.batch_size if campaign.rate_limit
+                        else self._CHECKPOINT_ROWS
+                    )
+                    bucket = (
+                        TokenBucket(
+                            rate=campaign.rate_limit,
+                            capacity=campaign.rate_limit,
+                        )
+                        if campaign.rate_limit else None
+                    )
+                    uncommitted: List[str] = []
 
-                    async for recipient_batch in self._stream_campaign_recipients(
-                        campaign_id=campaign_id, uow=uow
-                    ):
+                    batches = (
+                        self._insert_messages_server_side(
+                            campaign, template, uow, start
+                        )
+                        if self.server_render
+                        else self._insert_messages_streamed(
+                            campaign, template, uow, start
+                        )
+                    )
+                    async for message_ids, position in batches:
                         found_any = True
                         batch_num += 1
+                        # Still running: keep the claim's lease alive
+                        await self.idempotency.renew(idempotency_key)
+
+                        uncommitted.extend(message_ids)
+                        total_created += len(message_ids)
 
                         _log(
                             "info",
-                            "STEP 4-5/7 | Creating message batch from streamed contacts",
+                            "STEP 4-5/7 | Message batch created from audience contacts",
                             campaign_id=str(campaign_id),
                             batch_number=batch_num,
-                            batch_size=len(recipient_batch),
+                            batch_size=len(message_ids),
+                            created_so_far=total_created,
+                            expected_recipients=expected_recipients,
                             step="stream_batch",
                         )
 
-                        messages = await self._create_messages(
-                            campaign=campaign,
-                            recipients=recipient_batch,
-                            template=template,
-                            uow=uow,
+                        if len(uncommitted) >= checkpoint_rows:
+                            if bucket:
+                                await bucket.acquire(len(uncommitted))
+                            await self._checkpoint(
+                                uow, campaign, uncommitted, position, total_created
+                            )
+                            uncommitted = []
+
+                    if uncommitted:
+                        if bucket:
+                            await bucket.acquire(len(uncommitted))
+                        await self._checkpoint(
+                            uow, campaign, uncommitted, position, total_created
                         )
 
-                        _log(
-                            "info",
-                            "STEP 6/7 | Queuing batch for dispatch",
-                            campaign_id=str(campaign_id),
-                            batch_number=batch_num,
-                            messages_queued=len(messages),
-                            step="queue_messages",
-                        )
-
-                        await self._queue_messages_for_dispatch(messages)
-                        total_created += len(messages)
-
-                        if campaign.rate_limit:
-                            await self._apply_rate_limit(campaign.rate_limit)
-
                     if not found_any:
                         _log(
                             "warning",
@@ -239,7 +360,12 @@ class CampaignOrchestrator:
 
                     # STEP 7: Finalize
                     campaign.recipient_count = total_created
+                    campaign.metadata = {
+                        k: v for k, v in campaign.metadata.items()
+                        if k != _CURSOR_KEY
+                    }
                     await uow.campaigns.save(campaign)
+                    completed = True
 
                     elapsed = round(time.monotonic() - start_time, 2)
                     _log("info", "STEP 7/7 | Campaign orchestration complete",
@@ -250,6 +376,7 @@ class CampaignOrchestrator:
                          step="complete")
 
         except Exception as e:
+            completed = False  # e.g. the final commit failed
             elapsed = round(time.monotonic() - start_time, 2)
             _log("exception", "Campaign orchestration failed",
                  campaign_id=str(campaign_id),
@@ -258,6 +385,16 @@ class CampaignOrchestrator:
                  step="failed")
             raise
 
+        finally:
+            # Keep the claim only for a finished run; skipped or failed
+            # jobs must stay runnable on redelivery / re-activation
+            if completed:
+                await self.idempotency.complete(
+                    idempotency_key, f"queued:{total_created}"
+                )
+            else:
+                await self.idempotency.release(idempotency_key)
+
     def _should_execute_campaign(self, campaign: Campaign) -> bool:
         """Check if campaign should be executed"""
         if campaign.status not in [
@@ -274,9 +411,10 @@ class CampaignOrchestrator:
 
     async def _stream_campaign_recipients(
         self,
-        campaign_id: UUID,
+        campaign: Campaign,
         uow: SQLAlchemyUnitOfWork,
-    ) -> AsyncGenerator[List[Dict[str, Any]], None]:
+        start: Position = (0, None),
+    ) -> AsyncGenerator[Tuple[List[Dict[str, Any]], Position], None]:
         """
         Stream recipients for a campaign in batches from the audience_contacts table.
 
@@ -284,7 +422,7 @@ class CampaignOrchestrator:
         which loaded all contacts into a Python list in one shot.
 
         How it works:
-          1. Read audience_ids from campaign.metadata_
+          1. Take audience_ids from the loaded campaign (restored from metadata)
           2. For each audience, call repo.stream_contacts() — an async generator
              that issues keyset-paginated DB queries (1 000 rows at a time)
           3. Yield each batch as a list of {phone, variables} dicts
@@ -292,46 +430,44 @@ class CampaignOrchestrator:
         Memory usage: bounded to batch_size rows (1 000) regardless of audience size.
 
         Example:
-            async for batch in self._stream_campaign_recipients(campaign_id, uow):
+            async for batch, position in self._stream_campaign_recipients(campaign, uow):
                 # batch is List[Dict[str, Any]] with keys: phone, variables
                 messages = await self._create_messages(campaign, batch, template, uow)
 
         Args:
-            campaign_id: Campaign being executed
-            uow:         Unit of Work (provides the audience repository)
+            campaign: Campaign being executed
+            uow:      Unit of Work (provides the audience repository)
+            start:    Position to resume from
 
         Yields:
-            List[Dict[str, Any]] — each dict has {"phone": str, "variables": list}
+            (List[Dict[str, Any]] — each dict has {"phone": str, "variables": list},
+            Position after the batch)
         """
-        from apps.adapters.db.models import CampaignModel
-        from sqlalchemy import select
-
-        # Resolve audience IDs from the campaign row
-        stmt = select(CampaignModel).where(CampaignModel.id == campaign_id)
-        result = await uow.session.execute(stmt)
-        campaign_model = result.scalar_one_or_none()
-
-        if not campaign_model:
-            return
-
-        audience_ids = campaign_model.metadata_.get("audience_ids", [])
+        # audience_ids were restored from metadata when the campaign was
+        # loaded — no need to re-read the campaign row here
+        audience_ids = campaign.audience_ids
         if not audience_ids:
             logger.warning(
                 "Campaign %s has no audience_ids in metadata. "
                 "Add audience_ids list to campaign.metadata before activating.",
-                campaign_id,
+                campaign.id,
             )
             return
 
-        for audience_id in audience_ids:
+        first, after_id = start
+        for index in range(first, len(audience_ids)):
+            audience_id = audience_ids[index]
             logger.info(
                 "Streaming contacts for audience %s (campaign %s)",
-                audience_id, campaign_id,
+                audience_id, campaign.id,
             )
 
             # stream_contacts() is an async generator — each iteration yields
             # at most 1 000 AudienceContactModel rows without loading the rest.
-            async for contact_rows in uow.audiences.stream_contacts(audience_id):
+            async for contact_rows in uow.audiences.stream_contacts(
+                audience_id,
+                after_id=after_id if index == first else None,
+            ):
                 batch: List[Dict[str, Any]] = []
                 for row in contact_rows:
                     phone = row.phone_number
@@ -343,12 +479,101 @@ class CampaignOrchestrator:
                     })
 
                 if batch:
-                    yield batch
+                    yield batch, (index, contact_rows[-1].id)
+
+    async def _insert_messages_server_side(
+        self,
+        campaign: Campaign,
+        template,
+        uow: SQLAlchemyUnitOfWork,
+        start: Position = (0, None),
+    ) -> AsyncGenerator[Tuple[List[str], Position], None]:
+        """
+        Create the campaign's messages in Postgres, one INSERT ... SELECT
+        per audience page; contacts never travel to the worker.
+
+        Yields:
+            (ids of the messages created for each page (not yet committed),
+            Position after the page)
+        """
+        if not campaign.audience_ids:
+            logger.warning(
+                "Campaign %s has no audience_ids in metadata. "
+                "Add audience_ids list to campaign.metadata before activating.",
+                campaign.id,
+            )
+            return
+
+        # Shared column values for every row; text is rendered per contact
+        prototype = Message.create(
+            campaign_id=campaign.id,
+            tenant_id=campaign.tenant_id,
+            recipient_phone="",
+            content=MessageContent(
+                text="",
+                template_id=template.external_template_id,
+                variables=[],
+                rcs_type=getattr(template, 'rcs_type', 'BASIC'),
+            ),
+            priority=campaign.priority.value,
+        )
+        variable_names = [v.name for v in template.variables]
+        page_rows = (
+            self.batch_size if campaign.rate_limit else self._SERVER_PAGE_ROWS
+        )
+
+        first, after_id = start
+        for index in range(first, len(campaign.audience_ids)):
+            audience_id = campaign.audience_ids[index]
+            cursor: Optional[UUID] = after_id if index == first else None
+            while True:
+                message_ids, cursor = await uow.messages.insert_from_audience(
+                    prototype,
+                    audience_id,
+                    template.content,
+                    variable_names,
+                    after_contact_id=cursor,
+                    limit=page_rows,
+                )
+                # Past the last page, the audience is done: next one's start
+                position = (index, cursor) if cursor else (index + 1, None)
+                if message_ids:
+                    yield message_ids, position
+                if cursor is None:
+                    break
+
+    async def _insert_messages_streamed(
+        self,
+        campaign: Campaign,
+        template,
+        uow: SQLAlchemyUnitOfWork,
+        start: Position = (0, None),
+    ) -> AsyncGenerator[Tuple[List[str], Position], None]:
+        """
+        Create the campaign's messages by streaming contacts, rendering in
+        Python and COPYing each batch (server_render=False).
+
+        Yields:
+            (ids of the messages created for each batch (not yet committed),
+            Position after the batch)
+        """
+        async for recipient_batch, position in self._stream_campaign_recipients(
+            campaign=campaign, uow=uow, start=start
+        ):
+            messages = await self._create_messages(
+                campaign=campaign,
+                recipients=recipient_batch,
+                template=template,
+                uow=uow,
+            )
+            yield [str(message.id) for message in messages], position
 
     async def _get_template_content(
         self,
         template,
         recipient_variables: List[Any],
+        compiled: Optional[CompiledTemplate] = None,
+        rendered_text: Optional[str] = None,
     ) -> MessageContent:
         """
         Build MessageContent from template and per-recipient variable values.
@@ -356,18 +581,17 @@ class CampaignOrchestrator:
         Args:
             template:            Template domain object (must have external_template_id)
             recipient_variables: Ordered list of variable values for this recipient
+            compiled:            Pre-compiled template text (hoisted per batch)
+            rendered_text:       Already-rendered text (memoized by the caller)
 
         Returns:
             MessageContent with template_id and variables set
         """
         # Render text locally for fallback/preview purposes
-        rendered_text = template.content
-        for i, var in enumerate(template.variables):
-            if i < len(recipient_variables):
-                placeholder = f"{{{{{var.name}}}}}"
-                rendered_text = rendered_text.replace(
-                    placeholder, str(recipient_variables[i])
-                )
+        if rendered_text is None:
+            if compiled is None:
+                compiled = template.compiled()
+            rendered_text = compiled.render(recipient_variables)
 
         return MessageContent(
             text=rendered_text,
@@ -393,14 +617,32 @@ class CampaignOrchestrator:
             uow:        Unit of Work
 
         Returns:
-            Created and saved messages
+            Created messages (written, not yet committed)
         """
         messages = []
 
+        # Parse the template once per batch, not once per recipient
+        compiled = template.compiled()
+        # Recipients often share variable values (or have none at all):
+        # render each distinct values tuple once per batch
+        rendered: Dict[Tuple[Any, ...], str] = {}
+
         for recipient in recipients:
+            variables = recipient.get("variables", [])
+            try:
+                key = tuple(variables)
+                text = rendered.get(key)
+                if text is None:
+                    text = rendered[key] = compiled.render(variables)
+            except TypeError:
+                # Unhashable (nested JSON) values — render uncached
+                text = compiled.render(variables)
+
             content = await self._get_template_content(
                 template=template,
-                recipient_variables=recipient.get("variables", []),
+                recipient_variables=variables,
+                compiled=compiled,
+                rendered_text=text,
             )
 
             message = Message.create(
@@ -413,43 +655,121 @@ class CampaignOrchestrator:
 
             messages.append(message)
 
-        # Bulk save
-        messages = await uow.messages.save_batch(messages)
-        await uow.commit()
+        # COPY into the current transaction; the caller commits at
+        # checkpoints, not once per batch
+        await uow.messages.bulk_copy(messages)
 
         return messages
 
+    async def _checkpoint(
+        self,
+        uow: SQLAlchemyUnitOfWork,
+        campaign: Campaign,
+        message_ids: List[str],
+        position: Position,
+        total_created: int,
+    ) -> None:
+        """
+        Commit the inserted messages together with the position they reach,
+        then queue them for dispatch.
+        """
+        index, after_id = position
+        # A new dict, not an in-place edit: the JSON column only sees
+        # reassignment as a change
+        campaign.metadata = {
+            **campaign.metadata,
+            _CURSOR_KEY: {
+                "audience_index": index,
+                "after_contact_id": str(after_id) if after_id else None,
+                "created": total_created,
+            },
+        }
+        await uow.campaigns.save(campaign)
+        await uow.commit()
+
+        _log(
+            "info",
+            "STEP 6/7 | Queuing committed messages for dispatch",
+            campaign_id=str(campaign.id),
+            messages_queued=len(message_ids),
+            step="queue_messages",
+        )
+
+        await self._queue_messages_for_dispatch(message_ids, campaign.priority.value)
+
+    async def _resume_point(
+        self,
+        uow: SQLAlchemyUnitOfWork,
+        campaign: Campaign,
+    ) -> Tuple[Position, int]:
+        """
+        Position and message count of the last committed checkpoint
+        ((0, None), 0 for a fresh run).
+
+        On resume, the campaign's PENDING messages are queued again first:
+        the failed run may have committed a checkpoint and died before its
+        publish. The dispatcher's claim makes any duplicate job a no-op.
+        """
+        cursor = campaign.metadata.get(_CURSOR_KEY)
+        if not cursor:
+            return (0, None), 0
+
+        requeued = 0
+        after_id: Optional[UUID] = None
+        while True:
+            rows = await uow.messages.get_pending_page(
+                campaign.id,
+                list(_PRIORITY_MAP),
+                after_id=after_id,
+                limit=self._CHECKPOINT_ROWS,
+            )
+            if not rows:
+                break
+            await self._queue_messages_for_dispatch(
+                [message_id for message_id, _ in rows], campaign.priority.value
+            )
+            requeued += len(rows)
+            after_id = UUID(rows[-1][0])
+
+        after_contact_id = cursor.get("after_contact_id")
+        position = (
+            cursor["audience_index"],
+            UUID(after_contact_id) if after_contact_id else None,
+        )
+        _log("info", "STEP 4/7 | Resuming orchestration from checkpoint",
+             campaign_id=str(campaign.id),
+             audience_index=position[0],
+             created_before=cursor["created"],
+             pending_requeued=requeued,
+             step="resume")
+        return position, cursor["created"]
+
     async def _queue_messages_for_dispatch(
         self,
-        messages: List[Message],
+        message_ids: List[str],
+        priority: str,
     ) -> None:
-        """Queue messages for dispatcher worker"""
+        """Queue messages for dispatcher worker (bulk priorities → transient queue)"""
+        # A campaign's messages share its priority, hence one target queue
+        queue_priority = self._map_priority(priority)
+        queue_name = route_by_priority(
+            self.settings.queue_names["message_dispatcher"], queue_priority
+        )
         queue_messages = [
             QueueMessage(
-                id=str(message.id),
-                queue_name=self.settings.queue_names["message_dispatcher"],
-                payload={"message_id": str(message.id)},
-                priority=self._map_priority(message.priority),
+                id=message_id,
+                queue_name=queue_name,
+                payload={"message_id": message_id},
+                priority=queue_priority,
             )
-            for message in messages
+            for message_id in message_ids
         ]
 
         await self.queue.enqueue_batch(queue_messages)
 
-    async def _apply_rate_limit(self, rate_limit: int) -> None:
-        """Apply rate limiting between batches"""
-        delay = self.batch_size / rate_limit
-        await asyncio.sleep(delay)
-
     def _map_priority(self, priority: str) -> QueuePriority:
         """Map priority string to queue priority"""
-        mapping = {
-            "low": QueuePriority.LOW,
-            "medium": QueuePriority.MEDIUM,
-            "high": QueuePriority.HIGH,
-            "urgent": QueuePriority.URGENT,
-        }
-        return mapping.get(priority, QueuePriority.MEDIUM)
+        return _PRIORITY_MAP.get(priority, QueuePriority.MEDIUM)
 
 
 async def main():
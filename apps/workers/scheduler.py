@@ -1,14 +1,38 @@
 """
 Scheduled Campaign Poller
 
-Polls the database every 60 seconds for campaigns that are scheduled
-and ready to be activated (scheduled_for <= now).
+Polls every 60 seconds for campaigns that are scheduled and ready to be
+activated (scheduled_for <= now).
+
+Due campaigns are read from the Redis "campaigns:scheduled" sorted set
+(ZRANGEBYSCORE 0..now) and hydrated with one get_many() query. The index
+is rebuilt from Postgres on startup and every SCHEDULED campaign is
+re-added each `index_sync_interval`, so a schedule whose ZADD failed is
+still activated; if Redis is unavailable the poller falls back to the
+get_scheduled_campaigns() range query.
+
+Once a day it also pre-creates the upcoming monthly partitions of the
+events table (ensure_events_partitions(), migration 013).
+
+Every few minutes it reconciles the dispatch queues with Postgres, for
+ACTIVE campaigns only:
+    - Bulk dispatch jobs live on transient ".bulk" queues, so a broker
+      restart drops them while their rows stay PENDING. When the broker
+      has restarted (RabbitMQAdapter.broker_restarted()), the PENDING
+      rows of the bulk priorities are republished. Jobs that merely wait
+      behind a long backlog are never touched.
+    - The dispatcher claims a row (PENDING -> QUEUED) before sending. A
+      claim older than `claim_lease` seconds belongs to a consumer that
+      died mid-job; the row is reset to PENDING and republished.
+A duplicate job is harmless: only one copy wins claim_for_dispatch().
 
 Responsibilities:
     - Query scheduled campaigns
     - Activate campaigns that are due
     - Handle errors gracefully
     - Log all activations
+    - Pre-create events partitions
+    - Republish dispatch jobs lost with the broker or a dead consumer
 
 Usage:
     worker = ScheduledCampaignPoller()
@@ -16,21 +40,40 @@ Usage:
 """
 
 import asyncio
-from datetime import datetime
-from typing import List
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Tuple
+from uuid import UUID
 
 import structlog
+from sqlalchemy import text
 
 from apps.adapters.db.postgres import get_database
 from apps.adapters.db.unit_of_work import SQLAlchemyUnitOfWork
+from apps.adapters.cache.scheduled_campaigns import get_scheduled_index
 from apps.adapters.queue.rabbitmq import RabbitMQAdapter
 from apps.core.config import get_settings
+from apps.core.ports.queue import (
+    TRANSIENT_QUEUE_SUFFIX, QueuePriority, encode_job_body, route_by_priority,
+)
 from apps.core.services.campaign_service import CampaignService
-from apps.core.domain.campaign import Campaign
+from apps.core.domain.campaign import Campaign, CampaignStatus
 
 
 logger = structlog.get_logger(__name__)
 
+_PRIORITY_MAP = {
+    "low": QueuePriority.LOW,
+    "medium": QueuePriority.MEDIUM,
+    "high": QueuePriority.HIGH,
+    "urgent": QueuePriority.URGENT,
+}
+
+# Message priorities whose dispatch jobs go to a transient ".bulk" queue
+_BULK_PRIORITIES = [
+    name for name, priority in _PRIORITY_MAP.items()
+    if route_by_priority("", priority).endswith(TRANSIENT_QUEUE_SUFFIX)
+]
+
 
 class ScheduledCampaignPoller:
     """
@@ -40,17 +83,43 @@ class ScheduledCampaignPoller:
     with status='scheduled' and scheduled_for <= now().
     """
     
-    def __init__(self, poll_interval: int = 60):
+    # Messages per reconcile query
+    _RECONCILE_PAGE = 1000
+    # Transient queue whose absence means the broker restarted
+    _BROKER_SENTINEL = "rcs.scheduler.broker-sentinel"
+    
+    def __init__(
+        self,
+        poll_interval: int = 60,
+        batch_size: int = 100,
+        reconcile_interval: int = 300,
+        claim_lease: int = 600,
+        index_sync_interval: int = 300,
+    ):
         """
         Initialize poller
         
         Args:
             poll_interval: Seconds between polls (default: 60)
+            batch_size: Max campaigns activated per poll (default: 100)
+            reconcile_interval: Seconds between dispatch-queue reconciles
+            claim_lease: Seconds a dispatcher claim (QUEUED) may stay
+                uncommitted before the message is released and republished
+            index_sync_interval: Seconds between re-adding SCHEDULED
+                campaigns from Postgres to the Redis index
         """
         self.poll_interval = poll_interval
+        self.batch_size = batch_size
+        self.reconcile_interval = timedelta(seconds=reconcile_interval)
+        self.claim_lease = timedelta(seconds=claim_lease)
+        self._reconciled_at = None
+        self.index_sync_interval = timedelta(seconds=index_sync_interval)
+        self._index_synced_at = datetime.now(timezone.utc)
         self.settings = get_settings()
+        self.index = get_scheduled_index()
         self.running = False
         self._task = None
+        self._partitions_checked_on = None
         
     async def start(self):
         """Start the poller"""
@@ -61,6 +130,7 @@ class ScheduledCampaignPoller:
         )
         
         try:
+            await self._rebuild_index()
             await self._poll_loop()
         except asyncio.CancelledError:
             logger.info("scheduled_campaign_poller_cancelled")
@@ -70,6 +140,7 @@ class ScheduledCampaignPoller:
             raise
         finally:
             self.running = False
+            await self.index.close()
             logger.info("scheduled_campaign_poller_stopped")
     
     async def stop(self):
@@ -86,14 +157,191 @@ class ScheduledCampaignPoller:
     async def _poll_loop(self):
         """Main polling loop"""
         while self.running:
+            try:
+                await self._sync_index()
+            except Exception:
+                logger.exception("scheduled_index_sync_error")
+            
             try:
                 await self._poll_and_activate()
             except Exception:
                 logger.exception("poll_cycle_error")
             
+            # Housekeeping is isolated: a failure here (e.g. migration 013
+            # not applied yet) is retried next cycle and never blocks
+            # campaign activation above
+            try:
+                await self._ensure_event_partitions()
+            except Exception:
+                logger.exception("events_partitions_error")
+            
+            try:
+                await self._reconcile_unsent()
+            except Exception:
+                logger.exception("reconcile_unsent_error")
+            
             # Wait for next poll interval
             await asyncio.sleep(self.poll_interval)
     
+    async def _ensure_event_partitions(self):
+        """Create the next months' events partitions (once per day)"""
+        today = datetime.now(timezone.utc).date()
+        if self._partitions_checked_on == today:
+            return
+        
+        db = get_database()
+        async with db.session() as session:
+            result = await session.execute(text("SELECT ensure_events_partitions()"))
+            created = result.scalar()
+            await session.commit()
+        
+        self._partitions_checked_on = today
+        if created:
+            logger.info("events_partitions_created", count=created)
+    
+    async def _reconcile_unsent(self):
+        """Republish dispatch jobs lost with the broker or a dead consumer"""
+        now = datetime.now(timezone.utc)
+        if self._reconciled_at and now - self._reconciled_at < self.reconcile_interval:
+            return
+        self._reconciled_at = now
+        claimed_before = now - self.claim_lease
+        
+        db = get_database()
+        # Fresh connection per reconcile (see broker_restarted())
+        queue = RabbitMQAdapter(url=self.settings.rabbitmq.url)
+        await queue.connect()
+        try:
+            broker_restarted = await queue.broker_restarted(self._BROKER_SENTINEL)
+            if broker_restarted:
+                logger.warning("broker_restart_detected")
+            
+            async with db.session() as session:
+                uow = SQLAlchemyUnitOfWork(session)
+                campaigns = await uow.campaigns.get_active_campaigns()
+                
+                for campaign in campaigns:
+                    released = 0
+                    while True:
+                        rows = await uow.messages.release_stale_claims(
+                            campaign.id, claimed_before, limit=self._RECONCILE_PAGE
+                        )
+                        # Commit the release before publishing, or the
+                        # republished job could find the row still QUEUED
+                        await session.commit()
+                        if not rows:
+                            break
+                        await self._republish(queue, rows)
+                        released += len(rows)
+                        if len(rows) < self._RECONCILE_PAGE:
+                            break
+                    
+                    lost = 0
+                    if broker_restarted:
+                        after_id = None
+                        while True:
+                            rows = await uow.messages.get_pending_page(
+                                campaign.id,
+                                _BULK_PRIORITIES,
+                                after_id=after_id,
+                                limit=self._RECONCILE_PAGE,
+                            )
+                            if not rows:
+                                break
+                            await self._republish(queue, rows)
+                            lost += len(rows)
+                            after_id = UUID(rows[-1][0])
+                            if len(rows) < self._RECONCILE_PAGE:
+                                break
+                        await session.commit()
+                    
+                    if released or lost:
+                        logger.warning(
+                            "dispatch_jobs_republished",
+                            campaign_id=str(campaign.id),
+                            stale_claims=released,
+                            lost_in_restart=lost,
+                        )
+        finally:
+            await queue.close()
+    
+    async def _republish(
+        self,
+        queue: RabbitMQAdapter,
+        rows: List[Tuple[str, str]],
+    ):
+        """Publish dispatch jobs for (message_id, priority) rows"""
+        groups: Dict[QueuePriority, Tuple[List[str], List[bytes]]] = {}
+        for message_id, priority in rows:
+            ids, bodies = groups.setdefault(
+                _PRIORITY_MAP.get(priority, QueuePriority.MEDIUM), ([], [])
+            )
+            ids.append(message_id)
+            bodies.append(encode_job_body(message_id, {"message_id": message_id}))
+        
+        dispatcher_queue = self.settings.queue_names["message_dispatcher"]
+        for priority, (ids, bodies) in groups.items():
+            await queue.publish_many(
+                route_by_priority(dispatcher_queue, priority),
+                bodies,
+                priority=priority,
+                message_ids=ids,
+            )
+    
+    async def _sync_index(self):
+        """Re-add every SCHEDULED campaign to the Redis index (periodically)"""
+        now = datetime.now(timezone.utc)
+        if now - self._index_synced_at < self.index_sync_interval:
+            return
+        self._index_synced_at = now
+        
+        db = get_database()
+        async with db.session() as session:
+            uow = SQLAlchemyUnitOfWork(session)
+            scheduled = await uow.campaigns.get_scheduled_campaigns(
+                before=datetime.max.replace(tzinfo=timezone.utc)
+            )
+        
+        indexed = await self.index.add_many(scheduled)
+        logger.debug("scheduled_index_synced", indexed=indexed)
+    
+    async def _rebuild_index(self):
+        """Repopulate the Redis scheduled index from Postgres (source of truth)"""
+        db = get_database()
+        
+        async with db.session() as session:
+            uow = SQLAlchemyUnitOfWork(session)
+            scheduled = await uow.campaigns.get_scheduled_campaigns(
+                before=datetime.max.replace(tzinfo=timezone.utc)
+            )
+        
+        indexed = await self.index.rebuild(scheduled)
+        logger.info("scheduled_index_rebuilt", indexed=indexed)
+    
+    async def _get_due_campaigns(
+        self,
+        uow: SQLAlchemyUnitOfWork,
+        now: datetime,
+    ) -> List[Campaign]:
+        """Due campaigns via the Redis index, falling back to a DB range scan"""
+        due_ids = await self.index.due(now, limit=self.batch_size)
+        if due_ids is None:
+            return await uow.campaigns.get_scheduled_campaigns(before=now)
+        
+        campaigns = await uow.campaigns.get_many(due_ids)
+        
+        # Drop stale index entries (cancelled/activated elsewhere)
+        due = []
+        for campaign in campaigns:
+            if campaign.status == CampaignStatus.SCHEDULED:
+                due.append(campaign)
+            else:
+                await self.index.remove(campaign.id)
+        for missing_id in set(due_ids) - {c.id for c in campaigns}:
+            await self.index.remove(missing_id)
+        
+        return due
+    
     async def _poll_and_activate(self):
         """Poll for scheduled campaigns and activate them"""
         # Get database connection
@@ -103,10 +351,8 @@ class ScheduledCampaignPoller:
             uow = SQLAlchemyUnitOfWork(session)
             
             # Get scheduled campaigns that are due
-            now = datetime.utcnow()
-            scheduled_campaigns = await uow.campaigns.get_scheduled_campaigns(
-                before=now
-            )
+            now = datetime.now(timezone.utc)
+            scheduled_campaigns = await self._get_due_campaigns(uow, now)
             
             if not scheduled_campaigns:
                 logger.debug(
@@ -144,7 +390,7 @@ class ScheduledCampaignPoller:
             await queue.connect()
             
             # Create service and activate
-            service = CampaignService(uow, queue)
+            service = CampaignService(uow, queue, scheduled_index=self.index)
             activated = await service.activate_campaign(campaign.id)
             
             logger.info(
@@ -7,6 +7,7 @@ Supports automatic migration generation from models.
 
 from logging.config import fileConfig
 import asyncio
+import logging
 
 from sqlalchemy import pool
 from sqlalchemy.engine import Connection
@@ -40,6 +41,8 @@ config.set_main_option("sqlalchemy.url", settings.database.url)
 # Target metadata for autogenerate
 target_metadata = Base.metadata
 
+logger = logging.getLogger("alembic.env")
+
 
 def run_migrations_offline() -> None:
     """
@@ -75,8 +78,11 @@ async def run_async_migrations() -> None:
     # Force the URL into the config object to be sure
     section = config.get_section(config.config_ini_section, {})
     section["sqlalchemy.url"] = settings.database.url
-    print(f"DEBUG: Migrating with URL: {settings.database.url.replace(settings.database.password, '***')}")
-    
+    logger.debug(
+        "Migrating with URL: %s",
+        settings.database.url.replace(settings.database.password, "***"),
+    )
+
     connectable = async_engine_from_config(
         section,
         prefix="sqlalchemy.",
@@ -90,19 +96,11 @@ async def run_async_migrations() -> None:
 
 
 def run_migrations_online() -> None:
-    """Run migrations in 'online' mode"""
-    # Try sync instead of async for a moment to see if it helps
-    sync_url = settings.database.url.replace("asyncpg", "psycopg2")
-    print(f"DEBUG: Sync URL: {sync_url.replace(settings.database.password, '***')}")
-    
-    from sqlalchemy import create_engine
-    connectable = create_engine(sync_url, poolclass=pool.NullPool)
-
-    with connectable.connect() as connection:
-        do_run_migrations(connection)
+    """Run migrations in 'online' mode (asyncpg engine, no sync driver)"""
+    asyncio.run(run_async_migrations())
 
 
 if context.is_offline_mode():
     run_migrations_offline()
 else:
-    asyncio.run(run_async_migrations())
+    run_migrations_online()
@@ -0,0 +1,135 @@
+"""Hash-partition messages by campaign_id
+
+Rebuilds the messages table as a declaratively partitioned table:
+
+    messages  PARTITION BY HASH (campaign_id)
+      messages_p0  .. messages_p31   (MODULUS 32)
+
+Every campaign lives in exactly one partition, so the hot campaign queries
+(get_by_campaign, get_failed_messages, get_delivery_stats, recalculate_stats)
+are pruned to a single partition by the planner — 32x less index to walk,
+and autovacuum works on small per-partition heaps instead of one huge table.
+
+Nothing in the Python API changes: inserts target the parent table and
+PostgreSQL routes each row to its partition.
+
+Constraints that change:
+  - PRIMARY KEY (id)  ->  PRIMARY KEY (id, campaign_id)
+    (a unique constraint on a partitioned table must include the partition key)
+  - fk_messages_parent_message_id is dropped for the same reason — a FK can
+    only reference a unique constraint, and (id) alone is no longer one.
+    parent_message_id stays indexed; linkage is maintained by the application
+    (Message.create_fallback_message).
+
+Revision ID: 008_partition_messages
+Revises: 007_parent_message_id
+Create Date: 2026-03-05
+"""
+
+from alembic import op
+
+
+revision = '008_partition_messages'
+down_revision = '007_parent_message_id'
+branch_labels = None
+depends_on = None
+
+
+# Number of hash partitions. Changing this requires a full table rebuild.
+PARTITIONS = 32
+
+# (name, columns) — recreated on the new parent table; PostgreSQL propagates
+# each one to every partition automatically.
+_INDEXES = [
+    ("ix_messages_campaign_id", "campaign_id"),
+    ("ix_messages_tenant_id", "tenant_id"),
+    ("ix_messages_status", "status"),
+    ("ix_messages_external_id", "external_id"),
+    ("ix_messages_parent_message_id", "parent_message_id"),
+    ("ix_messages_status_created", "status, created_at"),
+    ("ix_messages_tenant_status", "tenant_id, status"),
+    ("ix_messages_campaign_status_parent", "campaign_id, status, parent_message_id"),
+]
+
+
+def _create_indexes() -> None:
+    for name, columns in _INDEXES:
+        op.execute(f"CREATE INDEX {name} ON messages ({columns})")
+
+
+def upgrade() -> None:
+    # 1. New partitioned parent with the same columns/defaults
+    op.execute(
+        """
+        CREATE TABLE messages_partitioned (
+            LIKE messages INCLUDING DEFAULTS,
+            PRIMARY KEY (id, campaign_id)
+        ) PARTITION BY HASH (campaign_id)
+        """
+    )
+
+    # 2. One child table per hash bucket
+    for remainder in range(PARTITIONS):
+        op.execute(
+            f"CREATE TABLE messages_p{remainder} PARTITION OF messages_partitioned "
+            f"FOR VALUES WITH (MODULUS {PARTITIONS}, REMAINDER {remainder})"
+        )
+
+    # 3. Copy existing rows — PostgreSQL routes each row to its partition
+    op.execute("INSERT INTO messages_partitioned SELECT * FROM messages")
+
+    # 4. Swap tables (drops the old self-referencing FK and indexes with it)
+    op.execute("DROP TABLE messages")
+    op.execute("ALTER TABLE messages_partitioned RENAME TO messages")
+    op.execute(
+        "ALTER TABLE messages RENAME CONSTRAINT messages_partitioned_pkey TO messages_pkey"
+    )
+
+    # 5. Restore the campaign FK and indexes on the new parent
+    op.create_foreign_key(
+        'messages_campaign_id_fkey',
+        'messages',
+        'campaigns',
+        ['campaign_id'],
+        ['id'],
+        ondelete='CASCADE',
+    )
+    _create_indexes()
+
+
+def downgrade() -> None:
+    # Rebuild as a plain heap table with PRIMARY KEY (id)
+    op.execute(
+        """
+        CREATE TABLE messages_plain (
+            LIKE messages INCLUDING DEFAULTS,
+            PRIMARY KEY (id)
+        )
+        """
+    )
+    op.execute("INSERT INTO messages_plain SELECT * FROM messages")
+
+    # Dropping the parent drops every messages_pN partition as well
+    op.execute("DROP TABLE messages")
+    op.execute("ALTER TABLE messages_plain RENAME TO messages")
+    op.execute(
+        "ALTER TABLE messages RENAME CONSTRAINT messages_plain_pkey TO messages_pkey"
+    )
+
+    op.create_foreign_key(
+        'messages_campaign_id_fkey',
+        'messages',
+        'campaigns',
+        ['campaign_id'],
+        ['id'],
+        ondelete='CASCADE',
+    )
+    op.create_foreign_key(
+        'fk_messages_parent_message_id',
+        'messages',
+        'messages',
+        ['parent_message_id'],
+        ['id'],
+        ondelete='SET NULL',
+    )
+    _create_indexes()
@@ -0,0 +1,35 @@
+"""Add cached RCS capability columns to messages
+
+Revision ID: 009_message_rcs_capability
+Revises: 008_partition_messages
+Create Date: 2026-03-06
+
+Stores the result of the last RCS capability check on the message itself
+(rcs_capable, rcs_checked_at). Retries of the same message reuse it while
+it is fresh instead of calling the aggregator's capability API again.
+Both columns are nullable, so the ALTER is metadata-only on every partition.
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = '009_message_rcs_capability'
+down_revision = '008_partition_messages'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        'messages',
+        sa.Column('rcs_capable', sa.Boolean(), nullable=True)
+    )
+    op.add_column(
+        'messages',
+        sa.Column('rcs_checked_at', sa.DateTime(timezone=True), nullable=True)
+    )
+
+
+def downgrade() -> None:
+    op.drop_column('messages', 'rcs_checked_at')
+    op.drop_column('messages', 'rcs_capable')
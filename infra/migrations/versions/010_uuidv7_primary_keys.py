@@ -0,0 +1,74 @@
+"""Generate time-ordered (UUIDv7) primary keys
+
+Random UUIDv4 keys scatter inserts across the whole primary-key B-tree:
+every insert dirties a random leaf page, pages split half-full, and each
+touched page costs a full-page image in the WAL after a checkpoint.
+UUIDv7 keys start with a millisecond timestamp, so new rows append to
+the rightmost leaf (per partition for messages).
+
+Adds uuid_generate_v7() (pure SQL on top of gen_random_uuid(), no
+extension needed) and makes it the server default of every UUID primary
+key. The application generates the same format in Python
+(apps.core.domain.ids.uuid7); the default covers server-side inserts such
+as the orchestrator's INSERT ... SELECT. Existing ids are untouched and
+the column type stays UUID.
+
+Revision ID: 010_uuidv7_primary_keys
+Revises: 009_message_rcs_capability
+Create Date: 2026-03-09
+"""
+
+from alembic import op
+
+
+revision = '010_uuidv7_primary_keys'
+down_revision = '009_message_rcs_capability'
+branch_labels = None
+depends_on = None
+
+
+TABLES = (
+    'campaigns',
+    'messages',
+    'templates',
+    'opt_ins',
+    'events',
+    'audiences',
+    'audience_contacts',
+)
+
+
+def upgrade() -> None:
+    # Overlay the 48-bit Unix ms timestamp onto a random v4 UUID, then
+    # flip the version nibble from 0100 to 0111 (bits 52 and 53)
+    op.execute("""
+        CREATE OR REPLACE FUNCTION uuid_generate_v7() RETURNS uuid AS $$
+            SELECT encode(
+                set_bit(
+                    set_bit(
+                        overlay(
+                            uuid_send(gen_random_uuid())
+                            PLACING substring(
+                                int8send(floor(extract(epoch FROM clock_timestamp()) * 1000)::bigint)
+                                FROM 3
+                            )
+                            FROM 1 FOR 6
+                        ),
+                        52, 1
+                    ),
+                    53, 1
+                ),
+                'hex'
+            )::uuid
+        $$ LANGUAGE sql VOLATILE
+    """)
+
+    # On the partitioned messages table the default recurses to partitions
+    for table in TABLES:
+        op.execute(f"ALTER TABLE {table} ALTER COLUMN id SET DEFAULT uuid_generate_v7()")
+
+
+def downgrade() -> None:
+    for table in TABLES:
+        op.execute(f"ALTER TABLE {table} ALTER COLUMN id DROP DEFAULT")
+    op.execute("DROP FUNCTION IF EXISTS uuid_generate_v7()")
@@ -0,0 +1,59 @@
+"""Index tenant listings by (tenant_id, created_at DESC)
+
+The tenant list endpoints (campaigns, templates, audiences) run
+WHERE tenant_id = :t ORDER BY created_at DESC LIMIT n. With only a
+tenant_id index Postgres fetches every row of the tenant and sorts them
+before applying the limit; a (tenant_id, created_at DESC) index returns
+the first page straight from the index.
+
+The single-column tenant_id indexes are dropped: each is a prefix of a
+composite index on the same table (tenant_status, tenant_created or the
+unique tenant_phone) and only added write amplification.
+
+Indexes are built/dropped CONCURRENTLY so live traffic is not blocked.
+
+Revision ID: 011_tenant_created_indexes
+Revises: 010_uuidv7_primary_keys
+Create Date: 2026-03-10
+"""
+
+from apps.adapters.db.migration_ops import (
+    create_index_concurrently,
+    drop_index_concurrently,
+)
+
+
+revision = '011_tenant_created_indexes'
+down_revision = '010_uuidv7_primary_keys'
+branch_labels = None
+depends_on = None
+
+
+TENANT_CREATED = (
+    ('ix_campaigns_tenant_created', 'campaigns'),
+    ('ix_templates_tenant_created', 'templates'),
+    ('ix_audiences_tenant_created', 'audiences'),
+)
+
+REDUNDANT_TENANT_ID = (
+    ('ix_campaigns_tenant_id', 'campaigns'),
+    ('ix_messages_tenant_id', 'messages'),
+    ('ix_templates_tenant_id', 'templates'),
+    ('ix_opt_ins_tenant_id', 'opt_ins'),
+)
+
+
+def upgrade() -> None:
+    for name, table in TENANT_CREATED:
+        create_index_concurrently(name, table, 'tenant_id, created_at DESC')
+
+    for name, table in REDUNDANT_TENANT_ID:
+        drop_index_concurrently(name, table)
+
+
+def downgrade() -> None:
+    for name, table in REDUNDANT_TENANT_ID:
+        create_index_concurrently(name, table, 'tenant_id')
+
+    for name, table in TENANT_CREATED:
+        drop_index_concurrently(name, table)
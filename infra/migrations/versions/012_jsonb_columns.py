@@ -0,0 +1,78 @@
+"""Convert JSON columns to JSONB
+
+001 created every document column as json, which stores the raw text and
+is re-parsed on each access; later tables (audiences, audience_contacts)
+already use jsonb. jsonb stores a decomposed binary form, so reads skip
+the parse and containment (@>) becomes indexable.
+
+Adds a GIN (jsonb_path_ops) index on campaigns.tags for the tag filter in
+CampaignRepository.search(). No index on messages.metadata_: nothing
+filters on it, and a GIN index on the hottest insert path would only add
+write cost.
+
+ALTER COLUMN ... TYPE rewrites each table under an ACCESS EXCLUSIVE lock
+(messages: every partition) — run during a maintenance window.
+
+Revision ID: 012_jsonb_columns
+Revises: 011_tenant_created_indexes
+Create Date: 2026-03-11
+"""
+
+from alembic import op
+
+from apps.adapters.db.migration_ops import (
+    create_index_concurrently,
+    drop_index_concurrently,
+)
+
+
+revision = '012_jsonb_columns'
+down_revision = '011_tenant_created_indexes'
+branch_labels = None
+depends_on = None
+
+
+# (table, column, server default)
+COLUMNS = (
+    ('campaigns', 'metadata_', "'{}'"),
+    ('campaigns', 'tags', "'[]'"),
+    ('messages', 'content', None),
+    ('messages', 'metadata_', "'{}'"),
+    ('templates', 'variables', "'[]'"),
+    ('templates', 'rich_card_template', None),
+    ('templates', 'suggestions_template', "'[]'"),
+    ('templates', 'tags', "'[]'"),
+    ('opt_ins', 'consent_history', "'[]'"),
+    ('opt_ins', 'preferences', "'{}'"),
+    ('opt_ins', 'metadata_', "'{}'"),
+    ('events', 'data', None),
+    ('events', 'metadata_', "'{}'"),
+)
+
+
+def _convert(target: str) -> None:
+    for table, column, default in COLUMNS:
+        # The json default has no implicit cast to jsonb (and vice versa)
+        if default:
+            op.execute(f"ALTER TABLE {table} ALTER COLUMN {column} DROP DEFAULT")
+        op.execute(
+            f"ALTER TABLE {table} ALTER COLUMN {column} "
+            f"TYPE {target} USING {column}::{target}"
+        )
+        if default:
+            op.execute(
+                f"ALTER TABLE {table} ALTER COLUMN {column} "
+                f"SET DEFAULT {default}::{target}"
+            )
+
+
+def upgrade() -> None:
+    _convert('jsonb')
+    create_index_concurrently(
+        'ix_campaigns_tags_gin', 'campaigns', 'tags jsonb_path_ops', using='gin'
+    )
+
+
+def downgrade() -> None:
+    drop_index_concurrently('ix_campaigns_tags_gin', 'campaigns')
+    _convert('json')
@@ -0,0 +1,141 @@
+"""Range-partition events by created_at (monthly)
+
+The event store is append-only and grows without bound. Rebuilds it as
+
+    events  PARTITION BY RANGE (created_at)
+      events_YYYY_MM   one partition per month
+      events_default   catch-all, should stay empty
+
+so inserts only touch the current month's (small) indexes, queries with a
+created_at range prune to the months they cover, and old months can be
+detached and archived with ALTER TABLE events DETACH PARTITION.
+
+Partitions are created ahead of time by the SQL function
+ensure_events_partitions(months_ahead), which the scheduler worker calls
+daily. The default partition only catches rows if that job stops running;
+a month that already has rows in the default cannot be created until they
+are moved out.
+
+Constraint that changes:
+  - PRIMARY KEY (id)  ->  PRIMARY KEY (id, created_at)
+    (a unique constraint on a partitioned table must include the partition key)
+
+messages stays hash-partitioned by campaign_id (008): every hot message
+query is campaign-scoped, and monthly ranges would spread one campaign
+over several partitions instead of pruning to one.
+
+Revision ID: 013_partition_events_by_month
+Revises: 012_jsonb_columns
+Create Date: 2026-03-12
+"""
+
+from alembic import op
+
+
+revision = '013_partition_events_by_month'
+down_revision = '012_jsonb_columns'
+branch_labels = None
+depends_on = None
+
+
+# Months created beyond the current one on each ensure_events_partitions() call
+MONTHS_AHEAD = 2
+
+_INDEXES = [
+    ("ix_events_event_type", "event_type"),
+    ("ix_events_aggregate_id", "aggregate_id"),
+    ("ix_events_aggregate", "aggregate_id, version"),
+    ("ix_events_type_created", "event_type, created_at"),
+]
+
+_ENSURE_PARTITIONS = """
+CREATE OR REPLACE FUNCTION ensure_events_partitions(
+    months_ahead integer DEFAULT 2,
+    from_month date DEFAULT NULL
+) RETURNS integer
+LANGUAGE plpgsql AS $$
+DECLARE
+    month date := date_trunc('month', coalesce(from_month, now()))::date;
+    last_month date := (date_trunc('month', now())
+                        + make_interval(months => months_ahead))::date;
+    part_name text;
+    created integer := 0;
+BEGIN
+    WHILE month <= last_month LOOP
+        part_name := 'events_' || to_char(month, 'YYYY_MM');
+        IF to_regclass(part_name) IS NULL THEN
+            EXECUTE format(
+                'CREATE TABLE %I PARTITION OF events FOR VALUES FROM (%L) TO (%L)',
+                part_name, month, (month + interval '1 month')::date
+            );
+            created := created + 1;
+        END IF;
+        month := (month + interval '1 month')::date;
+    END LOOP;
+    RETURN created;
+END
+$$
+"""
+
+
+def _create_indexes() -> None:
+    for name, columns in _INDEXES:
+        op.execute(f"CREATE INDEX {name} ON events ({columns})")
+
+
+def upgrade() -> None:
+    # 1. Move the old table aside (its pkey name is reused below)
+    op.execute("ALTER TABLE events RENAME TO events_old")
+    op.execute("ALTER TABLE events_old RENAME CONSTRAINT events_pkey TO events_old_pkey")
+
+    # 2. New partitioned parent with the same columns/defaults
+    op.execute(
+        """
+        CREATE TABLE events (
+            LIKE events_old INCLUDING DEFAULTS,
+            PRIMARY KEY (id, created_at)
+        ) PARTITION BY RANGE (created_at)
+        """
+    )
+
+    # 3. Monthly partitions from the oldest event up to MONTHS_AHEAD, then
+    #    the default (must come last: a new partition cannot take rows
+    #    already sitting in the default)
+    op.execute(_ENSURE_PARTITIONS)
+    op.execute(
+        f"SELECT ensure_events_partitions({MONTHS_AHEAD}, "
+        f"(SELECT min(created_at) FROM events_old)::date)"
+    )
+    op.execute("CREATE TABLE events_default PARTITION OF events DEFAULT")
+
+    # 4. Copy rows — PostgreSQL routes each one to its month
+    op.execute("INSERT INTO events SELECT * FROM events_old")
+    op.execute("DROP TABLE events_old")
+
+    _create_indexes()
+
+
+def downgrade() -> None:
+    op.execute("ALTER TABLE events RENAME TO events_partitioned")
+    op.execute(
+        "ALTER TABLE events_partitioned RENAME CONSTRAINT events_pkey "
+        "TO events_partitioned_pkey"
+    )
+    for name, _ in _INDEXES:
+        op.execute(f"DROP INDEX {name}")
+
+    op.execute(
+        """
+        CREATE TABLE events (
+            LIKE events_partitioned INCLUDING DEFAULTS,
+            PRIMARY KEY (id)
+        )
+        """
+    )
+    op.execute("INSERT INTO events SELECT * FROM events_partitioned")
+
+    # Dropping the parent drops every monthly partition as well
+    op.execute("DROP TABLE events_partitioned")
+    op.execute("DROP FUNCTION ensure_events_partitions(integer, date)")
+
+    _create_indexes()
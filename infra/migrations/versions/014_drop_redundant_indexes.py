@@ -0,0 +1,50 @@
+"""Drop indexes covered by a composite with the same leading column(s)
+
+Each index is one more B-tree to update (and WAL to write) on every
+insert; these answer no query their covering index cannot:
+
+    ix_messages_campaign_id       -> ix_messages_campaign_status_parent
+    ix_messages_status            -> ix_messages_status_created
+    ix_events_event_type          -> ix_events_type_created
+    ix_events_aggregate_id        -> ix_events_aggregate
+    ix_campaigns_scheduled_for    -> ix_campaigns_scheduled (same column)
+    ix_audience_contacts_audience_id -> ix_audience_contacts_audience_id_id
+
+The tenant_id indexes were already dropped in 011.
+
+Revision ID: 014_drop_redundant_indexes
+Revises: 013_partition_events_by_month
+Create Date: 2026-03-13
+"""
+
+from apps.adapters.db.migration_ops import (
+    create_index_concurrently,
+    drop_index_concurrently,
+)
+
+
+revision = '014_drop_redundant_indexes'
+down_revision = '013_partition_events_by_month'
+branch_labels = None
+depends_on = None
+
+
+# (name, table, columns)
+REDUNDANT = (
+    ('ix_messages_campaign_id', 'messages', 'campaign_id'),
+    ('ix_messages_status', 'messages', 'status'),
+    ('ix_events_event_type', 'events', 'event_type'),
+    ('ix_events_aggregate_id', 'events', 'aggregate_id'),
+    ('ix_campaigns_scheduled_for', 'campaigns', 'scheduled_for'),
+    ('ix_audience_contacts_audience_id', 'audience_contacts', 'audience_id'),
+)
+
+
+def upgrade() -> None:
+    for name, table, _ in REDUNDANT:
+        drop_index_concurrently(name, table)
+
+
+def downgrade() -> None:
+    for name, table, columns in REDUNDANT:
+        create_index_concurrently(name, table, columns)
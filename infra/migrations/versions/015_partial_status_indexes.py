@@ -0,0 +1,65 @@
+"""Partial indexes for the status-filtered lookups
+
+Full status indexes carry every row, yet the lookups that filter on
+status only ever want a small slice of the table. Partial indexes hold
+just that working set, so they stay small and cached:
+
+    ix_messages_failed          (campaign_id, failed_at DESC) WHERE FAILED
+                                -> MessageRepository.get_failed_messages
+    ix_campaigns_scheduled_due  (scheduled_for) WHERE SCHEDULED
+                                -> CampaignRepository.get_scheduled_campaigns
+    ix_campaigns_active         (tenant_id) WHERE ACTIVE
+                                -> CampaignRepository.get_active_campaigns
+
+and replace these full indexes, which nothing else needs:
+
+    ix_messages_status_created, ix_campaigns_scheduled, ix_campaigns_status
+
+Status columns store the enum member name (e.g. 'FAILED').
+
+Revision ID: 015_partial_status_indexes
+Revises: 014_drop_redundant_indexes
+Create Date: 2026-03-14
+"""
+
+from apps.adapters.db.migration_ops import (
+    create_index_concurrently,
+    drop_index_concurrently,
+)
+
+
+revision = '015_partial_status_indexes'
+down_revision = '014_drop_redundant_indexes'
+branch_labels = None
+depends_on = None
+
+
+# (name, table, columns, predicate)
+PARTIAL = (
+    ('ix_messages_failed', 'messages', 'campaign_id, failed_at DESC', "status = 'FAILED'"),
+    ('ix_campaigns_scheduled_due', 'campaigns', 'scheduled_for', "status = 'SCHEDULED'"),
+    ('ix_campaigns_active', 'campaigns', 'tenant_id', "status = 'ACTIVE'"),
+)
+
+# (name, table, columns)
+REPLACED = (
+    ('ix_messages_status_created', 'messages', 'status, created_at'),
+    ('ix_campaigns_scheduled', 'campaigns', 'scheduled_for'),
+    ('ix_campaigns_status', 'campaigns', 'status'),
+)
+
+
+def upgrade() -> None:
+    for name, table, columns, predicate in PARTIAL:
+        create_index_concurrently(name, table, columns, where=predicate)
+
+    for name, table, _ in REPLACED:
+        drop_index_concurrently(name, table)
+
+
+def downgrade() -> None:
+    for name, table, columns in REPLACED:
+        create_index_concurrently(name, table, columns)
+
+    for name, table, _, _ in PARTIAL:
+        drop_index_concurrently(name, table)
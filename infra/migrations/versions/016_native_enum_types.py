@@ -0,0 +1,105 @@
+"""Store enum columns as native PostgreSQL ENUM types
+
+The status/type columns mapped to Python enums were VARCHAR(20-50): each
+row stores the label text plus a length header. A PostgreSQL ENUM is a
+fixed 4 bytes and rejects values outside the set, which the VARCHAR
+columns never did.
+
+Columns store the enum member names (e.g. 'PENDING'); upper() in the
+conversion also folds any row that was written with the lowercase value.
+
+The partial indexes from 015 compare status with a text literal, so they
+are dropped before the conversion and rebuilt against the enum column.
+
+Adding a label later is a cheap ALTER TYPE ... ADD VALUE; removing one
+needs a new type and a column rewrite.
+
+ALTER COLUMN ... TYPE rewrites each table under an ACCESS EXCLUSIVE lock
+(messages: every partition) — run during a maintenance window.
+
+Revision ID: 016_native_enum_types
+Revises: 015_partial_status_indexes
+Create Date: 2026-03-15
+"""
+
+from alembic import op
+
+
+revision = '016_native_enum_types'
+down_revision = '015_partial_status_indexes'
+branch_labels = None
+depends_on = None
+
+
+TYPES = {
+    'campaign_status': (
+        'DRAFT', 'SCHEDULED', 'ACTIVE', 'PAUSED', 'COMPLETED', 'CANCELLED', 'FAILED',
+    ),
+    'campaign_type': ('PROMOTIONAL', 'TRANSACTIONAL', 'REMINDER', 'NOTIFICATION'),
+    'priority_level': ('LOW', 'MEDIUM', 'HIGH', 'URGENT'),
+    'message_status': (
+        'PENDING', 'QUEUED', 'SENT', 'DELIVERED', 'READ', 'FAILED', 'EXPIRED',
+    ),
+    'message_channel': ('RCS', 'SMS', 'WHATSAPP'),
+    'consent_status': ('OPTED_IN', 'OPTED_OUT', 'PENDING', 'EXPIRED'),
+}
+
+# (table, column, enum type, previous VARCHAR length)
+COLUMNS = (
+    ('campaigns', 'status', 'campaign_status', 50),
+    ('campaigns', 'campaign_type', 'campaign_type', 50),
+    ('campaigns', 'priority', 'priority_level', 20),
+    ('messages', 'status', 'message_status', 50),
+    ('messages', 'channel', 'message_channel', 20),
+    ('opt_ins', 'promotional_status', 'consent_status', 50),
+    ('opt_ins', 'transactional_status', 'consent_status', 50),
+    ('opt_ins', 'informational_status', 'consent_status', 50),
+)
+
+# Partial indexes from 015 whose predicate references status
+_PARTIAL_INDEXES = (
+    ('ix_messages_failed', 'messages', 'campaign_id, failed_at DESC', "status = 'FAILED'"),
+    ('ix_campaigns_scheduled_due', 'campaigns', 'scheduled_for', "status = 'SCHEDULED'"),
+    ('ix_campaigns_active', 'campaigns', 'tenant_id', "status = 'ACTIVE'"),
+)
+
+
+def _drop_partial_indexes() -> None:
+    for name, _, _, _ in _PARTIAL_INDEXES:
+        op.execute(f"DROP INDEX IF EXISTS {name}")
+
+
+def _create_partial_indexes() -> None:
+    for name, table, columns, predicate in _PARTIAL_INDEXES:
+        op.execute(f"CREATE INDEX {name} ON {table} ({columns}) WHERE {predicate}")
+
+
+def upgrade() -> None:
+    _drop_partial_indexes()
+
+    for name, labels in TYPES.items():
+        values = ", ".join(f"'{label}'" for label in labels)
+        op.execute(f"CREATE TYPE {name} AS ENUM ({values})")
+
+    for table, column, enum_type, _ in COLUMNS:
+        op.execute(
+            f"ALTER TABLE {table} ALTER COLUMN {column} "
+            f"TYPE {enum_type} USING upper({column})::{enum_type}"
+        )
+
+    _create_partial_indexes()
+
+
+def downgrade() -> None:
+    _drop_partial_indexes()
+
+    for table, column, _, length in COLUMNS:
+        op.execute(
+            f"ALTER TABLE {table} ALTER COLUMN {column} "
+            f"TYPE varchar({length}) USING {column}::text"
+        )
+
+    for name in TYPES:
+        op.execute(f"DROP TYPE {name}")
+
+    _create_partial_indexes()
@@ -0,0 +1,41 @@
+"""BRIN index on events.created_at
+
+events is append-only, so within each monthly partition the heap is
+physically ordered by created_at. A BRIN index stores only the min/max
+created_at per block range — kilobytes where a B-tree would be gigabytes —
+and turns time-range sweeps across all event types (audits, retention and
+archival jobs) into reads of just the matching blocks.
+
+ix_events_type_created stays: EventRepository.get_events_by_type always
+filters by type and is served by it.
+New monthly partitions inherit the index from the partitioned parent.
+
+Revision ID: 017_events_created_brin
+Revises: 016_native_enum_types
+Create Date: 2026-03-16
+"""
+
+from apps.adapters.db.migration_ops import (
+    create_index_concurrently,
+    drop_index_concurrently,
+)
+
+
+revision = '017_events_created_brin'
+down_revision = '016_native_enum_types'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    create_index_concurrently(
+        'ix_events_created_brin',
+        'events',
+        'created_at',
+        using='brin',
+        with_='pages_per_range = 32',
+    )
+
+
+def downgrade() -> None:
+    drop_index_concurrently('ix_events_created_brin', 'events')
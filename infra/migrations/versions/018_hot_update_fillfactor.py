@@ -0,0 +1,57 @@
+"""Lower FILLFACTOR on update-heavy tables for HOT updates
+
+With the default fillfactor of 100, pages are packed full, so an UPDATE
+has no room to put the new row version on the same page. It becomes a
+non-HOT update: a new index entry in every index and more pages dirtied.
+Keeping 20% of each page free lets PostgreSQL write the new version
+in-page (a HOT update) whenever no indexed column changed:
+
+    campaigns   messages_sent / delivered / failed / read counters,
+                bumped on every flush of the stats coalescer
+    opt_ins     consent status, timestamps and consent_history
+    messages    sent_at / delivered_at / read_at and external_id
+                write-backs; updates that change status still touch
+                status-keyed indexes and stay non-HOT
+
+messages is partitioned and a partitioned parent has no storage of its
+own, so the setting is applied to each of its 32 hash partitions.
+
+Only pages written from now on honour the new fillfactor; existing pages
+are left as they are until rewritten (VACUUM FULL / pg_repack). Check the
+effect with n_tup_hot_upd / n_tup_upd in pg_stat_user_tables.
+
+Revision ID: 018_hot_update_fillfactor
+Revises: 017_events_created_brin
+Create Date: 2026-03-17
+"""
+
+from alembic import op
+
+
+revision = '018_hot_update_fillfactor'
+down_revision = '017_events_created_brin'
+branch_labels = None
+depends_on = None
+
+
+FILLFACTOR = 80
+
+# Hash partitions of messages (migration 008)
+MESSAGE_PARTITIONS = 32
+
+
+def _tables():
+    yield 'campaigns'
+    yield 'opt_ins'
+    for remainder in range(MESSAGE_PARTITIONS):
+        yield f'messages_p{remainder}'
+
+
+def upgrade() -> None:
+    for table in _tables():
+        op.execute(f"ALTER TABLE {table} SET (fillfactor = {FILLFACTOR})")
+
+
+def downgrade() -> None:
+    for table in _tables():
+        op.execute(f"ALTER TABLE {table} RESET (fillfactor)")